@@ -48,6 +48,12 @@ class BatchWriter:
         self.flush_task: asyncio.Task[None] | None = None
         self.is_running = False
 
+        # Set once a batch has been flushed (written or dropped on error),
+        # cleared when a new batch starts
+        self.flush_signal = asyncio.Event()
+        # Error from the last flush, re-raised by wait_flushed()
+        self.flush_error: Exception | None = None
+
         # Statistics
         self.total_routes_written = 0
         self.total_batches_written = 0
@@ -123,6 +129,8 @@ class BatchWriter:
         # Set batch start time on first route
         if self.batch_start_time is None:
             self.batch_start_time = asyncio.get_event_loop().time()
+            self.flush_signal.clear()
+            self.flush_error = None
 
         # Flush if batch is full
         if len(self.batch) >= self.batch_size:
@@ -162,6 +170,7 @@ class BatchWriter:
                 )
 
         except Exception as e:
+            self.flush_error = e
             logger.error(
                 "batch_flush_failed",
                 error=str(e),
@@ -170,9 +179,28 @@ class BatchWriter:
             raise
 
         finally:
-            # Clear batch
+            # Clear batch and wake waiters even if the write failed
             self.batch = []
             self.batch_start_time = None
+            self.flush_signal.set()
+
+    async def wait_flushed(self, timeout: float | None = None) -> None:
+        """
+        Wait until the pending batch, including route state updates, is written.
+
+        Returns immediately if nothing is pending and the last flush succeeded.
+
+        Args:
+            timeout: Max time in seconds to wait (default: wait forever)
+
+        Raises:
+            TimeoutError: If the batch is not flushed within timeout
+            Exception: The error that made the last flush fail
+        """
+        if self.batch:
+            await asyncio.wait_for(self.flush_signal.wait(), timeout)
+        if self.flush_error is not None:
+            raise self.flush_error
 
     async def _flush_batch(
         self,
@@ -62,6 +62,7 @@ class DatabasePool:
         max_size: int = 10,
         command_timeout: float = 30.0,
         timeout: float = 5.0,
+        server_settings: dict[str, str] | None = None,
     ) -> None:
         """
         Create and initialize the connection pool.
@@ -76,6 +77,8 @@ class DatabasePool:
             max_size: Maximum number of connections in pool (default: 10)
             command_timeout: Command execution timeout in seconds (default: 30)
             timeout: Connection timeout in seconds (default: 5)
+            server_settings: Session parameters sent on every new connection
+                (e.g. {"synchronous_commit": "off"})
 
         Raises:
             asyncpg.PostgresError: If connection fails
@@ -100,6 +103,7 @@ class DatabasePool:
                 max_size=max_size,
                 command_timeout=command_timeout,
                 timeout=timeout,
+                server_settings=server_settings,
                 init=_init_connection,
             )
 
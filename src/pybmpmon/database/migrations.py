@@ -3,6 +3,7 @@
 import hashlib
 import time
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 import asyncpg  # type: ignore[import-untyped]
@@ -20,15 +21,26 @@ class Migration:
     name: str
     file_path: Path
 
-    @property
+    @cached_property
+    def _content(self) -> bytes:
+        """
+        Read migration file contents.
+
+        Read once and cached, so the SQL that is applied is exactly what
+        the checksum was computed over. Create a new Migration to pick up
+        changes to the file.
+        """
+        return self.file_path.read_bytes()
+
+    @cached_property
     def checksum(self) -> str:
         """Calculate SHA256 checksum of migration file."""
-        return hashlib.sha256(self.file_path.read_bytes()).hexdigest()
+        return hashlib.sha256(self._content).hexdigest()
 
-    @property
+    @cached_property
     def sql(self) -> str:
         """Read migration SQL content."""
-        return self.file_path.read_text()
+        return self._content.decode("utf-8")
 
 
 class MigrationRunner:
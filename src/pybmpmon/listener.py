@@ -352,89 +352,94 @@ class BMPListener:
             next_hop=str(bgp_update.next_hop) if bgp_update.next_hop else None,
         )
 
-        # Process announced prefixes
-        for prefix in bgp_update.prefixes:
-            # Extract prefix string (handles both CIDR and EVPN dicts)
-            prefix_str = self._extract_prefix_string(prefix)
-
-            # Extract EVPN-specific fields from route dict if applicable
-            evpn_route_type = bgp_update.evpn_route_type
-            evpn_rd = bgp_update.evpn_rd
-            evpn_esi = bgp_update.evpn_esi
-            mac_address = bgp_update.mac_address
-
-            # If prefix is an EVPN dict, extract per-route fields
-            if isinstance(prefix, dict):
-                evpn_route_type = prefix.get("route_type", evpn_route_type)
-                evpn_rd = prefix.get("rd", evpn_rd)
-                evpn_esi = prefix.get("esi", evpn_esi)
-                mac_address = prefix.get("mac_address", mac_address)
-
-            route = RouteUpdate(
-                time=datetime.now(UTC),
-                bmp_peer_ip=bmp_peer_ip,  # type: ignore[arg-type]
-                bmp_peer_asn=None,  # Will be populated from peer_header if needed
-                bgp_peer_ip=parsed.per_peer_header.peer_address,  # type: ignore[arg-type]
-                bgp_peer_asn=parsed.per_peer_header.peer_asn,
-                family=family,
-                prefix=prefix_str,
-                next_hop=bgp_update.next_hop,  # type: ignore[arg-type]
-                as_path=bgp_update.as_path,
-                communities=bgp_update.communities,
-                extended_communities=bgp_update.extended_communities,
-                med=bgp_update.med,
-                local_pref=bgp_update.local_pref,
-                is_withdrawn=False,
-                evpn_route_type=evpn_route_type,
-                evpn_rd=evpn_rd,
-                evpn_esi=evpn_esi,
-                mac_address=mac_address,
-            )
-            await self.batch_writer.add_route(route)
-            # Track processed route in stats
-            self.stats_collector.increment_processed(bmp_peer_ip, family)
-
-        # Process withdrawn prefixes
-        for prefix in bgp_update.withdrawn_prefixes:
-            # Extract prefix string (handles both CIDR and EVPN dicts)
-            prefix_str = self._extract_prefix_string(prefix)
-
-            # Extract EVPN-specific fields from route dict if applicable
-            evpn_route_type = None
-            evpn_rd = None
-            evpn_esi = None
-            mac_address = None
-
-            # If prefix is an EVPN dict, extract per-route fields
-            if isinstance(prefix, dict):
-                evpn_route_type = prefix.get("route_type")
-                evpn_rd = prefix.get("rd")
-                evpn_esi = prefix.get("esi")
-                mac_address = prefix.get("mac_address")
-
-            route = RouteUpdate(
-                time=datetime.now(UTC),
-                bmp_peer_ip=bmp_peer_ip,  # type: ignore[arg-type]
-                bmp_peer_asn=None,
-                bgp_peer_ip=parsed.per_peer_header.peer_address,  # type: ignore[arg-type]
-                bgp_peer_asn=parsed.per_peer_header.peer_asn,
-                family=family,
-                prefix=prefix_str,
-                next_hop=None,
-                as_path=None,
-                communities=None,
-                extended_communities=None,
-                med=None,
-                local_pref=None,
-                is_withdrawn=True,
-                evpn_route_type=evpn_route_type,
-                evpn_rd=evpn_rd,
-                evpn_esi=evpn_esi,
-                mac_address=mac_address,
-            )
-            await self.batch_writer.add_route(route)
-            # Track processed route in stats
-            self.stats_collector.increment_processed(bmp_peer_ip, family)
+        # Routes handed to the batch writer, counted even if a later one fails
+        queued = 0
+        try:
+            # Process announced prefixes
+            for prefix in bgp_update.prefixes:
+                # Extract prefix string (handles both CIDR and EVPN dicts)
+                prefix_str = self._extract_prefix_string(prefix)
+
+                # Extract EVPN-specific fields from route dict if applicable
+                evpn_route_type = bgp_update.evpn_route_type
+                evpn_rd = bgp_update.evpn_rd
+                evpn_esi = bgp_update.evpn_esi
+                mac_address = bgp_update.mac_address
+
+                # If prefix is an EVPN dict, extract per-route fields
+                if isinstance(prefix, dict):
+                    evpn_route_type = prefix.get("route_type", evpn_route_type)
+                    evpn_rd = prefix.get("rd", evpn_rd)
+                    evpn_esi = prefix.get("esi", evpn_esi)
+                    mac_address = prefix.get("mac_address", mac_address)
+
+                route = RouteUpdate(
+                    time=datetime.now(UTC),
+                    bmp_peer_ip=bmp_peer_ip,  # type: ignore[arg-type]
+                    bmp_peer_asn=None,  # Will be populated from peer_header if needed
+                    bgp_peer_ip=parsed.per_peer_header.peer_address,  # type: ignore[arg-type]
+                    bgp_peer_asn=parsed.per_peer_header.peer_asn,
+                    family=family,
+                    prefix=prefix_str,
+                    next_hop=bgp_update.next_hop,  # type: ignore[arg-type]
+                    as_path=bgp_update.as_path,
+                    communities=bgp_update.communities,
+                    extended_communities=bgp_update.extended_communities,
+                    med=bgp_update.med,
+                    local_pref=bgp_update.local_pref,
+                    is_withdrawn=False,
+                    evpn_route_type=evpn_route_type,
+                    evpn_rd=evpn_rd,
+                    evpn_esi=evpn_esi,
+                    mac_address=mac_address,
+                )
+                await self.batch_writer.add_route(route)
+                queued += 1
+
+            # Process withdrawn prefixes
+            for prefix in bgp_update.withdrawn_prefixes:
+                # Extract prefix string (handles both CIDR and EVPN dicts)
+                prefix_str = self._extract_prefix_string(prefix)
+
+                # Extract EVPN-specific fields from route dict if applicable
+                evpn_route_type = None
+                evpn_rd = None
+                evpn_esi = None
+                mac_address = None
+
+                # If prefix is an EVPN dict, extract per-route fields
+                if isinstance(prefix, dict):
+                    evpn_route_type = prefix.get("route_type")
+                    evpn_rd = prefix.get("rd")
+                    evpn_esi = prefix.get("esi")
+                    mac_address = prefix.get("mac_address")
+
+                route = RouteUpdate(
+                    time=datetime.now(UTC),
+                    bmp_peer_ip=bmp_peer_ip,  # type: ignore[arg-type]
+                    bmp_peer_asn=None,
+                    bgp_peer_ip=parsed.per_peer_header.peer_address,  # type: ignore[arg-type]
+                    bgp_peer_asn=parsed.per_peer_header.peer_asn,
+                    family=family,
+                    prefix=prefix_str,
+                    next_hop=None,
+                    as_path=None,
+                    communities=None,
+                    extended_communities=None,
+                    med=None,
+                    local_pref=None,
+                    is_withdrawn=True,
+                    evpn_route_type=evpn_route_type,
+                    evpn_rd=evpn_rd,
+                    evpn_esi=evpn_esi,
+                    mac_address=mac_address,
+                )
+                await self.batch_writer.add_route(route)
+                queued += 1
+        finally:
+            # Track processed routes in stats (one peer lookup per UPDATE)
+            if queued:
+                self.stats_collector.increment_processed(bmp_peer_ip, family, queued)
 
     async def _handle_peer_up(self, data: bytes, bmp_peer_ip: str) -> None:
         """
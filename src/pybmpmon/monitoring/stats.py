@@ -9,7 +9,7 @@ import structlog
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PeerStats:
     """Statistics for a single BMP peer."""
 
@@ -27,21 +27,22 @@ class PeerStats:
         self.routes_received += 1
         self.last_update = datetime.now(UTC)
 
-    def increment_processed(self, family: str) -> None:
+    def increment_processed(self, family: str, count: int = 1) -> None:
         """
         Increment routes processed counter and family-specific counter.
 
         Args:
             family: Route family (ipv4_unicast, ipv6_unicast, evpn)
+            count: Number of routes processed (default: 1)
         """
-        self.routes_processed += 1
+        self.routes_processed += count
 
         if family == "ipv4_unicast":
-            self.ipv4_routes += 1
+            self.ipv4_routes += count
         elif family == "ipv6_unicast":
-            self.ipv6_routes += 1
+            self.ipv6_routes += count
         elif family == "evpn":
-            self.evpn_routes += 1
+            self.evpn_routes += count
 
         self.last_update = datetime.now(UTC)
 
@@ -76,6 +77,10 @@ class StatisticsCollector:
         self._logging_task: asyncio.Task[None] | None = None
         self._running = False
 
+        # Set after each periodic logging pass (counters have been reset),
+        # cleared again when the next pass starts
+        self.log_signal = asyncio.Event()
+
     def get_peer_stats(self, peer_ip: str) -> PeerStats:
         """
         Get statistics for a peer (creates if doesn't exist).
@@ -100,16 +105,17 @@ class StatisticsCollector:
         stats = self.get_peer_stats(peer_ip)
         stats.increment_received()
 
-    def increment_processed(self, peer_ip: str, family: str) -> None:
+    def increment_processed(self, peer_ip: str, family: str, count: int = 1) -> None:
         """
         Increment routes processed for a peer.
 
         Args:
             peer_ip: BMP peer IP address
             family: Route family
+            count: Number of routes processed (default: 1)
         """
         stats = self.get_peer_stats(peer_ip)
-        stats.increment_processed(family)
+        stats.increment_processed(family, count)
 
     def increment_error(self, peer_ip: str) -> None:
         """
@@ -158,6 +164,7 @@ class StatisticsCollector:
         """Periodically log statistics for all peers."""
         while self._running:
             try:
+                self.log_signal.clear()
                 await asyncio.sleep(self.log_interval)
 
                 # Log stats for each peer
@@ -188,6 +195,8 @@ class StatisticsCollector:
                         # Reset counters after logging
                         stats.reset()
 
+                self.log_signal.set()
+
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -1,5 +1,8 @@
 """BGP UPDATE message parser implementation."""
 
+import socket
+import struct
+from functools import lru_cache
 from ipaddress import IPv4Address, IPv6Address
 from typing import Any
 
@@ -18,7 +21,33 @@ from pybmpmon.protocol.bgp import (
     ParsedBGPUpdate,
     SubsequentAddressFamilyIdentifier,
 )
-from pybmpmon.utils.binary import read_bytes, read_uint8, read_uint16, read_uint32
+
+# Fixed-layout fields decoded in one call: marker, length, type
+_BGP_HEADER = struct.Struct("!16sHB")
+_UINT16 = struct.Struct("!H")
+_UINT32 = struct.Struct("!I")
+# AFI, SAFI and (MP_REACH only) next hop length
+_MP_REACH_HEADER = struct.Struct("!HBB")
+_MP_UNREACH_HEADER = struct.Struct("!HB")
+# Route Distinguisher value fields following the 2-byte type (RFC4364)
+_RD_TYPE0 = struct.Struct("!HI")  # 2-byte administrator, 4-byte assigned
+_RD_TYPE1 = struct.Struct("!4sH")  # IPv4 address, 2-byte assigned
+_RD_TYPE2 = struct.Struct("!IH")  # 4-byte administrator, 2-byte assigned
+
+
+@lru_cache(maxsize=64)
+def _array_struct(fmt: str, count: int) -> struct.Struct:
+    """
+    Get a cached Struct unpacking count consecutive fields of one format.
+
+    Args:
+        fmt: Single struct format character ("H", "I" or "Q")
+        count: Number of fields
+
+    Returns:
+        Precompiled network-order Struct
+    """
+    return struct.Struct(f"!{count}{fmt}")
 
 
 def parse_bgp_header(data: bytes) -> BGPHeader:
@@ -39,13 +68,10 @@ def parse_bgp_header(data: bytes) -> BGPHeader:
             f"Message too short: need {BGP_HEADER_SIZE} bytes, got {len(data)}"
         )
 
-    marker = read_bytes(data, 0, 16)
+    marker, length, msg_type_raw = _BGP_HEADER.unpack_from(data)
     if marker != BGP_MARKER:
         raise BGPParseError("Invalid BGP marker")
 
-    length = read_uint16(data, 16)
-    msg_type_raw = read_uint8(data, 18)
-
     try:
         msg_type = BGPMessageType(msg_type_raw)
     except ValueError as e:
@@ -83,21 +109,21 @@ def parse_bgp_update_structure(data: bytes) -> BGPUpdateMessage:
     if offset + 2 > header.length:
         raise BGPParseError("Message too short for withdrawn routes length")
 
-    withdrawn_routes_length = read_uint16(data, offset)
+    (withdrawn_routes_length,) = _UINT16.unpack_from(data, offset)
     offset += 2
 
     # Parse withdrawn routes
     if offset + withdrawn_routes_length > header.length:
         raise BGPParseError("Message too short for withdrawn routes")
 
-    withdrawn_routes = read_bytes(data, offset, withdrawn_routes_length)
+    withdrawn_routes = data[offset : offset + withdrawn_routes_length]
     offset += withdrawn_routes_length
 
     # Parse total path attribute length (2 bytes)
     if offset + 2 > header.length:
         raise BGPParseError("Message too short for path attribute length")
 
-    total_path_attr_length = read_uint16(data, offset)
+    (total_path_attr_length,) = _UINT16.unpack_from(data, offset)
     offset += 2
 
     # Parse path attributes
@@ -109,7 +135,7 @@ def parse_bgp_update_structure(data: bytes) -> BGPUpdateMessage:
     offset = path_attrs_end
 
     # Remaining data is NLRI
-    nlri = read_bytes(data, offset, header.length - offset)
+    nlri = data[offset : header.length]
 
     return BGPUpdateMessage(
         withdrawn_routes_length=withdrawn_routes_length,
@@ -143,8 +169,8 @@ def parse_path_attributes(data: bytes, start: int, end: int) -> list[BGPPathAttr
         if offset + 3 > end:
             raise BGPParseError(f"Incomplete path attribute at offset {offset}")
 
-        flags = read_uint8(data, offset)
-        type_code_raw = read_uint8(data, offset + 1)
+        flags = data[offset]
+        type_code_raw = data[offset + 1]
 
         try:
             type_code = BGPPathAttributeType(type_code_raw)
@@ -157,16 +183,16 @@ def parse_path_attributes(data: bytes, start: int, end: int) -> list[BGPPathAttr
         if flags & ATTR_FLAG_EXTENDED_LENGTH:
             if offset + 4 > end:
                 raise BGPParseError("Incomplete extended length attribute")
-            length = read_uint16(data, offset + 2)
+            (length,) = _UINT16.unpack_from(data, offset + 2)
             value_offset = offset + 4
         else:
-            length = read_uint8(data, offset + 2)
+            length = data[offset + 2]
             value_offset = offset + 3
 
         if value_offset + length > end:
             raise BGPParseError("Attribute value exceeds message bounds")
 
-        value = read_bytes(data, value_offset, length)
+        value = data[value_offset : value_offset + length]
 
         attributes.append(
             BGPPathAttribute(
@@ -179,6 +205,65 @@ def parse_path_attributes(data: bytes, start: int, end: int) -> list[BGPPathAttr
     return attributes
 
 
+def _format_ipv6(packed: bytes) -> str:
+    """
+    Format a packed IPv6 address like str(IPv6Address(packed)), but faster.
+
+    inet_ntop writes IPv4-mapped/compatible addresses (first 80 bits zero)
+    in dotted form, which ipaddress does not, so those go through ipaddress.
+
+    Args:
+        packed: 16-byte packed IPv6 address
+
+    Returns:
+        Compressed IPv6 address string
+    """
+    if any(packed[:10]):
+        return socket.inet_ntop(socket.AF_INET6, packed)
+    return str(IPv6Address(packed))
+
+
+# Prefix length (bits, any byte value) -> bytes on the wire, -1 if invalid
+_IPV4_PREFIX_BYTES = tuple(-1 if bits > 32 else (bits + 7) // 8 for bits in range(256))
+_IPV6_PREFIX_BYTES = tuple(-1 if bits > 128 else (bits + 7) // 8 for bits in range(256))
+
+# BMP feeds re-announce the same prefixes constantly, so formatted prefix
+# strings are cached by their wire encoding
+_PREFIX_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=_PREFIX_CACHE_SIZE)
+def _format_ipv4_prefix(prefix_data: bytes, prefix_len: int) -> str:
+    """
+    Format IPv4 prefix bytes (without padding) as a CIDR string.
+
+    Args:
+        prefix_data: Significant prefix bytes as carried in the NLRI
+        prefix_len: Prefix length in bits
+
+    Returns:
+        Prefix string, e.g. "192.0.2.0/24"
+    """
+    prefix_ip = socket.inet_ntop(socket.AF_INET, prefix_data.ljust(4, b"\x00"))
+    return f"{prefix_ip}/{prefix_len}"
+
+
+@lru_cache(maxsize=_PREFIX_CACHE_SIZE)
+def _format_ipv6_prefix(prefix_data: bytes, prefix_len: int) -> str:
+    """
+    Format IPv6 prefix bytes (without padding) as a CIDR string.
+
+    Args:
+        prefix_data: Significant prefix bytes as carried in the NLRI
+        prefix_len: Prefix length in bits
+
+    Returns:
+        Prefix string, e.g. "2001:db8::/32"
+    """
+    prefix_ip = _format_ipv6(prefix_data.ljust(16, b"\x00"))
+    return f"{prefix_ip}/{prefix_len}"
+
+
 def parse_ipv4_prefix(data: bytes, offset: int) -> tuple[str, int]:
     """
     Parse IPv4 prefix in BGP format (length + prefix bytes).
@@ -196,21 +281,17 @@ def parse_ipv4_prefix(data: bytes, offset: int) -> tuple[str, int]:
     if offset >= len(data):
         raise BGPParseError("No data for IPv4 prefix")
 
-    prefix_len = read_uint8(data, offset)
-    if prefix_len > 32:
-        raise BGPParseError(f"Invalid IPv4 prefix length: {prefix_len}")
+    prefix_len = data[offset]
 
-    # Calculate number of bytes needed for prefix
-    prefix_bytes = (prefix_len + 7) // 8
+    # Number of bytes needed for prefix, -1 for an invalid length
+    prefix_bytes = _IPV4_PREFIX_BYTES[prefix_len]
+    if prefix_bytes < 0:
+        raise BGPParseError(f"Invalid IPv4 prefix length: {prefix_len}")
     if offset + 1 + prefix_bytes > len(data):
         raise BGPParseError("Incomplete IPv4 prefix")
 
-    # Read prefix bytes and pad to 4 bytes
-    prefix_data = read_bytes(data, offset + 1, prefix_bytes)
-    prefix_data = prefix_data + b"\x00" * (4 - prefix_bytes)
-
-    prefix_ip = str(IPv4Address(prefix_data))
-    return f"{prefix_ip}/{prefix_len}", 1 + prefix_bytes
+    prefix_data = data[offset + 1 : offset + 1 + prefix_bytes]
+    return _format_ipv4_prefix(prefix_data, prefix_len), 1 + prefix_bytes
 
 
 def parse_ipv6_prefix(data: bytes, offset: int) -> tuple[str, int]:
@@ -230,21 +311,17 @@ def parse_ipv6_prefix(data: bytes, offset: int) -> tuple[str, int]:
     if offset >= len(data):
         raise BGPParseError("No data for IPv6 prefix")
 
-    prefix_len = read_uint8(data, offset)
-    if prefix_len > 128:
-        raise BGPParseError(f"Invalid IPv6 prefix length: {prefix_len}")
+    prefix_len = data[offset]
 
-    # Calculate number of bytes needed for prefix
-    prefix_bytes = (prefix_len + 7) // 8
+    # Number of bytes needed for prefix, -1 for an invalid length
+    prefix_bytes = _IPV6_PREFIX_BYTES[prefix_len]
+    if prefix_bytes < 0:
+        raise BGPParseError(f"Invalid IPv6 prefix length: {prefix_len}")
     if offset + 1 + prefix_bytes > len(data):
         raise BGPParseError("Incomplete IPv6 prefix")
 
-    # Read prefix bytes and pad to 16 bytes
-    prefix_data = read_bytes(data, offset + 1, prefix_bytes)
-    prefix_data = prefix_data + b"\x00" * (16 - prefix_bytes)
-
-    prefix_ip = str(IPv6Address(prefix_data))
-    return f"{prefix_ip}/{prefix_len}", 1 + prefix_bytes
+    prefix_data = data[offset + 1 : offset + 1 + prefix_bytes]
+    return _format_ipv6_prefix(prefix_data, prefix_len), 1 + prefix_bytes
 
 
 def parse_as_path(value: bytes) -> list[int]:
@@ -267,8 +344,8 @@ def parse_as_path(value: bytes) -> list[int]:
         if offset + 2 > len(value):
             raise BGPParseError("Incomplete AS_PATH segment")
 
-        segment_type = read_uint8(value, offset)
-        segment_length = read_uint8(value, offset + 1)
+        segment_type = value[offset]
+        segment_length = value[offset + 1]
         offset += 2
 
         # Detect AS size: calculate remaining bytes and divide by segment length
@@ -290,21 +367,23 @@ def parse_as_path(value: bytes) -> list[int]:
         if offset + (segment_length * as_size) > len(value):
             raise BGPParseError("Incomplete AS_PATH segment data")
 
-        for _ in range(segment_length):
-            if as_size == 4:
-                as_num = read_uint32(value, offset)
-            else:
-                as_num = read_uint16(value, offset)
-            if segment_type == BGPASPathSegmentType.AS_SEQUENCE:
-                as_path.append(as_num)
-            elif segment_type == BGPASPathSegmentType.AS_SET:
-                # For AS_SET, we still add to path but note it's a set
-                as_path.append(as_num)
-            offset += as_size
+        # Decode the whole segment in one call
+        if segment_type in (
+            BGPASPathSegmentType.AS_SEQUENCE,
+            BGPASPathSegmentType.AS_SET,  # Still added to path, but it's a set
+        ):
+            as_struct = _array_struct("I" if as_size == 4 else "H", segment_length)
+            as_path.extend(as_struct.unpack_from(value, offset))
+        offset += segment_length * as_size
 
     return as_path
 
 
+# Decimal strings for every uint16 (~4 MB), so community formatting
+# is two tuple lookups instead of two int-to-str conversions
+_UINT16_STR: tuple[str, ...] = tuple(map(str, range(0x10000)))
+
+
 def parse_communities(value: bytes) -> list[str]:
     """
     Parse COMMUNITIES attribute.
@@ -321,16 +400,12 @@ def parse_communities(value: bytes) -> list[str]:
     if len(value) % 4 != 0:
         raise BGPParseError("Invalid COMMUNITIES length (must be multiple of 4)")
 
-    communities: list[str] = []
-    offset = 0
-
-    while offset < len(value):
-        as_num = read_uint16(value, offset)
-        comm_value = read_uint16(value, offset + 2)
-        communities.append(f"{as_num}:{comm_value}")
-        offset += 4
-
-    return communities
+    # Each community is two uint16 halves; decode them all in one call
+    halves = _array_struct("H", len(value) // 2).unpack(value)
+    return [
+        _UINT16_STR[as_num] + ":" + _UINT16_STR[comm_value]
+        for as_num, comm_value in zip(halves[0::2], halves[1::2], strict=True)
+    ]
 
 
 def parse_extended_communities(value: bytes) -> list[str]:
@@ -361,59 +436,55 @@ def parse_extended_communities(value: bytes) -> list[str]:
         )
 
     extended_communities: list[str] = []
-    offset = 0
 
-    while offset < len(value):
-        ext_type = read_uint8(value, offset)
-        ext_subtype = read_uint8(value, offset + 1)
+    # Decode every community as one uint64 and pick fields out with shifts:
+    # byte 0 is the type, byte 1 the subtype, bytes 2-7 the value
+    for ext in _array_struct("Q", len(value) // 8).unpack(value):
+        ext_type = ext >> 56
+        ext_subtype = (ext >> 48) & 0xFF
 
         # OSPF Domain ID (0x03, subtype 0x0c) - check before IPv4 Route Origin
         if ext_type == 0x03 and ext_subtype == 0x0C:
-            domain_bytes = read_bytes(value, offset + 2, 6)
             # Last 4 bytes are the domain ID
-            domain_id_bytes = domain_bytes[2:6]
-            domain_id = str(IPv4Address(domain_id_bytes))
+            domain_id = str(IPv4Address(ext & 0xFFFFFFFF))
             extended_communities.append(f"OSPF-Domain:{domain_id}")
 
         # Two-octet AS specific (0x00 = Route Target, 0x02 = Route Origin)
         elif ext_type == 0x00 and ext_subtype == 0x02:
-            as_num = read_uint16(value, offset + 2)
-            assigned = read_uint32(value, offset + 4)
+            as_num = (ext >> 32) & 0xFFFF
+            assigned = ext & 0xFFFFFFFF
             extended_communities.append(f"RT:{as_num}:{assigned}")
 
         elif ext_type == 0x02 and ext_subtype == 0x00:
-            as_num = read_uint16(value, offset + 2)
-            assigned = read_uint32(value, offset + 4)
+            as_num = (ext >> 32) & 0xFFFF
+            assigned = ext & 0xFFFFFFFF
             extended_communities.append(f"RO:{as_num}:{assigned}")
 
         # IPv4 Address specific (0x01 = Route Target, 0x03 = Route Origin)
         elif ext_type == 0x01 and ext_subtype == 0x02:
-            ip_bytes = read_bytes(value, offset + 2, 4)
-            ip = str(IPv4Address(ip_bytes))
-            assigned = read_uint16(value, offset + 6)
+            ip = str(IPv4Address((ext >> 16) & 0xFFFFFFFF))
+            assigned = ext & 0xFFFF
             extended_communities.append(f"RT:{ip}:{assigned}")
 
         elif ext_type == 0x03 and ext_subtype == 0x00:
-            ip_bytes = read_bytes(value, offset + 2, 4)
-            ip = str(IPv4Address(ip_bytes))
-            assigned = read_uint16(value, offset + 6)
+            ip = str(IPv4Address((ext >> 16) & 0xFFFFFFFF))
+            assigned = ext & 0xFFFF
             extended_communities.append(f"RO:{ip}:{assigned}")
 
         # Four-octet AS specific (0x02 = Route Target, 0x0a = Route Origin)
         elif ext_type == 0x02 and ext_subtype == 0x02:
-            as_num = read_uint32(value, offset + 2)
-            assigned = read_uint16(value, offset + 6)
+            as_num = (ext >> 16) & 0xFFFFFFFF
+            assigned = ext & 0xFFFF
             extended_communities.append(f"RT:{as_num}:{assigned}")
 
         elif ext_type == 0x0A and ext_subtype == 0x02:
-            as_num = read_uint32(value, offset + 2)
-            assigned = read_uint16(value, offset + 6)
+            as_num = (ext >> 16) & 0xFFFFFFFF
+            assigned = ext & 0xFFFF
             extended_communities.append(f"RO:{as_num}:{assigned}")
 
         # Opaque Extended Community (0x03)
         elif ext_type == 0x03:
-            opaque_value = read_bytes(value, offset + 2, 6)
-            extended_communities.append(f"Opaque:{opaque_value.hex()}")
+            extended_communities.append(f"Opaque:{ext & 0xFFFFFFFFFFFF:012x}")
 
         # EVPN Extended Community (0x06)
         elif ext_type == 0x06:
@@ -423,42 +494,31 @@ def parse_extended_communities(value: bytes) -> list[str]:
             # 0x02 = ES-Import Route Target
             if ext_subtype == 0x00:
                 # MAC Mobility: flags (1) + seq (4) + reserved (1)
-                _ = read_uint8(value, offset + 2)  # flags (unused for now)
-                seq = read_uint32(value, offset + 3)
+                seq = (ext >> 8) & 0xFFFFFFFF
                 extended_communities.append(f"EVPN-MAC-Mobility:{seq}")
             elif ext_subtype == 0x01:
                 # ESI Label: flags (1) + reserved (2) + label (3)
-                label_bytes = read_bytes(value, offset + 5, 3)
-                label = (
-                    (label_bytes[0] << 12)
-                    | (label_bytes[1] << 4)
-                    | (label_bytes[2] >> 4)
-                )
+                label = (ext & 0xFFFFFF) >> 4
                 extended_communities.append(f"EVPN-ESI-Label:{label}")
             elif ext_subtype == 0x02:
                 # ES-Import RT: MAC address (6 bytes)
-                mac_bytes = read_bytes(value, offset + 2, 6)
-                mac = ":".join(f"{b:02x}" for b in mac_bytes)
+                mac = (ext & 0xFFFFFFFFFFFF).to_bytes(6, "big").hex(":")
                 extended_communities.append(f"EVPN-ES-Import:{mac}")
             else:
                 # Unknown EVPN subtype
-                evpn_value = read_bytes(value, offset + 2, 6)
                 extended_communities.append(
-                    f"EVPN-{ext_subtype:02x}:{evpn_value.hex()}"
+                    f"EVPN-{ext_subtype:02x}:{ext & 0xFFFFFFFFFFFF:012x}"
                 )
 
         # Flow spec redirect (0x08)
         elif ext_type == 0x08:
-            as_num = read_uint16(value, offset + 2)
-            assigned = read_uint32(value, offset + 4)
+            as_num = (ext >> 32) & 0xFFFF
+            assigned = ext & 0xFFFFFFFF
             extended_communities.append(f"Redirect:{as_num}:{assigned}")
 
         # Unknown or experimental types
         else:
-            ext_value = read_bytes(value, offset, 8)
-            extended_communities.append(f"Unknown-{ext_type:02x}:{ext_value.hex()}")
-
-        offset += 8
+            extended_communities.append(f"Unknown-{ext_type:02x}:{ext:016x}")
 
     return extended_communities
 
@@ -480,27 +540,24 @@ def parse_route_distinguisher(value: bytes, offset: int) -> str:
     if len(value) < offset + 8:
         raise BGPParseError("Route Distinguisher too short")
 
-    rd_type = read_uint16(value, offset)
+    (rd_type,) = _UINT16.unpack_from(value, offset)
 
     if rd_type == 0:
         # Type 0: 2-byte administrator + 4-byte assigned number
-        admin = read_uint16(value, offset + 2)
-        assigned = read_uint32(value, offset + 4)
+        admin, assigned = _RD_TYPE0.unpack_from(value, offset + 2)
         return f"{admin}:{assigned}"
     elif rd_type == 1:
         # Type 1: 4-byte IP address + 2-byte assigned number
-        ip_bytes = read_bytes(value, offset + 2, 4)
-        ip = str(IPv4Address(ip_bytes))
-        assigned = read_uint16(value, offset + 6)
+        ip_bytes, assigned = _RD_TYPE1.unpack_from(value, offset + 2)
+        ip = socket.inet_ntop(socket.AF_INET, ip_bytes)
         return f"{ip}:{assigned}"
     elif rd_type == 2:
         # Type 2: 4-byte administrator + 2-byte assigned number
-        admin = read_uint32(value, offset + 2)
-        assigned = read_uint16(value, offset + 6)
+        admin, assigned = _RD_TYPE2.unpack_from(value, offset + 2)
         return f"{admin}:{assigned}"
     else:
         # Unknown type - return hex representation
-        rd_bytes = read_bytes(value, offset, 8)
+        rd_bytes = value[offset : offset + 8]
         return rd_bytes.hex()
 
 
@@ -521,7 +578,7 @@ def parse_ethernet_segment_id(value: bytes, offset: int) -> str:
     if len(value) < offset + 10:
         raise BGPParseError("Ethernet Segment Identifier too short")
 
-    esi_bytes = read_bytes(value, offset, 10)
+    esi_bytes = value[offset : offset + 10]
     # Format as colon-separated hex pairs
     return ":".join(f"{b:02x}" for b in esi_bytes)
 
@@ -544,8 +601,8 @@ def parse_evpn_nlri(value: bytes, offset: int) -> tuple[dict[str, Any] | None, i
     if len(value) < offset + 2:
         return None, 0
 
-    route_type = read_uint8(value, offset)
-    length = read_uint8(value, offset + 1)
+    route_type = value[offset]
+    length = value[offset + 1]
 
     # Check if we have enough data for the route
     if len(value) < offset + 2 + length:
@@ -572,29 +629,29 @@ def parse_evpn_nlri(value: bytes, offset: int) -> tuple[dict[str, Any] | None, i
         route_offset += 4
 
         # Parse MAC Address Length (1 byte, should be 48 bits)
-        mac_len = read_uint8(value, route_offset)
+        mac_len = value[route_offset]
         route_offset += 1
 
         mac_address = None
         if mac_len == 48:  # 48 bits = 6 bytes
             if len(value) >= route_offset + 6:
-                mac_bytes = read_bytes(value, route_offset, 6)
+                mac_bytes = value[route_offset : route_offset + 6]
                 mac_address = ":".join(f"{b:02x}" for b in mac_bytes)
                 route_offset += 6
 
         # Parse IP Address Length (1 byte)
-        ip_len = read_uint8(value, route_offset)
+        ip_len = value[route_offset]
         route_offset += 1
 
         ip_address = None
         if ip_len == 32 and len(value) >= route_offset + 4:
             # IPv4 address
-            ip_bytes = read_bytes(value, route_offset, 4)
+            ip_bytes = value[route_offset : route_offset + 4]
             ip_address = str(IPv4Address(ip_bytes))
             route_offset += 4
         elif ip_len == 128 and len(value) >= route_offset + 16:
             # IPv6 address
-            ip_bytes = read_bytes(value, route_offset, 16)
+            ip_bytes = value[route_offset : route_offset + 16]
             ip_address = str(IPv6Address(ip_bytes))
             route_offset += 16
 
@@ -632,15 +689,13 @@ def parse_mp_reach_nlri(
     if len(value) < 5:
         raise BGPParseError("MP_REACH_NLRI too short")
 
-    afi = read_uint16(value, 0)
-    safi = read_uint8(value, 2)
-    next_hop_len = read_uint8(value, 3)
+    afi, safi, next_hop_len = _MP_REACH_HEADER.unpack_from(value)
 
     if len(value) < 4 + next_hop_len + 1:
         raise BGPParseError("MP_REACH_NLRI incomplete")
 
     # Parse next hop
-    next_hop_data = read_bytes(value, 4, next_hop_len)
+    next_hop_data = value[4 : 4 + next_hop_len]
     next_hop: str | None = None
 
     if afi == AddressFamilyIdentifier.IPV4:
@@ -714,8 +769,7 @@ def parse_mp_unreach_nlri(
     if len(value) < 3:
         raise BGPParseError("MP_UNREACH_NLRI too short")
 
-    afi = read_uint16(value, 0)
-    safi = read_uint8(value, 2)
+    afi, safi = _MP_UNREACH_HEADER.unpack_from(value)
     offset = 3
 
     # Parse withdrawn routes based on AFI/SAFI
@@ -797,16 +851,16 @@ def parse_bgp_update(data: bytes) -> ParsedBGPUpdate:
     for attr in update.path_attributes:
         try:
             if attr.type_code == BGPPathAttributeType.ORIGIN:
-                origin = read_uint8(attr.value, 0)
+                origin = attr.value[0]
             elif attr.type_code == BGPPathAttributeType.AS_PATH:
                 as_path = parse_as_path(attr.value)
             elif attr.type_code == BGPPathAttributeType.NEXT_HOP:
                 if len(attr.value) >= 4:
                     next_hop = str(IPv4Address(attr.value[:4]))
             elif attr.type_code == BGPPathAttributeType.MULTI_EXIT_DISC:
-                med = read_uint32(attr.value, 0)
+                (med,) = _UINT32.unpack_from(attr.value)
             elif attr.type_code == BGPPathAttributeType.LOCAL_PREF:
-                local_pref = read_uint32(attr.value, 0)
+                (local_pref,) = _UINT32.unpack_from(attr.value)
             elif attr.type_code == BGPPathAttributeType.COMMUNITIES:
                 communities = parse_communities(attr.value)
             elif attr.type_code == BGPPathAttributeType.EXTENDED_COMMUNITIES:
@@ -3,6 +3,11 @@
 import ipaddress
 import struct
 
+# Precompiled formats: unpack_from reads straight from the buffer without
+# re-parsing the format string on every call
+_U16 = struct.Struct("!H")
+_U32 = struct.Struct("!I")
+
 
 def read_uint8(data: bytes, offset: int = 0) -> int:
     """
@@ -18,12 +23,13 @@ def read_uint8(data: bytes, offset: int = 0) -> int:
     Raises:
         ValueError: If not enough data available
     """
-    if len(data) < offset + 1:
+    try:
+        return data[offset]
+    except IndexError:
         raise ValueError(
             f"Not enough data to read uint8 at offset {offset}: "
             f"need {offset + 1} bytes, got {len(data)}"
-        )
-    return data[offset]
+        ) from None
 
 
 def read_uint16(data: bytes, offset: int = 0) -> int:
@@ -40,12 +46,13 @@ def read_uint16(data: bytes, offset: int = 0) -> int:
     Raises:
         ValueError: If not enough data available
     """
-    if len(data) < offset + 2:
+    try:
+        result: int = _U16.unpack_from(data, offset)[0]
+    except struct.error:
         raise ValueError(
             f"Not enough data to read uint16 at offset {offset}: "
             f"need {offset + 2} bytes, got {len(data)}"
-        )
-    result: int = struct.unpack_from("!H", data, offset)[0]
+        ) from None
     return result
 
 
@@ -63,12 +70,13 @@ def read_uint32(data: bytes, offset: int = 0) -> int:
     Raises:
         ValueError: If not enough data available
     """
-    if len(data) < offset + 4:
+    try:
+        result: int = _U32.unpack_from(data, offset)[0]
+    except struct.error:
         raise ValueError(
             f"Not enough data to read uint32 at offset {offset}: "
             f"need {offset + 4} bytes, got {len(data)}"
-        )
-    result: int = struct.unpack_from("!I", data, offset)[0]
+        ) from None
     return result
 
 
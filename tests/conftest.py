@@ -1,5 +1,8 @@
 """Pytest configuration and fixtures."""
 
+import struct
+from collections.abc import Callable
+
 import pytest
 
 
@@ -15,3 +18,70 @@ def valid_bmp_route_monitoring_header() -> bytes:
     """Return a valid BMP Route Monitoring message header."""
     # Version=3, Length=100, Type=0 (Route Monitoring)
     return b"\x03\x00\x00\x00\x64\x00"
+
+
+_PER_PEER_HEADER = struct.Struct(">BB8s16sI4sII")
+
+
+def _build_per_peer_header(
+    *,
+    peer_type: int = 0,
+    flags: int = 0,
+    distinguisher: bytes = b"\x00" * 8,
+    address: bytes = b"\x00" * 10 + b"\xff\xff" + b"\xc0\x00\x02\x01",
+    asn: int = 65000,
+    bgp_id: bytes = b"\xc0\x00\x02\x01",
+    timestamp_sec: int = 1,
+    timestamp_usec: int = 0,
+) -> bytes:
+    """Pack a BMP Per-Peer Header; defaults describe IPv4 peer 192.0.2.1."""
+    return _PER_PEER_HEADER.pack(
+        peer_type,
+        flags,
+        distinguisher,
+        address,
+        asn,
+        bgp_id,
+        timestamp_sec,
+        timestamp_usec,
+    )
+
+
+@pytest.fixture(scope="session")
+def per_peer_header() -> Callable[..., bytes]:
+    """Return a builder for BMP Per-Peer Headers with overridable fields."""
+    return _build_per_peer_header
+
+
+@pytest.fixture(scope="session")
+def ipv4_per_peer_header() -> bytes:
+    """Return a BMP Per-Peer Header for IPv4 peer 192.0.2.1, AS 65000."""
+    # Peer Type=0, Flags=0, Distinguisher=0, Address=::ffff:192.0.2.1,
+    # AS=65000, BGP ID=192.0.2.1, Timestamp=1s 0us
+    return _build_per_peer_header()
+
+
+@pytest.fixture(scope="session")
+def ipv6_per_peer_header() -> bytes:
+    """Return a BMP Per-Peer Header for IPv6 peer 2001:db8::, AS 65000."""
+    # Flags=0x80 (IPv6), Address=2001:db8::, otherwise as for IPv4
+    return _build_per_peer_header(
+        flags=0x80, address=b"\x20\x01\x0d\xb8" + b"\x00" * 12
+    )
+
+
+@pytest.fixture(scope="session")
+def bgp_open() -> bytes:
+    """Return a minimal BGP OPEN message from BGP ID 192.0.2.1."""
+    # Marker, Length=29, Type=OPEN, Version=4, AS=1, Hold Time=180,
+    # BGP ID=192.0.2.1, no Optional Parameters
+    return b"\xff" * 16 + struct.pack(
+        ">HBBHH4sB", 29, 1, 4, 1, 180, b"\xc0\x00\x02\x01", 0
+    )
+
+
+@pytest.fixture(scope="session")
+def bgp_notification() -> bytes:
+    """Return a BGP NOTIFICATION message (Cease / Administrative Shutdown)."""
+    # Marker, Length=21, Type=NOTIFICATION, Error Code=6, Subcode=4
+    return b"\xff" * 16 + b"\x00\x15\x03\x06\x04"
@@ -0,0 +1,169 @@
+"""Shared PostgreSQL/TimescaleDB fixtures for integration tests.
+
+A single container is started per test session, or an already running server
+is reused (see ``postgres_params``). Tests that only need the migrated schema
+share one pool and are isolated by TRUNCATE; migration tests that need a
+pristine database get a freshly created database on the same server.
+"""
+
+import os
+import shutil
+import subprocess
+import uuid
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote, urlparse
+
+import asyncpg  # type: ignore[import-untyped]
+import pytest
+import pytest_asyncio
+from pybmpmon.database.connection import DatabasePool
+
+MIGRATIONS_DIR = (
+    Path(__file__).parent.parent.parent / "src" / "pybmpmon" / "database" / "migrations"
+)
+
+# Migration SQL is read once at import, not on every fixture setup
+MIGRATION_SQL = "\n;\n".join(
+    filepath.read_text() for filepath in sorted(MIGRATIONS_DIR.glob("*.sql"))
+)
+
+TIMESCALEDB_IMAGE = "timescale/timescaledb:latest-pg16"
+
+# Durability settings are pointless for a disposable test database
+POSTGRES_TEST_OPTIONS = (
+    "fsync=off",
+    "synchronous_commit=off",
+    "full_page_writes=off",
+    "shared_buffers=256MB",
+)
+
+
+def connection_params(connection_url: str) -> dict[str, Any]:
+    """Extract asyncpg connection parameters from a connection URL."""
+    # Handles both postgresql:// and postgresql+psycopg2:// URLs
+    url = urlparse(connection_url)
+    if not url.scheme.startswith("postgresql") or url.port is None:
+        raise ValueError(f"Invalid connection URL: {connection_url}")
+
+    return {
+        "host": url.hostname,
+        "port": url.port,
+        "database": url.path.lstrip("/"),
+        "user": unquote(url.username or ""),
+        "password": unquote(url.password or ""),
+    }
+
+
+@pytest.fixture(scope="session")
+def _pull_image() -> None:
+    """
+    Pull the TimescaleDB image before the container fixture starts.
+
+    Keeps a cold image pull out of the first test's timing. Skipped when
+    SKIP_IMAGE_PULL is set (offline runs), an existing server is reused, or
+    the docker CLI is not installed.
+    """
+    if os.getenv("SKIP_IMAGE_PULL") or os.getenv("PYBMPMON_TEST_DATABASE_URL"):
+        return
+    if shutil.which("docker") is None:
+        return
+    subprocess.run(["docker", "pull", "-q", TIMESCALEDB_IMAGE], check=True)
+
+
+@pytest.fixture(scope="session")
+def postgres_params(_pull_image: None) -> Iterator[dict[str, Any]]:
+    """
+    Provide connection parameters for the session's TimescaleDB server.
+
+    Set PYBMPMON_TEST_DATABASE_URL to reuse an already running server across
+    pytest runs instead of starting a fresh container every time. The tests
+    truncate its tables, so point it at a scratch database.
+    """
+    reuse_url = os.getenv("PYBMPMON_TEST_DATABASE_URL")
+    if reuse_url:
+        yield connection_params(reuse_url)
+        return
+
+    # Imported here so runs against an existing server don't need testcontainers
+    from testcontainers.postgres import PostgresContainer
+
+    command = "postgres " + " ".join(f"-c {opt}" for opt in POSTGRES_TEST_OPTIONS)
+    container = PostgresContainer(TIMESCALEDB_IMAGE)
+    # Keep the data directory in RAM; test data is throwaway anyway
+    container.with_kwargs(tmpfs={"/var/lib/postgresql/data": "rw,size=512m"})
+    container.with_command(command)
+    with container as postgres:
+        yield connection_params(postgres.get_connection_url())
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db_pool(postgres_params: dict[str, Any]) -> AsyncIterator[DatabasePool]:
+    """Create the shared database pool and run migrations once."""
+    pool = DatabasePool()
+    await pool.connect(
+        **postgres_params,
+        min_size=4,
+        max_size=16,
+        server_settings={"synchronous_commit": "off"},
+    )
+
+    # Run all migrations as one script in a single round-trip
+    async with pool.get_pool().acquire() as conn:
+        async with conn.transaction():
+            await conn.execute(MIGRATION_SQL)
+
+    # Warm the pool so the first test doesn't pay connection setup
+    conns = [await pool.get_pool().acquire() for _ in range(4)]
+    for conn in conns:
+        await pool.get_pool().release(conn)
+
+    yield pool
+
+    # Cleanup
+    await pool.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def clean_db(db_pool: DatabasePool) -> AsyncIterator[None]:
+    """Clean database tables before each test."""
+    await db_pool.execute(
+        "TRUNCATE TABLE route_updates, route_state, bmp_peers, peer_events "
+        "RESTART IDENTITY CASCADE"
+    )
+    yield
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def fresh_db_pool(
+    postgres_params: dict[str, Any],
+) -> AsyncIterator[asyncpg.Pool]:
+    """
+    Provide a pool on a brand-new, empty database.
+
+    The database is created on the shared server and dropped again
+    after the test, so migration tests always start from a pristine schema.
+    """
+    params = postgres_params
+    name = f"test_{uuid.uuid4().hex[:12]}"
+
+    admin = await asyncpg.connect(**params)
+    try:
+        await admin.execute(f'CREATE DATABASE "{name}"')
+
+        pool = await asyncpg.create_pool(
+            **{**params, "database": name},
+            min_size=1,
+            max_size=3,
+            server_settings={"synchronous_commit": "off"},
+        )
+        try:
+            yield pool
+        finally:
+            await pool.close()
+
+        # FORCE terminates TimescaleDB background workers attached to it
+        await admin.execute(f'DROP DATABASE "{name}" WITH (FORCE)')
+    finally:
+        await admin.close()
@@ -5,11 +5,12 @@ Uses testcontainers for real PostgreSQL/TimescaleDB database.
 """
 
 import asyncio
-from pathlib import Path
+import struct
+from collections.abc import Callable
 
 import pytest
+import pytest_asyncio
 from pybmpmon.database.batch_writer import BatchWriter
-from pybmpmon.database.connection import DatabasePool
 from pybmpmon.database.operations import (
     get_bmp_peer,
     get_route_count,
@@ -19,80 +20,20 @@ from pybmpmon.database.operations import (
 from pybmpmon.database.schema import FAMILY_IPV4_UNICAST
 from pybmpmon.listener import BMPListener
 from pybmpmon.monitoring.stats import StatisticsCollector
-from testcontainers.postgres import PostgresContainer
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture
-def postgres_container():
-    """Start PostgreSQL/TimescaleDB container for tests."""
-    with PostgresContainer("timescale/timescaledb:latest-pg16") as postgres:
-        yield postgres
 
-
-@pytest.fixture
-async def db_pool(postgres_container):
-    """Create database pool and run migrations."""
-    import re
-
-    connection_url = postgres_container.get_connection_url()
-    # Handle both postgresql:// and postgresql+psycopg2:// URLs
-    match = re.match(
-        r"postgresql(?:\+\w+)?://([^:]+):([^@]+)@([^:]+):(\d+)/(.+)", connection_url
-    )
-    if not match:
-        raise ValueError(f"Invalid connection URL: {connection_url}")
-
-    user, password, host, port, database = match.groups()
-
-    pool = DatabasePool()
-    await pool.connect(
-        host=host,
-        port=int(port),
-        database=database,
-        user=user,
-        password=password,
-    )
-
-    # Run migrations
-    migrations_dir = (
-        Path(__file__).parent.parent.parent
-        / "src"
-        / "pybmpmon"
-        / "database"
-        / "migrations"
-    )
-
-    migration_files = sorted(migrations_dir.glob("*.sql"))
-
-    async with pool.get_pool().acquire() as conn:
-        for filepath in migration_files:
-            sql = filepath.read_text()
-            await conn.execute(sql)
-
-    yield pool
-    await pool.close()
-
-
-@pytest.fixture
-async def clean_db(db_pool):
-    """Clean database tables before each test."""
-    async with db_pool.get_pool().acquire() as conn:
-        await conn.execute("TRUNCATE TABLE route_updates")
-        await conn.execute("TRUNCATE TABLE bmp_peers CASCADE")
-        await conn.execute("TRUNCATE TABLE peer_events")
-    yield
-
-
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def batch_writer(db_pool):
     """Create batch writer for tests."""
-    writer = BatchWriter(db_pool.get_pool(), batch_size=10, batch_timeout=0.5)
+    writer = BatchWriter(db_pool.get_pool(), batch_size=1000, batch_timeout=0.1)
     await writer.start()
     yield writer
     await writer.stop()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def stats_collector():
     """Create statistics collector for tests."""
     collector = StatisticsCollector(log_interval=10.0)
@@ -101,7 +42,7 @@ async def stats_collector():
     await collector.stop()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def listener(db_pool, batch_writer, stats_collector):
     """Create BMP listener for tests."""
     listener = BMPListener(
@@ -116,6 +57,25 @@ async def listener(db_pool, batch_writer, stats_collector):
     await listener.stop()
 
 
+async def wait_for_routes_written(
+    batch_writer: BatchWriter, expected: int, timeout: float = 5.0
+) -> None:
+    """
+    Wait until the batch writer has written at least ``expected`` routes.
+
+    Raises the batch writer's flush error as soon as a flush fails, instead of
+    waiting for the timeout.
+    """
+
+    async def _written() -> None:
+        while batch_writer.total_routes_written < expected:
+            if batch_writer.flush_error is not None:
+                raise batch_writer.flush_error
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(_written(), timeout)
+
+
 def build_bmp_header(length: int, msg_type: int) -> bytes:
     """Build BMP common header."""
     data = bytearray()
@@ -220,6 +180,39 @@ def build_route_monitoring_message(
     return header + bytes(data)
 
 
+def make_route_builder(
+    peer_ip: str, peer_asn: int, next_hop: str, as_path: list[int]
+) -> Callable[[str], bytes]:
+    """
+    Build a Route Monitoring encoder specialised for one peer and AS path.
+
+    Everything ahead of the NLRI is laid out once in a scratch buffer, so each
+    call only patches the BMP/BGP length fields and writes the IPv4 prefix.
+    """
+    # A /0 prefix encodes as a single length byte with no address octets
+    template = build_route_monitoring_message(
+        peer_ip, peer_asn, "0.0.0.0/0", next_hop, as_path
+    )
+    head_len = len(template) - 1
+    bgp_offset = 6 + 42  # BMP common header + Per-Peer Header
+    scratch = bytearray(head_len + 5)
+    scratch[:head_len] = template[:head_len]
+
+    def emit(prefix: str) -> bytes:
+        network, length = prefix.split("/")
+        prefix_len = int(length)
+        prefix_bytes = (prefix_len + 7) // 8
+        octets = bytes(int(x) for x in network.split("."))[:prefix_bytes]
+        total = head_len + 1 + prefix_bytes
+
+        struct.pack_into("!I", scratch, 1, total)
+        struct.pack_into("!H", scratch, bgp_offset + 16, total - bgp_offset)
+        struct.pack_into(f"!B{prefix_bytes}s", scratch, head_len, prefix_len, octets)
+        return bytes(memoryview(scratch)[:total])
+
+    return emit
+
+
 def build_peer_up_message(peer_ip: str, peer_asn: int) -> bytes:
     """Build BMP Peer Up message."""
     data = bytearray()
@@ -269,7 +262,6 @@ def build_peer_down_message(peer_ip: str, peer_asn: int, reason: int) -> bytes:
 class TestEndToEndFlow:
     """Test complete BMP to database flow."""
 
-    @pytest.mark.asyncio
     async def test_bmp_to_database_complete_flow(
         self, listener, db_pool, batch_writer, clean_db
     ):
@@ -308,12 +300,8 @@ class TestEndToEndFlow:
             writer.write(route_msg)
             await writer.drain()
 
-            # Wait for listener to process the message and add to batch
-            await asyncio.sleep(1.0)
-
-            # Force batch flush
-            await batch_writer.flush()
-            await asyncio.sleep(0.5)
+            # Wait for the timeout-triggered COPY to land
+            await wait_for_routes_written(batch_writer, 1)
 
             # Verify route in database
             count = await get_route_count(db_pool.get_pool())
@@ -340,7 +328,6 @@ class TestEndToEndFlow:
             writer.close()
             await writer.wait_closed()
 
-    @pytest.mark.asyncio
     async def test_multiple_route_monitoring_messages(
         self, listener, db_pool, batch_writer, clean_db
     ):
@@ -360,24 +347,17 @@ class TestEndToEndFlow:
             await asyncio.sleep(0.3)
 
             # Send 50 route messages
-            for i in range(50):
-                route_msg = build_route_monitoring_message(
-                    peer_ip="192.0.2.10",
-                    peer_asn=65100,
-                    prefix=f"10.{i}.0.0/16",
-                    next_hop="192.0.2.254",
-                    as_path=[65100, 65200],
-                )
-                writer.write(route_msg)
-
+            emit = make_route_builder(
+                peer_ip="192.0.2.10",
+                peer_asn=65100,
+                next_hop="192.0.2.254",
+                as_path=[65100, 65200],
+            )
+            writer.write(b"".join(emit(f"10.{i}.0.0/16") for i in range(50)))
             await writer.drain()
 
-            # Wait for listener to process all messages and add to batch
-            await asyncio.sleep(1.0)
-
-            # Force flush
-            await batch_writer.flush()
-            await asyncio.sleep(0.5)
+            # Wait for the timeout-triggered COPY to land
+            await wait_for_routes_written(batch_writer, 50)
 
             # Verify all 50 routes in database
             count = await get_route_count_by_peer(db_pool.get_pool(), "127.0.0.1")
@@ -392,7 +372,6 @@ class TestEndToEndFlow:
             writer.close()
             await writer.wait_closed()
 
-    @pytest.mark.asyncio
     async def test_peer_lifecycle(self, listener, db_pool, batch_writer, clean_db):
         """Test Peer Up → Routes → Peer Down flow."""
         if not listener.server or not listener.server.sockets:
@@ -415,23 +394,17 @@ class TestEndToEndFlow:
             assert peer.is_active is True
 
             # Phase 2: Send routes
-            for i in range(10):
-                route_msg = build_route_monitoring_message(
-                    peer_ip="192.0.2.20",
-                    peer_asn=65200,
-                    prefix=f"172.16.{i}.0/24",
-                    next_hop="192.0.2.254",
-                    as_path=[65200],
-                )
-                writer.write(route_msg)
-
+            emit = make_route_builder(
+                peer_ip="192.0.2.20",
+                peer_asn=65200,
+                next_hop="192.0.2.254",
+                as_path=[65200],
+            )
+            writer.write(b"".join(emit(f"172.16.{i}.0/24") for i in range(10)))
             await writer.drain()
 
-            # Wait for listener to process all messages and add to batch
-            await asyncio.sleep(1.0)
-
-            await batch_writer.flush()
-            await asyncio.sleep(0.5)
+            # Wait for the timeout-triggered COPY to land
+            await wait_for_routes_written(batch_writer, 10)
 
             # Verify routes
             count = await get_route_count_by_peer(db_pool.get_pool(), "127.0.0.1")
@@ -655,7 +628,6 @@ def build_evpn_route_monitoring_message(
 class TestEVPNEndToEnd:
     """Test EVPN routes end-to-end to database."""
 
-    @pytest.mark.asyncio
     async def test_evpn_type2_with_ip_to_database(
         self, listener, db_pool, batch_writer, clean_db
     ):
@@ -687,12 +659,8 @@ class TestEVPNEndToEnd:
             writer.write(evpn_msg)
             await writer.drain()
 
-            # Wait for listener to process the message and add to batch
-            await asyncio.sleep(1.0)
-
-            # Force batch flush
-            await batch_writer.flush()
-            await asyncio.sleep(0.5)
+            # Wait for the timeout-triggered COPY to land
+            await wait_for_routes_written(batch_writer, 1)
 
             # Verify in database
             async with db_pool.get_pool().acquire() as conn:
@@ -719,7 +687,6 @@ class TestEVPNEndToEnd:
             writer.close()
             await writer.wait_closed()
 
-    @pytest.mark.asyncio
     async def test_evpn_type2_mac_only_to_database(
         self, listener, db_pool, batch_writer, clean_db
     ):
@@ -751,12 +718,8 @@ class TestEVPNEndToEnd:
             writer.write(evpn_msg)
             await writer.drain()
 
-            # Wait for listener to process the message and add to batch
-            await asyncio.sleep(1.0)
-
-            # Force batch flush
-            await batch_writer.flush()
-            await asyncio.sleep(0.5)
+            # Wait for the timeout-triggered COPY to land
+            await wait_for_routes_written(batch_writer, 1)
 
             # Verify in database
             async with db_pool.get_pool().acquire() as conn:
@@ -783,7 +746,6 @@ class TestEVPNEndToEnd:
             writer.close()
             await writer.wait_closed()
 
-    @pytest.mark.asyncio
     async def test_multiple_evpn_routes(
         self, listener, db_pool, batch_writer, clean_db
     ):
@@ -817,11 +779,8 @@ class TestEVPNEndToEnd:
 
             await writer.drain()
 
-            # Wait for listener to process all messages and add to batch
-            await asyncio.sleep(1.0)
-
-            await batch_writer.flush()
-            await asyncio.sleep(0.5)
+            # Wait for the timeout-triggered COPY to land
+            await wait_for_routes_written(batch_writer, 10)
 
             # Verify all 10 EVPN routes in database
             async with db_pool.get_pool().acquire() as conn:
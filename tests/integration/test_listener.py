@@ -134,6 +134,8 @@ async def test_listener_handles_multiple_messages(
 
         # Connect as a client
         reader, writer = await asyncio.open_connection("127.0.0.1", 11022)
+        # Zero high-water mark so drain() waits for the kernel to take the data
+        writer.transport.set_write_buffer_limits(high=0)
 
         # Send multiple BMP headers
         messages = [
@@ -145,12 +147,10 @@ async def test_listener_handles_multiple_messages(
 
         for msg in messages:
             writer.write(msg)
-            await writer.drain()
-            # Small delay between messages
-            await asyncio.sleep(0.05)
+        await writer.drain()
 
         # Give server time to process
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(0.05)
 
         # Close client connection
         writer.close()
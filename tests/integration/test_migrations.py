@@ -1,276 +1,170 @@
 """Integration tests for database migration system."""
 
-import asyncpg  # type: ignore[import-untyped]
+import asyncio
+
 import pytest
 from pybmpmon.database.migrations import MigrationRunner
-from testcontainers.postgres import PostgresContainer
-
 
-@pytest.fixture
-def postgres_container():
-    """Start PostgreSQL/TimescaleDB container for tests."""
-    with PostgresContainer("timescale/timescaledb:latest-pg16") as postgres:
-        yield postgres
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    # Run together on one xdist worker so they share its container
+    pytest.mark.xdist_group("migrations"),
+]
 
 
 class TestMigrationSystem:
     """Test complete migration system workflow."""
 
-    @pytest.mark.asyncio
-    async def test_migration_system_fresh_database(self, postgres_container) -> None:
+    async def test_migration_system_fresh_database(self, fresh_db_pool) -> None:
         """Test migration system on fresh database."""
-        connection_url = postgres_container.get_connection_url()
-
-        # Parse URL
-        import re
-
-        match = re.match(
-            r"postgresql(?:\+\w+)?://([^:]+):([^@]+)@([^:]+):(\d+)/(.+)",
-            connection_url,
-        )
-        assert match is not None
-        user, password, host, port, database = match.groups()
-
-        # Create connection pool
-        pool = await asyncpg.create_pool(
-            host=host,
-            port=int(port),
-            database=database,
-            user=user,
-            password=password,
-            min_size=1,
-            max_size=2,
-        )
+        pool = fresh_db_pool
 
-        try:
-            runner = MigrationRunner(pool)
+        runner = MigrationRunner(pool)
 
-            # Apply migrations
-            applied_count = await runner.apply_migrations()
+        # Apply migrations
+        applied_count = await runner.apply_migrations()
 
-            # Should have applied migrations
-            assert applied_count > 0
+        # Should have applied migrations
+        assert applied_count > 0
 
-            # Verify schema_migrations table exists
-            async with pool.acquire() as conn:
-                exists = await conn.fetchval(
-                    """
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables
-                        WHERE table_name = 'schema_migrations'
-                    )
-                    """
-                )
-                assert exists is True
-
-                # Verify migrations were recorded
-                count = await conn.fetchval("SELECT COUNT(*) FROM schema_migrations")
-                assert count == applied_count
-
-                # Verify core tables exist
-                tables = await conn.fetch(
-                    """
-                    SELECT table_name
-                    FROM information_schema.tables
-                    WHERE table_schema = 'public'
-                    ORDER BY table_name
-                    """
+        # Fetch schema_migrations existence, recorded count and table list
+        # concurrently
+        exists, count, tables = await asyncio.gather(
+            pool.fetchval(
+                """
+                SELECT EXISTS (
+                    SELECT FROM information_schema.tables
+                    WHERE table_name = 'schema_migrations'
                 )
+                """
+            ),
+            pool.fetchval("SELECT COUNT(*) FROM schema_migrations"),
+            pool.fetch(
+                """
+                SELECT table_name
+                FROM information_schema.tables
+                WHERE table_schema = 'public'
+                ORDER BY table_name
+                """
+            ),
+        )
 
-                table_names = [row["table_name"] for row in tables]
+        # Verify schema_migrations table exists
+        assert exists is True
 
-                # Check for core tables
-                assert "route_updates" in table_names
-                assert "route_state" in table_names
-                assert "bmp_peers" in table_names
-                assert "peer_events" in table_names
-                assert "schema_migrations" in table_names
+        # Verify migrations were recorded
+        assert count == applied_count
 
-        finally:
-            await pool.close()
+        # Verify core tables exist
+        table_names = [row["table_name"] for row in tables]
 
-    @pytest.mark.asyncio
-    async def test_migration_system_idempotent(self, postgres_container) -> None:
+        # Check for core tables
+        assert "route_updates" in table_names
+        assert "route_state" in table_names
+        assert "bmp_peers" in table_names
+        assert "peer_events" in table_names
+        assert "schema_migrations" in table_names
+
+    async def test_migration_system_idempotent(self, fresh_db_pool) -> None:
         """Test that migrations are idempotent (can run multiple times)."""
-        connection_url = postgres_container.get_connection_url()
+        pool = fresh_db_pool
 
-        # Parse URL
-        import re
+        runner = MigrationRunner(pool)
 
-        match = re.match(
-            r"postgresql(?:\+\w+)?://([^:]+):([^@]+)@([^:]+):(\d+)/(.+)",
-            connection_url,
-        )
-        assert match is not None
-        user, password, host, port, database = match.groups()
-
-        # Create connection pool
-        pool = await asyncpg.create_pool(
-            host=host,
-            port=int(port),
-            database=database,
-            user=user,
-            password=password,
-            min_size=1,
-            max_size=2,
-        )
+        # Apply migrations first time
+        applied_count1 = await runner.apply_migrations()
+        assert applied_count1 > 0
 
-        try:
-            runner = MigrationRunner(pool)
-
-            # Apply migrations first time
-            applied_count1 = await runner.apply_migrations()
-            assert applied_count1 > 0
-
-            # Apply migrations second time - should be no-op
-            applied_count2 = await runner.apply_migrations()
-            assert applied_count2 == 0
-
-            # Verify data is preserved
-            async with pool.acquire() as conn:
-                # Insert test data
-                await conn.execute(
-                    """
-                    INSERT INTO bmp_peers (peer_ip, is_active)
-                    VALUES ('192.0.2.1', true)
-                    """
-                )
+        # Apply migrations second time - should be no-op
+        applied_count2 = await runner.apply_migrations()
+        assert applied_count2 == 0
 
-                count = await conn.fetchval("SELECT COUNT(*) FROM bmp_peers")
-                assert count == 1
+        # Verify data is preserved
+        await pool.execute(
+            """
+            INSERT INTO bmp_peers (peer_ip, is_active)
+            VALUES ('192.0.2.1', true)
+            """
+        )
 
-            # Run migrations again - data should still be there
-            applied_count3 = await runner.apply_migrations()
-            assert applied_count3 == 0
+        count = await pool.fetchval("SELECT COUNT(*) FROM bmp_peers")
+        assert count == 1
 
-            async with pool.acquire() as conn:
-                count = await conn.fetchval("SELECT COUNT(*) FROM bmp_peers")
-                assert count == 1
+        # Run migrations again - data should still be there
+        applied_count3 = await runner.apply_migrations()
+        assert applied_count3 == 0
 
-        finally:
-            await pool.close()
+        count = await pool.fetchval("SELECT COUNT(*) FROM bmp_peers")
+        assert count == 1
 
-    @pytest.mark.asyncio
-    async def test_migration_checksums_recorded(self, postgres_container) -> None:
+    async def test_migration_checksums_recorded(self, fresh_db_pool) -> None:
         """Test that migration checksums are recorded correctly."""
-        connection_url = postgres_container.get_connection_url()
-
-        # Parse URL
-        import re
-
-        match = re.match(
-            r"postgresql(?:\+\w+)?://([^:]+):([^@]+)@([^:]+):(\d+)/(.+)",
-            connection_url,
-        )
-        assert match is not None
-        user, password, host, port, database = match.groups()
-
-        # Create connection pool
-        pool = await asyncpg.create_pool(
-            host=host,
-            port=int(port),
-            database=database,
-            user=user,
-            password=password,
-            min_size=1,
-            max_size=2,
-        )
-
-        try:
-            runner = MigrationRunner(pool)
+        pool = fresh_db_pool
 
-            # Apply migrations
-            await runner.apply_migrations()
+        runner = MigrationRunner(pool)
 
-            # Verify checksums were recorded
-            async with pool.acquire() as conn:
-                migrations = await conn.fetch(
-                    """
-                    SELECT version, name, checksum, execution_time_ms
-                    FROM schema_migrations
-                    ORDER BY version
-                    """
-                )
+        # Apply migrations
+        await runner.apply_migrations()
 
-                # Should have at least bootstrap migration
-                assert len(migrations) >= 1
+        # Verify checksums were recorded
+        migrations = await pool.fetch(
+            """
+            SELECT version, name, checksum, execution_time_ms
+            FROM schema_migrations
+            ORDER BY version
+            """
+        )
 
-                # Verify checksum format (SHA256 hex = 64 chars)
-                for migration in migrations:
-                    assert len(migration["checksum"]) == 64
-                    assert migration["execution_time_ms"] >= 0
+        # Should have at least bootstrap migration
+        assert len(migrations) >= 1
 
-        finally:
-            await pool.close()
+        # Verify checksum format (SHA256 hex = 64 chars)
+        for migration in migrations:
+            assert len(migration["checksum"]) == 64
+            assert migration["execution_time_ms"] >= 0
 
-    @pytest.mark.asyncio
-    async def test_can_insert_data_after_migrations(self, postgres_container) -> None:
+    async def test_can_insert_data_after_migrations(self, fresh_db_pool) -> None:
         """Test that we can insert data after running migrations."""
-        connection_url = postgres_container.get_connection_url()
-
-        # Parse URL
-        import re
-
-        match = re.match(
-            r"postgresql(?:\+\w+)?://([^:]+):([^@]+)@([^:]+):(\d+)/(.+)",
-            connection_url,
-        )
-        assert match is not None
-        user, password, host, port, database = match.groups()
-
-        # Create connection pool
-        pool = await asyncpg.create_pool(
-            host=host,
-            port=int(port),
-            database=database,
-            user=user,
-            password=password,
-            min_size=1,
-            max_size=2,
-        )
+        pool = fresh_db_pool
 
-        try:
-            runner = MigrationRunner(pool)
+        runner = MigrationRunner(pool)
 
-            # Apply migrations
-            await runner.apply_migrations()
+        # Apply migrations
+        await runner.apply_migrations()
 
-            # Insert test data into all tables
-            async with pool.acquire() as conn:
-                # Insert BMP peer
-                await conn.execute(
-                    """
-                    INSERT INTO bmp_peers (peer_ip, is_active)
-                    VALUES ('192.0.2.1', true)
-                    """
-                )
-
-                # Insert peer event
-                await conn.execute(
-                    """
-                    INSERT INTO peer_events (peer_ip, event_type, time)
-                    VALUES ('192.0.2.1', 'peer_up', NOW())
-                    """
-                )
+        # Insert BMP peer
+        await pool.execute(
+            """
+            INSERT INTO bmp_peers (peer_ip, is_active)
+            VALUES ('192.0.2.1', true)
+            """
+        )
 
-                # Insert route update
-                await conn.execute(
-                    """
-                    INSERT INTO route_updates
-                    (time, bmp_peer_ip, bgp_peer_ip, family, prefix)
-                    VALUES
-                    (NOW(), '192.0.2.1', '198.51.100.1', 'ipv4_unicast', '10.0.0.0/24')
-                    """
-                )
+        # Insert peer event
+        await pool.execute(
+            """
+            INSERT INTO peer_events (peer_ip, event_type, time)
+            VALUES ('192.0.2.1', 'peer_up', NOW())
+            """
+        )
 
-                # Verify data
-                peer_count = await conn.fetchval("SELECT COUNT(*) FROM bmp_peers")
-                event_count = await conn.fetchval("SELECT COUNT(*) FROM peer_events")
-                route_count = await conn.fetchval("SELECT COUNT(*) FROM route_updates")
+        # Insert route update
+        await pool.execute(
+            """
+            INSERT INTO route_updates
+            (time, bmp_peer_ip, bgp_peer_ip, family, prefix)
+            VALUES
+            (NOW(), '192.0.2.1', '198.51.100.1', 'ipv4_unicast', '10.0.0.0/24')
+            """
+        )
 
-                assert peer_count == 1
-                assert event_count == 1
-                assert route_count == 1
+        # Verify data (independent queries run concurrently)
+        peer_count, event_count, route_count = await asyncio.gather(
+            pool.fetchval("SELECT COUNT(*) FROM bmp_peers"),
+            pool.fetchval("SELECT COUNT(*) FROM peer_events"),
+            pool.fetchval("SELECT COUNT(*) FROM route_updates"),
+        )
 
-        finally:
-            await pool.close()
+        assert peer_count == 1
+        assert event_count == 1
+        assert route_count == 1
@@ -0,0 +1,116 @@
+"""Performance tests for BMP/BGP message parsing throughput."""
+
+import struct
+import time
+
+from pybmpmon.protocol.bgp_parser import parse_bgp_update
+from pybmpmon.protocol.bmp_parser import (
+    parse_bmp_message,
+    parse_statistics_report_message,
+)
+
+
+def make_route_monitoring(per_peer_header: bytes, prefixes: int) -> bytes:
+    """
+    Build a Route Monitoring message carrying one IPv4 BGP UPDATE.
+
+    Args:
+        per_peer_header: Packed 42-byte BMP Per-Peer Header
+        prefixes: Number of /24 prefixes in the UPDATE's NLRI
+
+    Returns:
+        Complete BMP message bytes
+    """
+    path_attrs = (
+        b"\x40\x01\x01\x00"  # ORIGIN (IGP)
+        b"\x40\x02\x0a\x02\x02\x00\x00\xfd\xe8\x00\x00\xfd\xe9"  # AS_PATH
+        b"\x40\x03\x04\xc0\x00\x02\xfe"  # NEXT_HOP 192.0.2.254
+        b"\xc0\x08\x04\xfd\xe8\x00\x64"  # COMMUNITIES 65000:100
+    )
+    nlri = b"".join(bytes((24, 10, i >> 8, i & 0xFF)) for i in range(prefixes))
+    bgp_update = (
+        b"\xff" * 16
+        + struct.pack(">HBHH", 23 + len(path_attrs) + len(nlri), 2, 0, len(path_attrs))
+        + path_attrs
+        + nlri
+    )
+    body = per_peer_header + bgp_update
+    return struct.pack(">BIB", 3, 6 + len(body), 0) + body
+
+
+def make_statistics_report(per_peer_header: bytes, counters: int) -> bytes:
+    """
+    Build a Statistics Report message with 32-bit ROUTES_ADJ_RIB_IN counters.
+
+    Args:
+        per_peer_header: Packed 42-byte BMP Per-Peer Header
+        counters: Number of stats TLVs in the report
+
+    Returns:
+        Complete BMP message bytes
+    """
+    stat = struct.Struct(">HHI")
+    stats = b"".join(stat.pack(7, 4, i) for i in range(counters))
+    body = per_peer_header + struct.pack(">I", counters) + stats
+    return struct.pack(">BIB", 3, 6 + len(body), 1) + body
+
+
+def test_route_monitoring_parse_throughput(ipv4_per_peer_header: bytes) -> None:
+    """
+    Test Route Monitoring messages parse at 5k+ messages/sec.
+
+    Success criteria: Parse 10,000 messages (BMP framing plus the embedded
+    BGP UPDATE, 10 prefixes each) at >= 5,000 messages/sec
+    """
+    data = make_route_monitoring(ipv4_per_peer_header, prefixes=10)
+    num_messages = 10_000
+
+    start_time = time.perf_counter()
+
+    for _ in range(num_messages):
+        parsed = parse_bgp_update(parse_bmp_message(data).bgp_update)
+
+    elapsed = time.perf_counter() - start_time
+    throughput = num_messages / elapsed
+
+    print(f"\nParsed {num_messages:,} messages in {elapsed:.2f}s")
+    print(f"Throughput: {throughput:,.0f} messages/sec")
+
+    # Verify the last parse produced the full UPDATE
+    assert len(parsed.prefixes) == 10
+    assert parsed.as_path == [65000, 65001]
+
+    # Verify throughput meets requirement
+    assert (
+        throughput >= 5_000
+    ), f"Throughput {throughput:.0f} messages/sec is below target 5,000"
+
+
+def test_statistics_report_parse_throughput(ipv4_per_peer_header: bytes) -> None:
+    """
+    Test 100-counter Statistics Reports parse at 2k+ messages/sec.
+
+    Success criteria: Parse 5,000 messages at >= 2,000 messages/sec
+    """
+    data = make_statistics_report(ipv4_per_peer_header, counters=100)
+    num_messages = 5_000
+
+    start_time = time.perf_counter()
+
+    for _ in range(num_messages):
+        parsed = parse_statistics_report_message(data)
+
+    elapsed = time.perf_counter() - start_time
+    throughput = num_messages / elapsed
+
+    print(f"\nParsed {num_messages:,} messages in {elapsed:.2f}s")
+    print(f"Throughput: {throughput:,.0f} messages/sec")
+
+    # Verify the last parse decoded every counter
+    assert parsed.stats_count == 100
+    assert parsed.stats_tlvs[-1].stat_value == 99
+
+    # Verify throughput meets requirement
+    assert (
+        throughput >= 2_000
+    ), f"Throughput {throughput:.0f} messages/sec is below target 2,000"
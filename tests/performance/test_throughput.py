@@ -3,12 +3,35 @@
 import asyncio
 import time
 from datetime import UTC, datetime
+from ipaddress import ip_address
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from pybmpmon.database.batch_writer import BatchWriter
 from pybmpmon.models.route import RouteUpdate
 
 
+async def _noop_execute(query: str, *args: object) -> None:
+    """Stand-in for per-route state updates; records nothing."""
+
+
+def make_mock_pool() -> tuple[MagicMock, AsyncMock]:
+    """
+    Create a pool stub that doesn't actually write to the database.
+
+    Returns:
+        Tuple of (pool, connection); every acquire() yields the same
+        connection. copy_records_to_table is an AsyncMock so tests can count
+        flushes, while execute (called once per route) is a plain coroutine
+        so call recording doesn't dominate the throughput measurement.
+    """
+    conn = AsyncMock()
+    conn.execute = _noop_execute
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__.return_value = conn
+    return pool, conn
+
+
 @pytest.mark.asyncio
 async def test_batch_writer_throughput():
     """
@@ -16,59 +39,51 @@ async def test_batch_writer_throughput():
 
     Success criteria: Process 50,000 routes with throughput >= 15,000 routes/sec
     """
-
-    # Create mock pool that doesn't actually write to database
-    class MockConnection:
-        async def copy_records_to_table(self, table, records, columns):
-            # Simulate some processing time
-            await asyncio.sleep(0.001)  # 1ms per batch
-
-        async def execute(self, query, *args):
-            # Mock execute for route state updates
-            pass
-
-    class MockPoolContext:
-        def __init__(self, conn):
-            self.conn = conn
-
-        async def __aenter__(self):
-            return self.conn
-
-        async def __aexit__(self, *args):
-            pass
-
-    class MockPool:
-        def __init__(self):
-            self.conn = MockConnection()
-
-        def acquire(self):
-            return MockPoolContext(self.conn)
-
-    pool = MockPool()  # type: ignore[assignment]
+    pool, _conn = make_mock_pool()
     batch_writer = BatchWriter(pool, batch_size=1000, batch_timeout=0.5)
     await batch_writer.start()
 
     try:
-        # Generate 50k routes
+        # Precompute everything that doesn't depend on the route index
+        now = datetime.now(UTC)
+        octets = [str(n) for n in range(256)]
+        bmp_peer_ips = [ip_address(f"192.0.2.{o}") for o in octets]
+        bgp_peer_ips = [ip_address(f"198.51.100.{o}") for o in octets]
+        next_hops = [ip_address(f"203.0.113.{o}") for o in octets]
+        template = RouteUpdate(
+            time=now,
+            bmp_peer_ip="192.0.2.0",
+            bmp_peer_asn=65000,
+            bgp_peer_ip="198.51.100.0",
+            bgp_peer_asn=65001,
+            family="ipv4_unicast",
+            prefix="10.0.0.0/24",
+            next_hop="203.0.113.0",
+            as_path=[65000, 65001, 65002],
+            communities=["65000:100"],
+            med=100,
+            local_pref=200,
+            is_withdrawn=False,
+        )
+
+        # Generate 50k routes up front so only BatchWriter is timed
         num_routes = 50_000
+        routes = [
+            template.model_copy(
+                update={
+                    "bmp_peer_ip": bmp_peer_ips[i & 0xFF],
+                    "bgp_peer_ip": bgp_peer_ips[i & 0xFF],
+                    "prefix": f"10.{octets[(i >> 16) & 0xFF]}"
+                    f".{octets[(i >> 8) & 0xFF]}.{octets[i & 0xFF]}/24",
+                    "next_hop": next_hops[i & 0xFF],
+                }
+            )
+            for i in range(num_routes)
+        ]
+
         start_time = time.time()
 
-        for i in range(num_routes):
-            route = RouteUpdate(
-                time=datetime.now(UTC),
-                bmp_peer_ip=f"192.0.2.{i % 256}",
-                bmp_peer_asn=65000,
-                bgp_peer_ip=f"198.51.100.{i % 256}",
-                bgp_peer_asn=65001,
-                family="ipv4_unicast",
-                prefix=f"10.{(i >> 16) & 0xFF}.{(i >> 8) & 0xFF}.{i & 0xFF}/24",
-                next_hop=f"203.0.113.{i % 256}",
-                as_path=[65000, 65001, 65002],
-                communities=["65000:100"],
-                med=100,
-                local_pref=200,
-                is_withdrawn=False,
-            )
+        for route in routes:
             await batch_writer.add_route(route)
 
         # Wait for final flush
@@ -97,56 +112,27 @@ async def test_batch_writer_throughput():
 async def test_batch_writer_timeout_flush():
     """Test that batch writer flushes on timeout even if batch not full."""
 
-    class MockConnection:
-        def __init__(self, pool):
-            self.pool = pool
-
-        async def copy_records_to_table(self, table, records, columns):
-            self.pool.flush_count += 1
-
-        async def execute(self, query, *args):
-            # Mock execute for route state updates
-            pass
-
-    class MockPoolContext:
-        def __init__(self, conn):
-            self.conn = conn
-
-        async def __aenter__(self):
-            return self.conn
-
-        async def __aexit__(self, *args):
-            pass
-
-    class MockPool:
-        def __init__(self):
-            self.flush_count = 0
-            self.conn = MockConnection(self)
-
-        def acquire(self):
-            return MockPoolContext(self.conn)
-
-    pool = MockPool()  # type: ignore[assignment]
+    pool, conn = make_mock_pool()
     batch_writer = BatchWriter(pool, batch_size=1000, batch_timeout=0.2)
     await batch_writer.start()
 
     try:
         # Add only 100 routes (less than batch size)
+        template = RouteUpdate(
+            time=datetime.now(UTC),
+            bmp_peer_ip="192.0.2.1",
+            bgp_peer_ip="198.51.100.1",
+            family="ipv4_unicast",
+        )
         for i in range(100):
-            route = RouteUpdate(
-                time=datetime.now(UTC),
-                bmp_peer_ip="192.0.2.1",
-                bgp_peer_ip="198.51.100.1",
-                family="ipv4_unicast",
-                prefix=f"10.0.{i}.0/24",
-            )
+            route = template.model_copy(update={"prefix": f"10.0.{i}.0/24"})
             await batch_writer.add_route(route)
 
         # Wait for timeout to trigger flush
         await asyncio.sleep(0.3)
 
         # Verify flush happened
-        assert pool.flush_count >= 1
+        assert conn.copy_records_to_table.call_count >= 1
         assert batch_writer.total_routes_written == 100
 
     finally:
@@ -157,53 +143,24 @@ async def test_batch_writer_timeout_flush():
 async def test_batch_writer_size_flush():
     """Test that batch writer flushes when batch size is reached."""
 
-    class MockConnection:
-        def __init__(self, pool):
-            self.pool = pool
-
-        async def copy_records_to_table(self, table, records, columns):
-            self.pool.flush_count += 1
-
-        async def execute(self, query, *args):
-            # Mock execute for route state updates
-            pass
-
-    class MockPoolContext:
-        def __init__(self, conn):
-            self.conn = conn
-
-        async def __aenter__(self):
-            return self.conn
-
-        async def __aexit__(self, *args):
-            pass
-
-    class MockPool:
-        def __init__(self):
-            self.flush_count = 0
-            self.conn = MockConnection(self)
-
-        def acquire(self):
-            return MockPoolContext(self.conn)
-
-    pool = MockPool()  # type: ignore[assignment]
+    pool, conn = make_mock_pool()
     batch_writer = BatchWriter(pool, batch_size=100, batch_timeout=10.0)
     await batch_writer.start()
 
     try:
         # Add exactly 100 routes (batch size)
+        template = RouteUpdate(
+            time=datetime.now(UTC),
+            bmp_peer_ip="192.0.2.1",
+            bgp_peer_ip="198.51.100.1",
+            family="ipv4_unicast",
+        )
         for i in range(100):
-            route = RouteUpdate(
-                time=datetime.now(UTC),
-                bmp_peer_ip="192.0.2.1",
-                bgp_peer_ip="198.51.100.1",
-                family="ipv4_unicast",
-                prefix=f"10.0.{i}.0/24",
-            )
+            route = template.model_copy(update={"prefix": f"10.0.{i}.0/24"})
             await batch_writer.add_route(route)
 
         # Verify flush happened immediately (no need to wait for timeout)
-        assert pool.flush_count == 1
+        assert conn.copy_records_to_table.call_count == 1
         assert batch_writer.total_routes_written == 100
         assert len(batch_writer.batch) == 0  # Batch should be empty
 
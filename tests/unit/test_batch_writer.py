@@ -0,0 +1,87 @@
+"""Unit tests for BatchWriter flush behavior."""
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+import pytest_asyncio
+from pybmpmon.database.batch_writer import BatchWriter
+from pybmpmon.models.route import RouteUpdate
+
+# Share one event loop across the module instead of one per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+FIXED_ROUTE = RouteUpdate(
+    time=datetime(2024, 1, 1, tzinfo=UTC),
+    bmp_peer_ip="192.0.2.1",
+    bgp_peer_ip="198.51.100.1",
+    family="ipv4_unicast",
+    prefix="10.0.0.0/24",
+)
+
+
+# Mock database pool whose COPY always fails
+class FailingConnection:
+    async def copy_records_to_table(self, table, records, columns):
+        raise RuntimeError("copy failed")
+
+    async def execute(self, query, *args):
+        pass
+
+
+class MockPoolContext:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class FailingPool:
+    def __init__(self):
+        self.conn = FailingConnection()
+
+    def acquire(self):
+        return MockPoolContext(self.conn)
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def failing_writer():
+    """Provide a started batch writer whose writes always fail."""
+    writer = BatchWriter(FailingPool(), batch_size=10, batch_timeout=60.0)
+    await writer.start()
+    yield writer
+    await writer.stop()
+
+
+async def test_failed_flush_sets_flush_signal(failing_writer):
+    """Test that a failed flush drops the batch and still sets the signal."""
+    await failing_writer.add_route(FIXED_ROUTE)
+    assert not failing_writer.flush_signal.is_set()
+
+    with pytest.raises(RuntimeError, match="copy failed"):
+        await failing_writer.flush()
+
+    assert failing_writer.batch == []
+    assert failing_writer.total_batches_written == 0
+    assert failing_writer.flush_signal.is_set()
+
+
+async def test_wait_flushed_raises_flush_error(failing_writer):
+    """Test that a waiter gets the flush error instead of timing out."""
+    await failing_writer.add_route(FIXED_ROUTE)
+    waiter = asyncio.create_task(failing_writer.wait_flushed(timeout=5.0))
+    await asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError, match="copy failed"):
+        await failing_writer.flush()
+
+    with pytest.raises(RuntimeError, match="copy failed"):
+        await waiter
+
+    # Later callers see the failure too, until a new batch starts
+    with pytest.raises(RuntimeError, match="copy failed"):
+        await failing_writer.wait_flushed(timeout=5.0)
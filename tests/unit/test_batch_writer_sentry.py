@@ -1,168 +1,159 @@
 """Unit tests for BatchWriter Sentry span integration."""
 
-import asyncio
 from datetime import UTC, datetime
-from unittest import mock
 
 import pytest
+import pytest_asyncio
 from pybmpmon.database.batch_writer import BatchWriter
 from pybmpmon.models.route import RouteUpdate
 from pybmpmon.monitoring import sentry_helper
 
+# Share one event loop across the module instead of one per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.mark.asyncio
-async def test_batch_writer_creates_sentry_span():
+# The tests only count routes, so one validated route is reused throughout
+FIXED_ROUTE = RouteUpdate(
+    time=datetime(2024, 1, 1, tzinfo=UTC),
+    bmp_peer_ip="192.0.2.1",
+    bgp_peer_ip="198.51.100.1",
+    family="ipv4_unicast",
+    prefix="10.0.0.0/24",
+)
+
+
+# Mock database pool shared by the tests
+class MockConnection:
+    async def copy_records_to_table(self, table, records, columns):
+        pass
+
+    async def execute(self, query, *args):
+        # Mock execute for route state updates
+        pass
+
+
+class MockPoolContext:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class MockPool:
+    def __init__(self):
+        self.conn = MockConnection()
+
+    def acquire(self):
+        return MockPoolContext(self.conn)
+
+
+# Minimal Sentry SDK stand-in recording only what BatchWriter uses
+class FakeSpan:
+    def __init__(self):
+        self.data = {}
+
+    def set_data(self, key, value):
+        self.data[key] = value
+
+
+class FakeSpanContext:
+    def __init__(self, span):
+        self.span = span
+
+    def __enter__(self):
+        return self.span
+
+    def __exit__(self, *args):
+        pass
+
+
+class FakeSentrySDK:
+    def __init__(self):
+        self.span = FakeSpan()
+        self.spans = []
+
+    def start_span(self, op, description):
+        self.spans.append((op, description))
+        return FakeSpanContext(self.span)
+
+
+@pytest.fixture(scope="session")
+def mock_pool():
+    """Provide a mock database pool; it holds no state, so one is shared."""
+    return MockPool()  # type: ignore[return-value]
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def batch_writer(mock_pool):
+    """Provide a started batch writer on the module's shared event loop."""
+    writer = BatchWriter(mock_pool, batch_size=10, batch_timeout=0.1)
+    await writer.start()
+    yield writer
+    await writer.stop()
+
+
+async def test_batch_writer_creates_sentry_span(batch_writer, monkeypatch):
     """Test that batch writer creates a Sentry span with correct data."""
-    # Setup mock Sentry SDK
-    mock_sentry_sdk = mock.MagicMock()
-    mock_span = mock.MagicMock()
-    mock_sentry_sdk.start_span.return_value.__enter__.return_value = mock_span
-
-    # Enable Sentry
-    sentry_helper._sentry_enabled = True
-    sentry_helper._sentry_sdk = mock_sentry_sdk
-
-    try:
-        # Create mock connection
-        class MockConnection:
-            async def copy_records_to_table(self, table, records, columns):
-                # Simulate some processing time
-                await asyncio.sleep(0.001)
-
-            async def execute(self, query, *args):
-                # Mock execute for route state updates
-                pass
-
-        class MockPoolContext:
-            def __init__(self, conn):
-                self.conn = conn
-
-            async def __aenter__(self):
-                return self.conn
-
-            async def __aexit__(self, *args):
-                pass
-
-        class MockPool:
-            def __init__(self):
-                self.conn = MockConnection()
-
-            def acquire(self):
-                return MockPoolContext(self.conn)
-
-        pool = MockPool()  # type: ignore[assignment]
-        batch_writer = BatchWriter(pool, batch_size=10, batch_timeout=0.1)
-        await batch_writer.start()
-
-        try:
-            # Add some routes
-            for i in range(5):
-                route = RouteUpdate(
-                    time=datetime.now(UTC),
-                    bmp_peer_ip="192.0.2.1",
-                    bgp_peer_ip="198.51.100.1",
-                    family="ipv4_unicast",
-                    prefix=f"10.0.{i}.0/24",
-                )
-                await batch_writer.add_route(route)
-
-            # Flush to trigger span creation
-            await batch_writer.flush()
-
-            # Verify span was created
-            mock_sentry_sdk.start_span.assert_called_once()
-            call_args = mock_sentry_sdk.start_span.call_args
-
-            # Verify span operation and description
-            assert call_args[1]["op"] == "db.batch_write"
-            assert call_args[1]["description"] == "Batch write routes to database"
-
-            # Verify span data was set
-            mock_span.set_data.assert_any_call("batch.routes_count", 5)
-            mock_span.set_data.assert_any_call("db.table", "route_updates")
-            mock_span.set_data.assert_any_call("db.operation", "COPY")
-
-            # Verify all span data keys are present
-            set_data_calls = [call[0][0] for call in mock_span.set_data.call_args_list]
-
-            # Batch-level metrics
-            assert "batch.routes_count" in set_data_calls
-            assert "batch.duration_ms" in set_data_calls
-            assert "batch.routes_per_second" in set_data_calls
-            assert "batch.size_max" in set_data_calls
-            assert "batch.utilization_percent" in set_data_calls
-            assert "batch.flush_trigger" in set_data_calls
-            assert "batch.wait_time_ms" in set_data_calls
-
-            # Cumulative metrics
-            assert "total.routes_written" in set_data_calls
-            assert "total.batches_written" in set_data_calls
-            assert "total.avg_batch_size" in set_data_calls
-
-            # Database metadata
-            assert "db.table" in set_data_calls
-            assert "db.operation" in set_data_calls
-
-        finally:
-            await batch_writer.stop()
-
-    finally:
-        # Cleanup
-        sentry_helper._sentry_enabled = False
-        sentry_helper._sentry_sdk = None
-
-
-@pytest.mark.asyncio
-async def test_batch_writer_works_without_sentry():
+    # Setup fake Sentry SDK
+    fake_sentry_sdk = FakeSentrySDK()
+
+    # Enable Sentry (restored by monkeypatch after the test)
+    monkeypatch.setattr(sentry_helper, "_sentry_enabled", True)
+    monkeypatch.setattr(sentry_helper, "_sentry_sdk", fake_sentry_sdk)
+
+    # Add some routes
+    for _ in range(5):
+        await batch_writer.add_route(FIXED_ROUTE)
+
+    # Flush to trigger span creation
+    await batch_writer.flush()
+
+    # Verify exactly one span was created with the right operation/description
+    assert fake_sentry_sdk.spans == [
+        ("db.batch_write", "Batch write routes to database")
+    ]
+
+    # Verify span data was set
+    span_data = fake_sentry_sdk.span.data
+    assert span_data["batch.routes_count"] == 5
+    assert span_data["db.table"] == "route_updates"
+    assert span_data["db.operation"] == "COPY"
+
+    # Verify all span data keys are present
+    assert {
+        # Batch-level metrics
+        "batch.routes_count",
+        "batch.duration_ms",
+        "batch.routes_per_second",
+        "batch.size_max",
+        "batch.utilization_percent",
+        "batch.flush_trigger",
+        "batch.wait_time_ms",
+        # Cumulative metrics
+        "total.routes_written",
+        "total.batches_written",
+        "total.avg_batch_size",
+        # Database metadata
+        "db.table",
+        "db.operation",
+    } <= span_data.keys()
+
+
+async def test_batch_writer_works_without_sentry(batch_writer, monkeypatch):
     """Test that batch writer works correctly when Sentry is disabled."""
     # Ensure Sentry is disabled
-    sentry_helper._sentry_enabled = False
-    sentry_helper._sentry_sdk = None
-
-    # Create mock connection
-    class MockConnection:
-        async def copy_records_to_table(self, table, records, columns):
-            await asyncio.sleep(0.001)
-
-        async def execute(self, query, *args):
-            pass
-
-    class MockPoolContext:
-        def __init__(self, conn):
-            self.conn = conn
-
-        async def __aenter__(self):
-            return self.conn
-
-        async def __aexit__(self, *args):
-            pass
-
-    class MockPool:
-        def __init__(self):
-            self.conn = MockConnection()
-
-        def acquire(self):
-            return MockPoolContext(self.conn)
-
-    pool = MockPool()  # type: ignore[assignment]
-    batch_writer = BatchWriter(pool, batch_size=10, batch_timeout=0.1)
-    await batch_writer.start()
-
-    try:
-        # Add and flush routes
-        route = RouteUpdate(
-            time=datetime.now(UTC),
-            bmp_peer_ip="192.0.2.1",
-            bgp_peer_ip="198.51.100.1",
-            family="ipv4_unicast",
-            prefix="10.0.0.0/24",
-        )
-        await batch_writer.add_route(route)
-        await batch_writer.flush()
-
-        # Verify it worked
-        assert batch_writer.total_routes_written == 1
-        assert batch_writer.total_batches_written == 1
-
-    finally:
-        await batch_writer.stop()
+    monkeypatch.setattr(sentry_helper, "_sentry_enabled", False)
+    monkeypatch.setattr(sentry_helper, "_sentry_sdk", None)
+
+    # Add and flush routes
+    await batch_writer.add_route(FIXED_ROUTE)
+    assert not batch_writer.flush_signal.is_set()
+    await batch_writer.flush()
+
+    # Verify it worked
+    assert batch_writer.total_routes_written == 1
+    assert batch_writer.total_batches_written == 1
+    assert batch_writer.flush_signal.is_set()
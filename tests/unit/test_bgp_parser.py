@@ -1,7 +1,13 @@
 """Unit tests for BGP UPDATE message parsing."""
 
+import struct
+from ipaddress import IPv6Address, IPv6Network
+from typing import Any
+
 import pytest
 from pybmpmon.protocol.bgp import (
+    BGP_HEADER_SIZE,
+    BGP_MARKER,
     AddressFamilyIdentifier,
     BGPMessageType,
     BGPParseError,
@@ -21,6 +27,21 @@ from pybmpmon.protocol.bgp_parser import (
 )
 
 
+def _build_update(
+    withdrawn: bytes = b"", path_attrs: bytes = b"", nlri: bytes = b""
+) -> bytes:
+    """Assemble a BGP UPDATE message from its three variable-length sections."""
+    body = (
+        struct.pack(">H", len(withdrawn))
+        + withdrawn
+        + struct.pack(">H", len(path_attrs))
+        + path_attrs
+        + nlri
+    )
+    header = struct.pack(">HB", BGP_HEADER_SIZE + len(body), BGPMessageType.UPDATE)
+    return BGP_MARKER + header + body
+
+
 class TestBGPHeader:
     """Test BGP header parsing."""
 
@@ -57,37 +78,19 @@ class TestBGPHeader:
 class TestIPv4Prefix:
     """Test IPv4 prefix parsing."""
 
-    def test_parse_ipv4_prefix_24(self) -> None:
-        """Test parsing /24 prefix."""
-        data = b"\x18\xc0\xa8\x01"  # 192.168.1.0/24
-        prefix, consumed = parse_ipv4_prefix(data, 0)
-
-        assert prefix == "192.168.1.0/24"
-        assert consumed == 4
-
-    def test_parse_ipv4_prefix_32(self) -> None:
-        """Test parsing /32 prefix (host route)."""
-        data = b"\x20\xc0\x00\x02\x01"  # 192.0.2.1/32
-        prefix, consumed = parse_ipv4_prefix(data, 0)
-
-        assert prefix == "192.0.2.1/32"
-        assert consumed == 5
-
-    def test_parse_ipv4_prefix_8(self) -> None:
-        """Test parsing /8 prefix."""
-        data = b"\x08\x0a"  # 10.0.0.0/8
-        prefix, consumed = parse_ipv4_prefix(data, 0)
-
-        assert prefix == "10.0.0.0/8"
-        assert consumed == 2
-
-    def test_parse_ipv4_prefix_0(self) -> None:
-        """Test parsing default route /0."""
-        data = b"\x00"  # 0.0.0.0/0
-        prefix, consumed = parse_ipv4_prefix(data, 0)
-
-        assert prefix == "0.0.0.0/0"
-        assert consumed == 1
+    @pytest.mark.parametrize(
+        ("data", "expected", "consumed"),
+        [
+            (b"\x18\xc0\xa8\x01", "192.168.1.0/24", 4),
+            (b"\x20\xc0\x00\x02\x01", "192.0.2.1/32", 5),  # Host route
+            (b"\x08\x0a", "10.0.0.0/8", 2),
+            (b"\x00", "0.0.0.0/0", 1),  # Default route
+        ],
+        ids=["prefix_24", "prefix_32", "prefix_8", "prefix_0"],
+    )
+    def test_parse_ipv4_prefix(self, data: bytes, expected: str, consumed: int) -> None:
+        """Test parsing IPv4 prefixes of various lengths."""
+        assert parse_ipv4_prefix(data, 0) == (expected, consumed)
 
     def test_parse_ipv4_prefix_invalid_length(self) -> None:
         """Test error with invalid prefix length."""
@@ -100,25 +103,48 @@ class TestIPv4Prefix:
 class TestIPv6Prefix:
     """Test IPv6 prefix parsing."""
 
-    def test_parse_ipv6_prefix_48(self) -> None:
-        """Test parsing /48 prefix."""
-        data = b"\x30\x20\x01\x0d\xb8\x00\x00"  # 2001:db8::/48
-        prefix, consumed = parse_ipv6_prefix(data, 0)
-
-        assert prefix == "2001:db8::/48"
-        assert consumed == 7
-
-    def test_parse_ipv6_prefix_128(self) -> None:
-        """Test parsing /128 prefix (host route)."""
-        data = (
-            b"\x80"
-            + b"\x20\x01\x0d\xb8\x00\x00\x00\x00"
-            + b"\x00\x00\x00\x00\x00\x00\x00\x01"
-        )  # 2001:db8::1/128
-        prefix, consumed = parse_ipv6_prefix(data, 0)
-
-        assert prefix == "2001:db8::1/128"
-        assert consumed == 17
+    @pytest.mark.parametrize(
+        ("data", "expected", "consumed"),
+        [
+            (b"\x30\x20\x01\x0d\xb8\x00\x00", "2001:db8::/48", 7),
+            (
+                b"\x80"
+                + b"\x20\x01\x0d\xb8\x00\x00\x00\x00"
+                + b"\x00\x00\x00\x00\x00\x00\x00\x01",
+                "2001:db8::1/128",  # Host route
+                17,
+            ),
+            # First 80 bits zero: formatted by ipaddress, whose output for
+            # IPv4-mapped/compatible addresses differs from inet_ntop
+            (
+                b"\x80" + IPv6Address("::ffff:c000:201").packed,
+                str(IPv6Network("::ffff:c000:201/128")),
+                17,
+            ),
+            (
+                b"\x80" + IPv6Address("::c000:201").packed,
+                str(IPv6Network("::c000:201/128")),
+                17,
+            ),
+            (
+                b"\x60" + IPv6Address("::ffff:0:0").packed[:12],
+                str(IPv6Network("::ffff:0:0/96")),
+                13,
+            ),
+            (b"\x00", "::/0", 1),  # Default route
+        ],
+        ids=[
+            "prefix_48",
+            "prefix_128",
+            "ipv4_mapped",
+            "ipv4_compatible",
+            "ipv4_mapped_96",
+            "default",
+        ],
+    )
+    def test_parse_ipv6_prefix(self, data: bytes, expected: str, consumed: int) -> None:
+        """Test parsing IPv6 prefixes of various lengths."""
+        assert parse_ipv6_prefix(data, 0) == (expected, consumed)
 
     def test_parse_ipv6_prefix_invalid_length(self) -> None:
         """Test error with invalid prefix length."""
@@ -131,30 +157,20 @@ class TestIPv6Prefix:
 class TestASPath:
     """Test AS_PATH parsing."""
 
-    def test_parse_as_path_sequence(self) -> None:
-        """Test parsing AS_SEQUENCE."""
-        # AS_SEQUENCE with 3 ASNs: 65000, 65001, 65002
-        data = b"\x02\x03\xfd\xe8\xfd\xe9\xfd\xea"
-        as_path = parse_as_path(data)
-
-        assert as_path == [65000, 65001, 65002]
-
-    def test_parse_as_path_empty(self) -> None:
-        """Test parsing empty AS_PATH."""
-        data = b""
-        as_path = parse_as_path(data)
-
-        assert as_path == []
-
-    def test_parse_as_path_set(self) -> None:
-        """Test parsing AS_SET."""
-        # AS_SET with 2 ASNs
-        data = b"\x01\x02\xfd\xe8\xfd\xe9"
-        as_path = parse_as_path(data)
-
-        assert len(as_path) == 2
-        assert 65000 in as_path
-        assert 65001 in as_path
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            # AS_SEQUENCE with 3 ASNs: 65000, 65001, 65002
+            (b"\x02\x03\xfd\xe8\xfd\xe9\xfd\xea", [65000, 65001, 65002]),
+            (b"", []),
+            # AS_SET with 2 ASNs
+            (b"\x01\x02\xfd\xe8\xfd\xe9", [65000, 65001]),
+        ],
+        ids=["sequence", "empty", "set"],
+    )
+    def test_parse_as_path(self, data: bytes, expected: list[int]) -> None:
+        """Test parsing AS_PATH segments."""
+        assert parse_as_path(data) == expected
 
     def test_parse_as_path_truncated(self) -> None:
         """Test error with truncated AS_PATH."""
@@ -167,21 +183,17 @@ class TestASPath:
 class TestCommunities:
     """Test COMMUNITIES parsing."""
 
-    def test_parse_communities_single(self) -> None:
-        """Test parsing single community."""
-        # Community 65000:100
-        data = b"\xfd\xe8\x00\x64"
-        communities = parse_communities(data)
-
-        assert communities == ["65000:100"]
-
-    def test_parse_communities_multiple(self) -> None:
-        """Test parsing multiple communities."""
-        # Communities: 65000:100, 65000:200
-        data = b"\xfd\xe8\x00\x64\xfd\xe8\x00\xc8"
-        communities = parse_communities(data)
-
-        assert communities == ["65000:100", "65000:200"]
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            (b"\xfd\xe8\x00\x64", ["65000:100"]),
+            (b"\xfd\xe8\x00\x64\xfd\xe8\x00\xc8", ["65000:100", "65000:200"]),
+        ],
+        ids=["single", "multiple"],
+    )
+    def test_parse_communities(self, data: bytes, expected: list[str]) -> None:
+        """Test parsing one or more communities."""
+        assert parse_communities(data) == expected
 
     def test_parse_communities_invalid_length(self) -> None:
         """Test error with invalid length."""
@@ -235,6 +247,23 @@ class TestMPReachNLRI:
         assert next_hop == "2001:db8::"
         assert prefixes == ["2001:db8::/32"]
 
+    def test_parse_mp_reach_ipv4_mapped(self) -> None:
+        """Test IPv4-mapped next hop and prefix format like ipaddress."""
+        data = (
+            b"\x00\x02"  # AFI = IPv6
+            b"\x01"  # SAFI = unicast
+            b"\x10"  # Next hop length = 16
+            + IPv6Address("::ffff:c000:201").packed
+            + b"\x00"  # Reserved
+            + b"\x80"
+            + IPv6Address("::ffff:c000:202").packed  # Prefix = /128
+        )
+
+        _, _, next_hop, prefixes = parse_mp_reach_nlri(data)
+
+        assert next_hop == str(IPv6Address("::ffff:c000:201"))
+        assert prefixes == [str(IPv6Network("::ffff:c000:202/128"))]
+
 
 class TestMPUnreachNLRI:
     """Test MP_UNREACH_NLRI parsing."""
@@ -268,166 +297,79 @@ class TestMPUnreachNLRI:
         assert prefixes == ["2001:db8::/48"]
 
 
-class TestBGPUpdate:
-    """Test complete BGP UPDATE parsing."""
-
-    def test_parse_ipv4_update_with_attributes(self) -> None:
-        """Test parsing IPv4 UPDATE with path attributes."""
-        # Build a minimal UPDATE message
-        data = bytearray()
-
-        # BGP header
-        data.extend(b"\xff" * 16)  # Marker
-        data.extend(b"\x00\x00")  # Length (will update)
-        data.extend(b"\x02")  # Type = UPDATE
-
-        # UPDATE message
-        data.extend(b"\x00\x00")  # Withdrawn routes length = 0
-
-        # Path attributes
-        path_attrs = bytearray()
-
-        # ORIGIN (type=1, IGP=0)
-        path_attrs.extend(b"\x40\x01\x01\x00")  # Flags, type, len, value
-
-        # AS_PATH (type=2, sequence of 65000)
-        path_attrs.extend(b"\x40\x02\x04\x02\x01\xfd\xe8")  # AS_SEQUENCE, 1 AS (len=4)
-
-        # NEXT_HOP (type=3, 192.0.2.254)
-        path_attrs.extend(b"\x40\x03\x04\xc0\x00\x02\xfe")
-
-        # Total path attributes length
-        data.extend(len(path_attrs).to_bytes(2, "big"))
-        data.extend(path_attrs)
-
-        # NLRI: 10.0.0.0/8
-        data.extend(b"\x08\x0a")
-
-        # Update message length in header
-        data[16:18] = len(data).to_bytes(2, "big")
-
-        parsed = parse_bgp_update(bytes(data))
-
-        assert parsed.afi == AddressFamilyIdentifier.IPV4
-        assert parsed.safi == SubsequentAddressFamilyIdentifier.UNICAST
-        assert parsed.prefixes == ["10.0.0.0/8"]
-        assert parsed.withdrawn_prefixes == []
-        assert parsed.is_withdrawal is False
-        assert parsed.origin == 0
-        assert parsed.as_path == [65000]
-        assert parsed.next_hop == "192.0.2.254"
-
-    def test_parse_ipv4_withdrawal(self) -> None:
-        """Test parsing IPv4 withdrawal."""
-        data = bytearray()
-
-        # BGP header
-        data.extend(b"\xff" * 16)
-        data.extend(b"\x00\x00")  # Length
-        data.extend(b"\x02")  # UPDATE
-
-        # Withdrawn routes: 10.0.0.0/8
-        withdrawn = b"\x08\x0a"
-        data.extend(len(withdrawn).to_bytes(2, "big"))
-        data.extend(withdrawn)
-
-        # No path attributes
-        data.extend(b"\x00\x00")
-
-        # No NLRI
-
-        # Update length
-        data[16:18] = len(data).to_bytes(2, "big")
-
-        parsed = parse_bgp_update(bytes(data))
-
-        assert parsed.prefixes == []
-        assert parsed.withdrawn_prefixes == ["10.0.0.0/8"]
-        assert parsed.is_withdrawal is True
-
-    def test_parse_update_with_communities(self) -> None:
-        """Test parsing UPDATE with COMMUNITIES attribute."""
-        data = bytearray()
-
-        # BGP header
-        data.extend(b"\xff" * 16)
-        data.extend(b"\x00\x00")
-        data.extend(b"\x02")
-
-        data.extend(b"\x00\x00")  # No withdrawn routes
-
-        # Path attributes
-        path_attrs = bytearray()
+# Path attributes shared by the UPDATE cases below (flags, type, len, value)
+_ORIGIN_IGP = b"\x40\x01\x01\x00"
+_ASPATH_EMPTY = b"\x40\x02\x00"
+_ASPATH_65000 = b"\x40\x02\x04\x02\x01\xfd\xe8"  # AS_SEQUENCE, 1 AS (len=4)
+_NEXT_HOP_254 = b"\x40\x03\x04\xc0\x00\x02\xfe"  # 192.0.2.254
 
-        # ORIGIN
-        path_attrs.extend(b"\x40\x01\x01\x00")
 
-        # AS_PATH (empty)
-        path_attrs.extend(b"\x40\x02\x00")
-
-        # NEXT_HOP
-        path_attrs.extend(b"\x40\x03\x04\xc0\x00\x02\xfe")
-
-        # COMMUNITIES (65000:100, 65000:200)
-        path_attrs.extend(
-            b"\xc0\x08\x08"  # Flags, type, len
-            b"\xfd\xe8\x00\x64"  # 65000:100
-            b"\xfd\xe8\x00\xc8"  # 65000:200
-        )
-
-        data.extend(len(path_attrs).to_bytes(2, "big"))
-        data.extend(path_attrs)
-
-        # NLRI
-        data.extend(b"\x18\xc0\xa8\x01")  # 192.168.1.0/24
-
-        data[16:18] = len(data).to_bytes(2, "big")
-
-        parsed = parse_bgp_update(bytes(data))
-
-        assert parsed.communities == ["65000:100", "65000:200"]
-        assert parsed.prefixes == ["192.168.1.0/24"]
-
-    def test_parse_update_with_med_local_pref(self) -> None:
-        """Test parsing UPDATE with MED and LOCAL_PREF."""
-        data = bytearray()
-
-        # BGP header
-        data.extend(b"\xff" * 16)
-        data.extend(b"\x00\x00")
-        data.extend(b"\x02")
-
-        data.extend(b"\x00\x00")  # No withdrawn
-
-        path_attrs = bytearray()
-
-        # ORIGIN
-        path_attrs.extend(b"\x40\x01\x01\x00")
-
-        # AS_PATH
-        path_attrs.extend(b"\x40\x02\x00")
-
-        # NEXT_HOP
-        path_attrs.extend(b"\x40\x03\x04\xc0\x00\x02\xfe")
-
-        # MED (type=4, value=100)
-        path_attrs.extend(b"\x80\x04\x04\x00\x00\x00\x64")
-
-        # LOCAL_PREF (type=5, value=200)
-        path_attrs.extend(b"\x40\x05\x04\x00\x00\x00\xc8")
-
-        data.extend(len(path_attrs).to_bytes(2, "big"))
-        data.extend(path_attrs)
-
-        # NLRI
-        data.extend(b"\x08\x0a")
-
-        data[16:18] = len(data).to_bytes(2, "big")
-
-        parsed = parse_bgp_update(bytes(data))
+class TestBGPUpdate:
+    """Test complete BGP UPDATE parsing."""
 
-        assert parsed.med == 100
-        assert parsed.local_pref == 200
+    @pytest.mark.parametrize(
+        ("withdrawn", "path_attrs", "nlri", "expected"),
+        [
+            pytest.param(
+                b"",
+                _ORIGIN_IGP + _ASPATH_65000 + _NEXT_HOP_254,
+                b"\x08\x0a",  # 10.0.0.0/8
+                {
+                    "afi": AddressFamilyIdentifier.IPV4,
+                    "safi": SubsequentAddressFamilyIdentifier.UNICAST,
+                    "prefixes": ["10.0.0.0/8"],
+                    "withdrawn_prefixes": [],
+                    "is_withdrawal": False,
+                    "origin": 0,
+                    "as_path": [65000],
+                    "next_hop": "192.0.2.254",
+                },
+                id="ipv4_update_with_attributes",
+            ),
+            pytest.param(
+                b"\x08\x0a",  # 10.0.0.0/8, no path attributes, no NLRI
+                b"",
+                b"",
+                {
+                    "prefixes": [],
+                    "withdrawn_prefixes": ["10.0.0.0/8"],
+                    "is_withdrawal": True,
+                },
+                id="ipv4_withdrawal",
+            ),
+            pytest.param(
+                b"",
+                _ORIGIN_IGP + _ASPATH_EMPTY + _NEXT_HOP_254
+                # COMMUNITIES (65000:100, 65000:200)
+                + b"\xc0\x08\x08\xfd\xe8\x00\x64\xfd\xe8\x00\xc8",
+                b"\x18\xc0\xa8\x01",  # 192.168.1.0/24
+                {
+                    "communities": ["65000:100", "65000:200"],
+                    "prefixes": ["192.168.1.0/24"],
+                },
+                id="communities",
+            ),
+            pytest.param(
+                b"",
+                _ORIGIN_IGP
+                + _ASPATH_EMPTY
+                + _NEXT_HOP_254
+                + b"\x80\x04\x04\x00\x00\x00\x64"  # MED (type=4, value=100)
+                + b"\x40\x05\x04\x00\x00\x00\xc8",  # LOCAL_PREF (type=5, 200)
+                b"\x08\x0a",  # 10.0.0.0/8
+                {"med": 100, "local_pref": 200},
+                id="med_local_pref",
+            ),
+        ],
+    )
+    def test_parse_update(
+        self, withdrawn: bytes, path_attrs: bytes, nlri: bytes, expected: dict[str, Any]
+    ) -> None:
+        """Test parsing UPDATEs and the fields extracted from them."""
+        parsed = parse_bgp_update(_build_update(withdrawn, path_attrs, nlri))
+
+        for field, value in expected.items():
+            assert getattr(parsed, field) == value, field
 
 
 class TestBGPUpdateStructure:
@@ -435,19 +377,11 @@ class TestBGPUpdateStructure:
 
     def test_parse_empty_update(self) -> None:
         """Test parsing empty UPDATE (keepalive-like)."""
-        data = bytearray()
-
-        # BGP header
-        data.extend(b"\xff" * 16)
-        data.extend(b"\x00\x17")  # Length = 23 (header only)
-        data.extend(b"\x02")
+        # Length = 23 (header plus the two empty section lengths)
+        data = _build_update()
+        assert len(data) == 23
 
-        # Empty UPDATE
-        data.extend(b"\x00\x00")  # No withdrawn
-        data.extend(b"\x00\x00")  # No path attrs
-        # No NLRI
-
-        update = parse_bgp_update_structure(bytes(data))
+        update = parse_bgp_update_structure(data)
 
         assert update.withdrawn_routes_length == 0
         assert update.total_path_attr_length == 0
@@ -465,68 +399,43 @@ class TestBGPUpdateStructure:
 class TestExtendedCommunities:
     """Test extended communities parsing."""
 
-    def test_parse_two_octet_as_route_target(self) -> None:
-        """Test parsing two-octet AS Route Target (type 0x00, 0x02)."""
-        # Type 0x00 (RT), Subtype 0x02, AS=42, Assigned=1
-        data = b"\x00\x02\x00\x2a\x00\x00\x00\x01"
-        communities = parse_extended_communities(data)
-
-        assert len(communities) == 1
-        assert communities[0] == "RT:42:1"
-
-    def test_parse_ipv4_address_route_target(self) -> None:
-        """Test parsing IPv4 address Route Target (type 0x01, 0x02)."""
-        # Type 0x01 (RT), Subtype 0x02, IP=10.1.0.45, Assigned=42
-        data = b"\x01\x02\x0a\x01\x00\x2d\x00\x2a"
-        communities = parse_extended_communities(data)
-
-        assert len(communities) == 1
-        assert communities[0] == "RT:10.1.0.45:42"
-
-    def test_parse_four_octet_as_route_target(self) -> None:
-        """Test parsing four-octet AS Route Target (type 0x02, 0x02)."""
-        # Type 0x02 (RT), Subtype 0x02, AS=65536, Assigned=1
-        data = b"\x02\x02\x00\x01\x00\x00\x00\x01"
-        communities = parse_extended_communities(data)
-
-        assert len(communities) == 1
-        assert communities[0] == "RT:65536:1"
-
-    def test_parse_ospf_domain_id(self) -> None:
-        """Test parsing OSPF Domain ID (type 0x03, subtype 0x0c)."""
-        # Type 0x03, Subtype 0x0c, padding + Domain ID 0.0.0.10
-        data = b"\x03\x0c\x00\x00\x00\x00\x00\x0a"
-        communities = parse_extended_communities(data)
-
-        assert len(communities) == 1
-        assert communities[0] == "OSPF-Domain:0.0.0.10"
-
-    def test_parse_evpn_mac_mobility(self) -> None:
-        """Test parsing EVPN MAC Mobility (type 0x06, subtype 0x00)."""
-        # Type 0x06, Subtype 0x00, flags=0x01, seq=12345, reserved
-        data = b"\x06\x00\x01\x00\x00\x30\x39\x00"
-        communities = parse_extended_communities(data)
-
-        assert len(communities) == 1
-        assert communities[0] == "EVPN-MAC-Mobility:12345"
-
-    def test_parse_evpn_esi_label(self) -> None:
-        """Test parsing EVPN ESI Label (type 0x06, subtype 0x01)."""
-        # Type 0x06, Subtype 0x01, flags, reserved (2), label=100 (0x000064)
-        data = b"\x06\x01\x00\x00\x00\x00\x06\x40"
-        communities = parse_extended_communities(data)
-
-        assert len(communities) == 1
-        assert communities[0] == "EVPN-ESI-Label:100"
-
-    def test_parse_evpn_es_import(self) -> None:
-        """Test parsing EVPN ES-Import Route Target (type 0x06, subtype 0x02)."""
-        # Type 0x06, Subtype 0x02, MAC=30:ce:e4:4a:13:e3
-        data = b"\x06\x02\x30\xce\xe4\x4a\x13\xe3"
-        communities = parse_extended_communities(data)
-
-        assert len(communities) == 1
-        assert communities[0] == "EVPN-ES-Import:30:ce:e4:4a:13:e3"
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            # Type 0x00 (RT), Subtype 0x02, AS=42, Assigned=1
+            (b"\x00\x02\x00\x2a\x00\x00\x00\x01", "RT:42:1"),
+            # Type 0x02 (two-octet AS RO), Subtype 0x00, AS=100, Assigned=200
+            (b"\x02\x00\x00\x64\x00\x00\x00\xc8", "RO:100:200"),
+            # Type 0x01 (RT), Subtype 0x02, IP=10.1.0.45, Assigned=42
+            (b"\x01\x02\x0a\x01\x00\x2d\x00\x2a", "RT:10.1.0.45:42"),
+            # Type 0x02 (RT), Subtype 0x02, AS=65536, Assigned=1
+            (b"\x02\x02\x00\x01\x00\x00\x00\x01", "RT:65536:1"),
+            # Type 0x03, Subtype 0x0c, padding + Domain ID 0.0.0.10
+            (b"\x03\x0c\x00\x00\x00\x00\x00\x0a", "OSPF-Domain:0.0.0.10"),
+            # Type 0x06, Subtype 0x00, flags=0x01, seq=12345, reserved
+            (b"\x06\x00\x01\x00\x00\x30\x39\x00", "EVPN-MAC-Mobility:12345"),
+            # Type 0x06, Subtype 0x01, flags, reserved (2), label=100 (0x000064)
+            (b"\x06\x01\x00\x00\x00\x00\x06\x40", "EVPN-ESI-Label:100"),
+            # Type 0x06, Subtype 0x02, MAC=30:ce:e4:4a:13:e3
+            (
+                b"\x06\x02\x30\xce\xe4\x4a\x13\xe3",
+                "EVPN-ES-Import:30:ce:e4:4a:13:e3",
+            ),
+        ],
+        ids=[
+            "two_octet_as_route_target",
+            "route_origin",
+            "ipv4_address_route_target",
+            "four_octet_as_route_target",
+            "ospf_domain_id",
+            "evpn_mac_mobility",
+            "evpn_esi_label",
+            "evpn_es_import",
+        ],
+    )
+    def test_parse_extended_community(self, data: bytes, expected: str) -> None:
+        """Test parsing a single extended community of each known type."""
+        assert parse_extended_communities(data) == [expected]
 
     def test_parse_multiple_extended_communities(self) -> None:
         """Test parsing multiple extended communities."""
@@ -554,12 +463,3 @@ class TestExtendedCommunities:
 
         with pytest.raises(BGPParseError, match="Invalid EXTENDED_COMMUNITIES length"):
             parse_extended_communities(data)
-
-    def test_parse_route_origin(self) -> None:
-        """Test parsing Route Origin communities (type 0x02, subtype 0x00)."""
-        # Type 0x02 (two-octet AS RO), Subtype 0x00, AS=100, Assigned=200
-        data = b"\x02\x00\x00\x64\x00\x00\x00\xc8"
-        communities = parse_extended_communities(data)
-
-        assert len(communities) == 1
-        assert communities[0] == "RO:100:200"
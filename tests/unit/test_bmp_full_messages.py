@@ -4,6 +4,9 @@ Tests for parsing full BMP messages (not just headers) to ensure RFC7854
 compliance for all message types with realistic binary data.
 """
 
+import struct
+from collections.abc import Callable
+
 import pytest
 from pybmpmon.protocol.bmp import (
     BMP_CURRENT_VERSION,
@@ -25,43 +28,43 @@ from pybmpmon.protocol.bmp_parser import (
     parse_termination_message,
 )
 
+# Wire layouts compiled once: BMP common header (version, length, type)
+# and BGP OPEN (marker, length, type, version, AS, hold time, BGP ID,
+# optional parameters length). Per-Peer Headers come from conftest.
+_BMP_HEADER = struct.Struct(">BIB")
+_BGP_OPEN = struct.Struct(">16sHBBHH4sB")
+
+# 16-byte BMP address field holding IPv4-mapped 192.0.2.254
+_MAPPED_192_0_2_254 = b"\x00" * 10 + b"\xff\xff" + b"\xc0\x00\x02\xfe"
+
+
+def _bgp_open(bgp_id: bytes) -> bytes:
+    """Encode a minimal BGP OPEN (AS 1, hold time 180) from bgp_id."""
+    return _BGP_OPEN.pack(b"\xff" * 16, 29, 1, 4, 1, 180, bgp_id, 0)
+
+
+def _tlv(info_type: int, value: bytes) -> bytes:
+    """Encode a BMP Information TLV (type, length, value)."""
+    return struct.pack(">HH", info_type, len(value)) + value
+
+
+# Initiation TLV values: STRING (type=0), SYS_DESCR (1) and SYS_NAME (2)
+_INIT_STRING = b"BMP Test Router v1.0"
+_INIT_SYS_DESCR = b"Test Router OS v2.5.1"
+_INIT_SYS_NAME = b"router-lab-01"
+_INIT_TLVS = _tlv(0, _INIT_STRING) + _tlv(1, _INIT_SYS_DESCR) + _tlv(2, _INIT_SYS_NAME)
+
 
 class TestInitiationMessage:
     """Test BMP Initiation message parsing with TLVs."""
 
     def test_parse_initiation_message_with_tlvs(self) -> None:
         """Test parsing Initiation message with system info TLVs."""
-        # Build complete Initiation message
-        data = bytearray()
-
-        # BMP header (6 bytes)
-        data.extend(b"\x03")  # Version = 3
-        data.extend(b"\x00\x00\x00\x00")  # Length (will update)
-        data.extend(b"\x04")  # Type = Initiation
-
-        # TLV 1: String (type=0)
-        data.extend(b"\x00\x00")  # Type = STRING
-        string_value = b"BMP Test Router v1.0"
-        data.extend(len(string_value).to_bytes(2, "big"))  # Length
-        data.extend(string_value)  # Value
-
-        # TLV 2: System Description (type=1)
-        data.extend(b"\x00\x01")  # Type = SYS_DESCR
-        sys_descr = b"Test Router OS v2.5.1"
-        data.extend(len(sys_descr).to_bytes(2, "big"))
-        data.extend(sys_descr)
-
-        # TLV 3: System Name (type=2)
-        data.extend(b"\x00\x02")  # Type = SYS_NAME
-        sys_name = b"router-lab-01"
-        data.extend(len(sys_name).to_bytes(2, "big"))
-        data.extend(sys_name)
-
-        # Update message length
-        data[1:5] = len(data).to_bytes(4, "big")
+        # BMP header (6 bytes): Version = 3, Type = Initiation
+        data = _BMP_HEADER.pack(3, 6 + len(_INIT_TLVS), 4) + _INIT_TLVS
 
         # Parse message
-        msg = parse_initiation_message(bytes(data))
+        msg = parse_initiation_message(data)
 
         # Verify header
         assert msg.header.version == BMP_CURRENT_VERSION
@@ -73,27 +76,23 @@ class TestInitiationMessage:
 
         # TLV 1: String
         assert msg.information_tlvs[0].info_type == BMPInfoTLVType.STRING
-        assert msg.information_tlvs[0].info_length == len(string_value)
-        assert msg.information_tlvs[0].info_value == string_value
+        assert msg.information_tlvs[0].info_length == len(_INIT_STRING)
+        assert msg.information_tlvs[0].info_value == _INIT_STRING
 
         # TLV 2: System Description
         assert msg.information_tlvs[1].info_type == BMPInfoTLVType.SYS_DESCR
-        assert msg.information_tlvs[1].info_value == sys_descr
+        assert msg.information_tlvs[1].info_value == _INIT_SYS_DESCR
 
         # TLV 3: System Name
         assert msg.information_tlvs[2].info_type == BMPInfoTLVType.SYS_NAME
-        assert msg.information_tlvs[2].info_value == sys_name
+        assert msg.information_tlvs[2].info_value == _INIT_SYS_NAME
 
     def test_parse_initiation_message_empty(self) -> None:
         """Test parsing Initiation message with no TLVs."""
-        data = bytearray()
-
-        # BMP header only
-        data.extend(b"\x03")  # Version
-        data.extend(b"\x00\x00\x00\x06")  # Length = 6 (header only)
-        data.extend(b"\x04")  # Type = Initiation
+        # BMP header only: Version, Length = 6 (header only), Type = Initiation
+        data = _BMP_HEADER.pack(3, 6, 4)
 
-        msg = parse_initiation_message(bytes(data))
+        msg = parse_initiation_message(data)
 
         assert msg.header.msg_type == BMPMessageType.INITIATION
         assert len(msg.information_tlvs) == 0
@@ -104,23 +103,14 @@ class TestTerminationMessage:
 
     def test_parse_termination_message_with_tlvs(self) -> None:
         """Test parsing Termination message with reason TLVs."""
-        data = bytearray()
-
-        # BMP header
-        data.extend(b"\x03")  # Version
-        data.extend(b"\x00\x00\x00\x00")  # Length (will update)
-        data.extend(b"\x05")  # Type = Termination
-
         # TLV: String with termination reason
-        data.extend(b"\x00\x00")  # Type = STRING
         reason = b"Administrator shutdown"
-        data.extend(len(reason).to_bytes(2, "big"))
-        data.extend(reason)
+        body = _tlv(0, reason)
 
-        # Update length
-        data[1:5] = len(data).to_bytes(4, "big")
+        # BMP header: Type = Termination
+        data = _BMP_HEADER.pack(3, 6 + len(body), 5) + body
 
-        msg = parse_termination_message(bytes(data))
+        msg = parse_termination_message(data)
 
         assert msg.header.msg_type == BMPMessageType.TERMINATION
         assert len(msg.information_tlvs) == 1
@@ -130,63 +120,29 @@ class TestTerminationMessage:
 class TestPeerUpMessage:
     """Test BMP Peer Up message parsing."""
 
-    def test_parse_peer_up_message_complete(self) -> None:
+    def test_parse_peer_up_message_complete(
+        self, per_peer_header: Callable[..., bytes]
+    ) -> None:
         """Test parsing complete Peer Up with BGP OPEN messages."""
-        data = bytearray()
-
-        # BMP header
-        data.extend(b"\x03")  # Version
-        data.extend(b"\x00\x00\x00\x00")  # Length (will update)
-        data.extend(b"\x03")  # Type = Peer Up
-
-        # Per-Peer Header (42 bytes)
-        data.extend(b"\x00")  # Peer Type = Global Instance
-        data.extend(b"\x00")  # Peer Flags = IPv4
-        data.extend(b"\x00" * 8)  # Peer Distinguisher
-        # Peer Address (16 bytes, IPv4-mapped)
-        data.extend(b"\x00" * 10 + b"\xff\xff" + b"\xc0\x00\x02\x01")  # 192.0.2.1
-        data.extend(b"\x00\x01\x00\x00")  # Peer AS = 65536
-        data.extend(b"\xc0\x00\x02\x01")  # Peer BGP ID = 192.0.2.1
-        data.extend(b"\x00\x00\x00\x64")  # Timestamp seconds = 100
-        data.extend(b"\x00\x00\x00\x00")  # Timestamp microseconds = 0
-
-        # Local Address (16 bytes, IPv4-mapped)
-        data.extend(b"\x00" * 10 + b"\xff\xff" + b"\xc0\x00\x02\xfe")  # 192.0.2.254
-        # Local Port
-        data.extend(b"\x00\xb3")  # Port = 179 (BGP)
-        # Remote Port
-        data.extend(b"\xc3\x50")  # Port = 50000
-
-        # Sent OPEN message (BGP OPEN structure)
-        sent_open = bytearray()
-        sent_open.extend(b"\xff" * 16)  # BGP marker
-        sent_open.extend(b"\x00\x1d")  # Length = 29
-        sent_open.extend(b"\x01")  # Type = OPEN
-        sent_open.extend(b"\x04")  # Version = 4
-        sent_open.extend(b"\x00\x01")  # My AS = 1
-        sent_open.extend(b"\x00\xb4")  # Hold Time = 180
-        sent_open.extend(b"\xc0\x00\x02\xfe")  # BGP Identifier = 192.0.2.254
-        sent_open.extend(b"\x00")  # Optional Parameters Length = 0
-        data.extend(sent_open)
-
-        # Received OPEN message (same structure)
-        recv_open = bytearray()
-        recv_open.extend(b"\xff" * 16)  # BGP marker
-        recv_open.extend(b"\x00\x1d")  # Length = 29
-        recv_open.extend(b"\x01")  # Type = OPEN
-        recv_open.extend(b"\x04")  # Version = 4
-        recv_open.extend(b"\x00\x01")  # My AS = 1
-        recv_open.extend(b"\x00\xb4")  # Hold Time = 180
-        recv_open.extend(b"\xc0\x00\x02\x01")  # BGP Identifier = 192.0.2.1
-        recv_open.extend(b"\x00")  # Optional Parameters Length = 0
-        data.extend(recv_open)
+        # Per-Peer Header (42 bytes): IPv4 peer 192.0.2.1, AS 65536, ts 100s
+        peer_header = per_peer_header(asn=65536, timestamp_sec=100)
 
-        # No Information TLVs in this test
+        # Local Address (16 bytes, IPv4-mapped): 192.0.2.254,
+        # Local Port = 179 (BGP), Remote Port = 50000
+        local_block = _MAPPED_192_0_2_254
+        local_block += struct.pack(">HH", 179, 50000)
 
-        # Update BMP message length
-        data[1:5] = len(data).to_bytes(4, "big")
+        # Sent OPEN from the monitored router (192.0.2.254), received OPEN
+        # from the peer (192.0.2.1)
+        sent_open = _bgp_open(b"\xc0\x00\x02\xfe")
+        recv_open = _bgp_open(b"\xc0\x00\x02\x01")
+
+        # No Information TLVs in this test
+        body = peer_header + local_block + sent_open + recv_open
+        # BMP header: Type = Peer Up
+        data = _BMP_HEADER.pack(3, 6 + len(body), 3) + body
 
-        msg = parse_peer_up_message(bytes(data))
+        msg = parse_peer_up_message(data)
 
         # Verify header
         assert msg.header.msg_type == BMPMessageType.PEER_UP_NOTIFICATION
@@ -209,48 +165,24 @@ class TestPeerUpMessage:
         # Verify OPEN messages
         assert len(msg.sent_open_message) == 29
         assert len(msg.received_open_message) == 29
-        assert msg.sent_open_message == bytes(sent_open)
-        assert msg.received_open_message == bytes(recv_open)
+        assert msg.sent_open_message == sent_open
+        assert msg.received_open_message == recv_open
 
         # Verify no TLVs
         assert len(msg.information_tlvs) == 0
 
-    def test_parse_peer_up_message_with_ipv6(self) -> None:
+    def test_parse_peer_up_message_with_ipv6(
+        self, ipv6_per_peer_header: bytes, bgp_open: bytes
+    ) -> None:
         """Test parsing Peer Up message with IPv6 addresses."""
-        data = bytearray()
-
-        # BMP header
-        data.extend(b"\x03")
-        data.extend(b"\x00\x00\x00\x00")  # Length
-        data.extend(b"\x03")  # Peer Up
-
-        # Per-Peer Header with IPv6 flag
-        data.extend(b"\x00")  # Peer Type
-        data.extend(b"\x80")  # Peer Flags = IPv6 (bit 0 set)
-        data.extend(b"\x00" * 8)  # Peer Distinguisher
-        # Peer Address (16 bytes, full IPv6)
-        data.extend(b"\x20\x01\x0d\xb8" + b"\x00" * 12)  # 2001:db8::
-        data.extend(b"\x00\x00\xfd\xe8")  # Peer AS = 65000
-        data.extend(b"\xc0\x00\x02\x01")  # Peer BGP ID
-        data.extend(b"\x00\x00\x00\x01")  # Timestamp sec
-        data.extend(b"\x00\x00\x00\x00")  # Timestamp usec
-
-        # Local Address (full IPv6)
-        data.extend(b"\x20\x01\x0d\xb8" + b"\x00" * 11 + b"\x01")  # 2001:db8::1
-        data.extend(b"\x00\xb3")  # Local port
-        data.extend(b"\xc3\x50")  # Remote port
-
-        # Minimal OPEN messages
-        for _ in range(2):
-            open_msg = (
-                b"\xff" * 16 + b"\x00\x1d\x01\x04\x00\x01\x00\xb4\xc0\x00\x02\x01\x00"
-            )
-            data.extend(open_msg)
+        # Local Address (full IPv6): 2001:db8::1, Local/Remote port
+        local_block = b"\x20\x01\x0d\xb8" + b"\x00" * 11 + b"\x01"
+        local_block += struct.pack(">HH", 179, 50000)
 
-        # Update length
-        data[1:5] = len(data).to_bytes(4, "big")
+        body = ipv6_per_peer_header + local_block + bgp_open + bgp_open
+        data = _BMP_HEADER.pack(3, 6 + len(body), 3) + body
 
-        msg = parse_peer_up_message(bytes(data))
+        msg = parse_peer_up_message(data)
 
         # Verify IPv6 flag and address
         assert msg.per_peer_header.peer_flags & BMPPeerFlags.IPV6
@@ -261,125 +193,83 @@ class TestPeerUpMessage:
 class TestPeerDownMessage:
     """Test BMP Peer Down message parsing."""
 
-    def test_parse_peer_down_with_notification(self) -> None:
+    @pytest.mark.parametrize(
+        ("reason_code", "has_notification"),
+        [
+            (BMPPeerDownReason.LOCAL_NOTIFICATION, True),
+            (BMPPeerDownReason.LOCAL_NO_NOTIFICATION, False),
+            (BMPPeerDownReason.REMOTE_NOTIFICATION, True),
+            (BMPPeerDownReason.REMOTE_NO_NOTIFICATION, False),
+            (BMPPeerDownReason.PEER_DE_CONFIGURED, False),
+        ],
+        ids=[
+            "local_notification",
+            "local_no_notification",
+            "remote_notification",
+            "remote_no_notification",
+            "peer_de_configured",
+        ],
+    )
+    def test_parse_peer_down_with_notification(
+        self,
+        reason_code: BMPPeerDownReason,
+        has_notification: bool,
+        ipv4_per_peer_header: bytes,
+        bgp_notification: bytes,
+    ) -> None:
         """Test parsing Peer Down with various reason codes."""
-        # Test all valid reason codes
-        test_cases = [
-            (BMPPeerDownReason.LOCAL_NOTIFICATION, "Local notification"),
-            (BMPPeerDownReason.LOCAL_NO_NOTIFICATION, "Local no notification"),
-            (BMPPeerDownReason.REMOTE_NOTIFICATION, "Remote notification"),
-            (BMPPeerDownReason.REMOTE_NO_NOTIFICATION, "Remote no notification"),
-            (BMPPeerDownReason.PEER_DE_CONFIGURED, "Peer de-configured"),
-        ]
-
-        for reason_code, description in test_cases:
-            data = bytearray()
-
-            # BMP header
-            data.extend(b"\x03")
-            data.extend(b"\x00\x00\x00\x00")  # Length
-            data.extend(b"\x02")  # Peer Down
-
-            # Per-Peer Header (minimal)
-            data.extend(b"\x00")  # Peer Type
-            data.extend(b"\x00")  # Peer Flags
-            data.extend(b"\x00" * 8)  # Peer Distinguisher
-            data.extend(b"\x00" * 10 + b"\xff\xff" + b"\xc0\x00\x02\x01")  # Peer Addr
-            data.extend(b"\x00\x00\xfd\xe8")  # Peer AS
-            data.extend(b"\xc0\x00\x02\x01")  # BGP ID
-            data.extend(b"\x00\x00\x00\x64")  # Timestamp sec
-            data.extend(b"\x00\x00\x00\x00")  # Timestamp usec
-
-            # Reason code
-            data.extend(bytes([reason_code]))
-
-            # Additional data (BGP notification if reason = 1 or 3)
-            if reason_code in (
-                BMPPeerDownReason.LOCAL_NOTIFICATION,
-                BMPPeerDownReason.REMOTE_NOTIFICATION,
-            ):
-                # BGP NOTIFICATION message
-                bgp_notif = b"\xff" * 16  # Marker
-                bgp_notif += b"\x00\x15"  # Length = 21
-                bgp_notif += b"\x03"  # Type = NOTIFICATION
-                bgp_notif += b"\x06"  # Error Code = Cease
-                bgp_notif += b"\x04"  # Error Subcode = Admin shutdown
-                data.extend(bgp_notif)
-
-            # Update length
-            data[1:5] = len(data).to_bytes(4, "big")
-
-            msg = parse_peer_down_message(bytes(data))
-
-            # Verify reason code
-            assert msg.reason == reason_code, f"Failed for {description}"
-            assert msg.header.msg_type == BMPMessageType.PEER_DOWN_NOTIFICATION
-
-            # Verify additional data
-            if reason_code in (
-                BMPPeerDownReason.LOCAL_NOTIFICATION,
-                BMPPeerDownReason.REMOTE_NOTIFICATION,
-            ):
-                assert len(msg.data) == 21  # BGP notification length
-            else:
-                assert len(msg.data) == 0
+        # Reason code, then a BGP NOTIFICATION if reason = 1 or 3
+        body = ipv4_per_peer_header + bytes([reason_code])
+        if has_notification:
+            body += bgp_notification
+        # BMP header: Type = Peer Down
+        data = _BMP_HEADER.pack(3, 6 + len(body), 2) + body
+
+        msg = parse_peer_down_message(data)
+
+        # Verify reason code
+        assert msg.reason == reason_code
+        assert msg.header.msg_type == BMPMessageType.PEER_DOWN_NOTIFICATION
+
+        # Verify additional data (BGP notification length)
+        assert len(msg.data) == (21 if has_notification else 0)
 
 
 class TestRouteMonitoringMessage:
     """Test BMP Route Monitoring message parsing."""
 
-    def test_parse_route_monitoring_message_complete(self) -> None:
+    def test_parse_route_monitoring_message_complete(
+        self, ipv4_per_peer_header: bytes
+    ) -> None:
         """Test parsing Route Monitoring with embedded BGP UPDATE."""
-        data = bytearray()
-
-        # BMP header
-        data.extend(b"\x03")
-        data.extend(b"\x00\x00\x00\x00")  # Length
-        data.extend(b"\x00")  # Type = Route Monitoring
-
-        # Per-Peer Header
-        data.extend(b"\x00")  # Peer Type
-        data.extend(b"\x00")  # Peer Flags (IPv4)
-        data.extend(b"\x00" * 8)  # Peer Distinguisher
-        data.extend(b"\x00" * 10 + b"\xff\xff" + b"\xc0\x00\x02\x01")  # 192.0.2.1
-        data.extend(b"\x00\x00\xfd\xe8")  # AS 65000
-        data.extend(b"\xc0\x00\x02\x01")  # BGP ID
-        data.extend(b"\x00\x00\x00\x01")  # Timestamp
-        data.extend(b"\x00\x00\x00\x00")
-
-        # BGP UPDATE message
-        bgp_update = bytearray()
-        bgp_update.extend(b"\xff" * 16)  # BGP marker
-        bgp_update.extend(b"\x00\x00")  # Length (will update)
-        bgp_update.extend(b"\x02")  # Type = UPDATE
-
-        # Withdrawn routes length
-        bgp_update.extend(b"\x00\x00")
-
         # Path attributes
-        path_attrs = bytearray()
-        # ORIGIN (IGP)
-        path_attrs.extend(b"\x40\x01\x01\x00")
-        # AS_PATH (sequence: 65000)
-        path_attrs.extend(b"\x40\x02\x04\x02\x01\xfd\xe8")
-        # NEXT_HOP
-        path_attrs.extend(b"\x40\x03\x04\xc0\x00\x02\xfe")  # 192.0.2.254
-
-        bgp_update.extend(len(path_attrs).to_bytes(2, "big"))
-        bgp_update.extend(path_attrs)
-
+        path_attrs = (
+            # ORIGIN (IGP)
+            b"\x40\x01\x01\x00"
+            # AS_PATH (sequence: 65000)
+            b"\x40\x02\x04\x02\x01\xfd\xe8"
+            # NEXT_HOP
+            b"\x40\x03\x04\xc0\x00\x02\xfe"  # 192.0.2.254
+        )
         # NLRI: 10.0.0.0/8
-        bgp_update.extend(b"\x08\x0a")
-
-        # Update BGP message length
-        bgp_update[16:18] = len(bgp_update).to_bytes(2, "big")
-
-        data.extend(bgp_update)
+        nlri = b"\x08\x0a"
+
+        # BGP UPDATE message: marker, length, Type = UPDATE, no withdrawn
+        # routes, path attributes length
+        bgp_update = (
+            b"\xff" * 16
+            + struct.pack(
+                ">HBHH", 23 + len(path_attrs) + len(nlri), 2, 0, len(path_attrs)
+            )
+            + path_attrs
+            + nlri
+        )
 
-        # Update BMP message length
-        data[1:5] = len(data).to_bytes(4, "big")
+        body = ipv4_per_peer_header + bgp_update
+        # BMP header: Type = Route Monitoring
+        data = _BMP_HEADER.pack(3, 6 + len(body), 0) + body
 
-        msg = parse_route_monitoring_message(bytes(data))
+        msg = parse_route_monitoring_message(data)
 
         # Verify message type
         assert msg.header.msg_type == BMPMessageType.ROUTE_MONITORING
@@ -392,82 +282,52 @@ class TestRouteMonitoringMessage:
 
         # Verify BGP UPDATE is present
         assert len(msg.bgp_update) > 0
-        assert msg.bgp_update == bytes(bgp_update)
+        assert msg.bgp_update == bgp_update
+
+
+def _stat_tlv(stat_type: int, width: int, value: int) -> bytes:
+    """Encode a BMP Statistics TLV holding a width-byte counter/gauge."""
+    return struct.pack(">HH", stat_type, width) + value.to_bytes(width, "big")
+
+
+# (stat type, value width, value): 32-bit counters and 64-bit gauges
+_STATS = [
+    (BMPStatType.REJECTED_PREFIXES, 4, 10),
+    (BMPStatType.DUPLICATE_PREFIX_ADVERTISEMENTS, 4, 5),
+    (BMPStatType.ROUTES_ADJ_RIB_IN, 8, 1_100_000),
+    (BMPStatType.ROUTES_LOC_RIB, 8, 500_000),
+]
 
 
 class TestStatisticsReportMessage:
     """Test BMP Statistics Report message parsing."""
 
-    def test_parse_statistics_report_with_counters(self) -> None:
+    def test_parse_statistics_report_with_counters(
+        self, ipv4_per_peer_header: bytes
+    ) -> None:
         """Test parsing Statistics Report with counter TLVs."""
-        data = bytearray()
-
-        # BMP header
-        data.extend(b"\x03")
-        data.extend(b"\x00\x00\x00\x00")  # Length
-        data.extend(b"\x01")  # Type = Statistics Report
-
-        # Per-Peer Header
-        data.extend(b"\x00")  # Peer Type
-        data.extend(b"\x00")  # Peer Flags
-        data.extend(b"\x00" * 8)  # Peer Distinguisher
-        data.extend(b"\x00" * 10 + b"\xff\xff" + b"\xc0\x00\x02\x01")  # Peer Addr
-        data.extend(b"\x00\x00\xfd\xe8")  # AS 65000
-        data.extend(b"\xc0\x00\x02\x01")  # BGP ID
-        data.extend(b"\x00\x00\x00\x01")  # Timestamp
-        data.extend(b"\x00\x00\x00\x00")
-
-        # Stats count
-        data.extend(b"\x00\x00\x00\x04")  # 4 statistics
-
-        # Stat 1: Number of prefixes rejected (32-bit counter)
-        data.extend(b"\x00\x00")  # Type = REJECTED_PREFIXES
-        data.extend(b"\x00\x04")  # Length = 4
-        data.extend(b"\x00\x00\x00\x0a")  # Value = 10
-
-        # Stat 2: Number of duplicate prefix advertisements (32-bit)
-        data.extend(b"\x00\x01")  # Type = DUPLICATE_PREFIX_ADVERTISEMENTS
-        data.extend(b"\x00\x04")  # Length = 4
-        data.extend(b"\x00\x00\x00\x05")  # Value = 5
-
-        # Stat 3: Number of routes in Adj-RIB-In (64-bit counter)
-        data.extend(b"\x00\x07")  # Type = ROUTES_ADJ_RIB_IN
-        data.extend(b"\x00\x08")  # Length = 8
-        data.extend(b"\x00\x00\x00\x00")  # High 32 bits = 0
-        data.extend(b"\x00\x10\xc8\xe0")  # Low 32 bits = 1,100,000
-
-        # Stat 4: Number of routes in Loc-RIB (64-bit)
-        data.extend(b"\x00\x08")  # Type = ROUTES_LOC_RIB
-        data.extend(b"\x00\x08")  # Length = 8
-        data.extend(b"\x00\x00\x00\x00")  # High = 0
-        data.extend(b"\x00\x07\xa1\x20")  # Low = 500,000
-
-        # Update BMP message length
-        data[1:5] = len(data).to_bytes(4, "big")
-
-        msg = parse_statistics_report_message(bytes(data))
+        body = (
+            ipv4_per_peer_header
+            + struct.pack(">I", len(_STATS))
+            + b"".join(_stat_tlv(*stat) for stat in _STATS)
+        )
+
+        # BMP header: Type = Statistics Report
+        data = _BMP_HEADER.pack(3, 6 + len(body), 1) + body
+
+        msg = parse_statistics_report_message(data)
 
         # Verify header
         assert msg.header.msg_type == BMPMessageType.STATISTICS_REPORT
 
         # Verify stats count
-        assert msg.stats_count == 4
-        assert len(msg.stats_tlvs) == 4
+        assert msg.stats_count == len(_STATS)
+        assert len(msg.stats_tlvs) == len(_STATS)
 
         # Verify stat values
-        assert msg.stats_tlvs[0].stat_type == BMPStatType.REJECTED_PREFIXES
-        assert msg.stats_tlvs[0].stat_value == 10
-
-        assert (
-            msg.stats_tlvs[1].stat_type == BMPStatType.DUPLICATE_PREFIX_ADVERTISEMENTS
-        )
-        assert msg.stats_tlvs[1].stat_value == 5
-
-        assert msg.stats_tlvs[2].stat_type == BMPStatType.ROUTES_ADJ_RIB_IN
-        assert msg.stats_tlvs[2].stat_value == 1_100_000
-
-        assert msg.stats_tlvs[3].stat_type == BMPStatType.ROUTES_LOC_RIB
-        assert msg.stats_tlvs[3].stat_value == 500_000
+        for tlv, (stat_type, _, value) in zip(msg.stats_tlvs, _STATS, strict=True):
+            assert tlv.stat_type == stat_type
+            assert tlv.stat_value == value
 
 
 class TestBMPMessageDispatch:
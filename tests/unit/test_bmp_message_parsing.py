@@ -1,6 +1,9 @@
 """Comprehensive tests for BMP message parsing (Phase 2)."""
 
+import struct
+
 import pytest
+from pybmpmon.protocol.bgp import BGP_MARKER
 from pybmpmon.protocol.bmp import (
     BMPMessageType,
     BMPParseError,
@@ -19,63 +22,73 @@ from pybmpmon.protocol.bmp_parser import (
     parse_termination_message,
 )
 
+# BMP common header (version, length, type), Per-Peer Header (type, flags,
+# distinguisher, address, AS, BGP ID, timestamp sec/usec) and a Statistics
+# TLV holding a 32-bit counter (type, length, value)
+_BMP_HEADER = struct.Struct("!BIB")
+_PER_PEER_HEADER = struct.Struct("!BB8s16sI4sII")
+_STAT_U32 = struct.Struct("!HHI")
+
+_NO_DISTINGUISHER = b"\x00" * 8
+_ADDR_192_0_2_1 = b"\x00" * 12 + b"\xc0\x00\x02\x01"  # IPv4-compatible
+_BGP_ID_192_0_2_1 = b"\xc0\x00\x02\x01"
+
+# Per-Peer Header (42 bytes) shared by the message tests: Type=GLOBAL_INSTANCE,
+# Flags=0, Address=192.0.2.1, AS=65000, BGP ID=192.0.2.1, Timestamp=1s 0us
+_IPV4_PEER_HEADER = _PER_PEER_HEADER.pack(
+    0, 0, _NO_DISTINGUISHER, _ADDR_192_0_2_1, 65000, _BGP_ID_192_0_2_1, 1, 0
+)
+
+# BGP UPDATE with no withdrawn routes, path attributes or NLRI (23 bytes)
+_BGP_UPDATE_EMPTY = BGP_MARKER + b"\x00\x17\x02\x00\x00\x00\x00"
+
 
 class TestPerPeerHeaderParsing:
     """Test Per-Peer Header parsing."""
 
     def test_parse_ipv4_peer_header(self) -> None:
         """Test parsing Per-Peer Header with IPv4 peer."""
-        # Build a 48-byte message (6 header + 42 per-peer header)
-        data = bytearray()
-
-        # BMP header: version=3, length=48, type=0 (route monitoring)
-        data.extend(b"\x03")  # Version
-        data.extend(b"\x00\x00\x00\x30")  # Length = 48
-        data.extend(b"\x00")  # Message type = ROUTE_MONITORING
-
-        # Per-Peer Header (42 bytes)
-        data.extend(b"\x00")  # Peer Type = GLOBAL_INSTANCE
-        data.extend(b"\x00")  # Peer Flags = 0 (IPv4, pre-policy, 4-byte AS)
-        data.extend(b"\x00" * 8)  # Peer Distinguisher
-        # Peer Address (16 bytes, IPv4-mapped: 192.0.2.1)
-        data.extend(b"\x00" * 12 + b"\xc0\x00\x02\x01")
-        data.extend(b"\x00\x00\xfd\xe8")  # Peer AS = 65000
-        data.extend(b"\xc0\x00\x02\x01")  # Peer BGP ID = 192.0.2.1
-        data.extend(b"\x00\x00\x00\x01")  # Timestamp seconds = 1
-        data.extend(b"\x00\x00\x00\x00")  # Timestamp microseconds = 0
-
-        per_peer_header = parse_per_peer_header(bytes(data), offset=6)
+        # Build a 48-byte message (6 header + 42 per-peer header); BMP
+        # header: version=3, length=48, type=0 (route monitoring)
+        data = _BMP_HEADER.pack(3, 48, 0) + _PER_PEER_HEADER.pack(
+            0,  # Peer Type = GLOBAL_INSTANCE
+            0,  # Peer Flags = 0 (IPv4, pre-policy, 4-byte AS)
+            _NO_DISTINGUISHER,  # Peer Distinguisher
+            _ADDR_192_0_2_1,  # Peer Address (16 bytes, IPv4-compatible)
+            65000,  # Peer AS
+            _BGP_ID_192_0_2_1,  # Peer BGP ID = 192.0.2.1
+            1,  # Timestamp seconds
+            0,  # Timestamp microseconds
+        )
 
-        assert per_peer_header.peer_type == BMPPeerType.GLOBAL_INSTANCE
-        assert per_peer_header.peer_flags == 0
-        assert per_peer_header.peer_address == "192.0.2.1"
-        assert per_peer_header.peer_asn == 65000
-        assert per_peer_header.peer_bgp_id == "192.0.2.1"
-        assert per_peer_header.timestamp_sec == 1
-        assert per_peer_header.timestamp_usec == 0
+        per_peer_header = parse_per_peer_header(data, offset=6)
+
+        assert (
+            per_peer_header.peer_type,
+            per_peer_header.peer_flags,
+            per_peer_header.peer_address,
+            per_peer_header.peer_asn,
+            per_peer_header.peer_bgp_id,
+            per_peer_header.timestamp_sec,
+            per_peer_header.timestamp_usec,
+        ) == (BMPPeerType.GLOBAL_INSTANCE, 0, "192.0.2.1", 65000, "192.0.2.1", 1, 0)
 
     def test_parse_ipv6_peer_header(self) -> None:
         """Test parsing Per-Peer Header with IPv6 peer."""
-        # Build a 48-byte message
-        data = bytearray()
-
-        # BMP header
-        data.extend(b"\x03\x00\x00\x00\x30\x00")
-
-        # Per-Peer Header with IPv6 flag set
-        data.extend(b"\x00")  # Peer Type = GLOBAL_INSTANCE
-        data.extend(b"\x80")  # Peer Flags = 0x80 (IPv6 flag set)
-        data.extend(b"\x00" * 8)  # Peer Distinguisher
-        # Peer Address (16 bytes): 2001:db8::1
-        data.extend(
-            b"\x20\x01\x0d\xb8\x00\x00\x00\x00" b"\x00\x00\x00\x00\x00\x00\x00\x01"
+        # Build a 48-byte message: Per-Peer Header with IPv6 flag set (0x80),
+        # Address = 2001:db8::1
+        data = _BMP_HEADER.pack(3, 48, 0) + _PER_PEER_HEADER.pack(
+            0,
+            0x80,
+            _NO_DISTINGUISHER,
+            b"\x20\x01\x0d\xb8" + b"\x00" * 11 + b"\x01",
+            65000,
+            _BGP_ID_192_0_2_1,
+            1,
+            0,
         )
-        data.extend(b"\x00\x00\xfd\xe8")  # Peer AS = 65000
-        data.extend(b"\xc0\x00\x02\x01")  # Peer BGP ID
-        data.extend(b"\x00\x00\x00\x01")  # Timestamp seconds
-        data.extend(b"\x00\x00\x00\x00")  # Timestamp microseconds
 
-        per_peer_header = parse_per_peer_header(bytes(data), offset=6)
+        per_peer_header = parse_per_peer_header(data, offset=6)
 
         assert per_peer_header.peer_type == BMPPeerType.GLOBAL_INSTANCE
         assert per_peer_header.peer_flags == 0x80
@@ -92,13 +105,11 @@ class TestPerPeerHeaderParsing:
 
     def test_parse_peer_header_invalid_type(self) -> None:
         """Test error when peer type is invalid."""
-        data = bytearray()
-        data.extend(b"\x03\x00\x00\x00\x30\x00")  # Header
-        data.extend(b"\xff")  # Invalid peer type
-        data.extend(b"\x00" * 41)  # Rest of per-peer header
+        # Header, invalid peer type, rest of per-peer header
+        data = b"\x03\x00\x00\x00\x30\x00" + b"\xff" + b"\x00" * 41
 
         with pytest.raises(BMPParseError, match="Invalid peer type"):
-            parse_per_peer_header(bytes(data), offset=6)
+            parse_per_peer_header(data, offset=6)
 
 
 class TestInitiationMessage:
@@ -106,8 +117,6 @@ class TestInitiationMessage:
 
     def test_parse_initiation_with_tlvs(self) -> None:
         """Test parsing Initiation message with Information TLVs."""
-        data = bytearray()
-
         # TLV 1: Type=1 (SYS_DESCR), Length=6, Value="Router"
         tlv1 = b"\x00\x01"  # Type = SYS_DESCR
         tlv1 += b"\x00\x06"  # Length = 6
@@ -120,15 +129,9 @@ class TestInitiationMessage:
 
         # BMP header: version=3, length=6+len(tlvs), type=4 (INITIATION)
         total_length = 6 + len(tlv1) + len(tlv2)
-        data.extend(b"\x03")  # Version
-        data.extend(total_length.to_bytes(4, "big"))  # Length
-        data.extend(b"\x04")  # Message type = INITIATION
+        data = _BMP_HEADER.pack(3, total_length, 4) + tlv1 + tlv2
 
-        # Add TLVs
-        data.extend(tlv1)
-        data.extend(tlv2)
-
-        msg = parse_initiation_message(bytes(data))
+        msg = parse_initiation_message(data)
 
         assert msg.header.msg_type == BMPMessageType.INITIATION
         assert msg.header.length == total_length
@@ -156,13 +159,14 @@ class TestInitiationMessage:
 
     def test_parse_initiation_truncated_tlv(self) -> None:
         """Test error when TLV is truncated."""
-        data = bytearray()
-        data.extend(b"\x03\x00\x00\x00\x0c\x04")  # Header, length=12
-        data.extend(b"\x00\x01")  # TLV type
-        data.extend(b"\x00\x0a")  # TLV length=10 (but not enough data)
+        data = (
+            b"\x03\x00\x00\x00\x0c\x04"  # Header, length=12
+            b"\x00\x01"  # TLV type
+            b"\x00\x0a"  # TLV length=10 (but not enough data)
+        )
 
         with pytest.raises(BMPParseError, match="Incomplete TLV"):
-            parse_initiation_message(bytes(data))
+            parse_initiation_message(data)
 
 
 class TestTerminationMessage:
@@ -170,8 +174,6 @@ class TestTerminationMessage:
 
     def test_parse_termination_with_reason(self) -> None:
         """Test parsing Termination message with reason TLV."""
-        data = bytearray()
-
         # TLV: Type=0 (STRING), Length=4, Value="Exit"
         tlv = b"\x00\x00"  # Type = STRING
         tlv += b"\x00\x04"  # Length = 4
@@ -179,14 +181,9 @@ class TestTerminationMessage:
 
         # BMP header
         total_length = 6 + len(tlv)
-        data.extend(b"\x03")  # Version
-        data.extend(total_length.to_bytes(4, "big"))
-        data.extend(b"\x05")  # Type = TERMINATION
-
-        # Add TLV
-        data.extend(tlv)
+        data = _BMP_HEADER.pack(3, total_length, 5) + tlv  # Type = TERMINATION
 
-        msg = parse_termination_message(bytes(data))
+        msg = parse_termination_message(data)
 
         assert msg.header.msg_type == BMPMessageType.TERMINATION
         assert len(msg.information_tlvs) == 1
@@ -198,27 +195,11 @@ class TestRouteMonitoringMessage:
 
     def test_parse_route_monitoring_message(self) -> None:
         """Test parsing Route Monitoring message."""
-        data = bytearray()
+        # BMP header: type=0 (ROUTE_MONITORING), length=60; the message
+        # ends 12 bytes into the BGP UPDATE
+        data = b"\x03\x00\x00\x00\x3c\x00" + _IPV4_PEER_HEADER + _BGP_UPDATE_EMPTY
 
-        # BMP header: type=0 (ROUTE_MONITORING), length=60
-        data.extend(b"\x03\x00\x00\x00\x3c\x00")
-
-        # Per-Peer Header (42 bytes)
-        data.extend(b"\x00\x00")  # Type, Flags
-        data.extend(b"\x00" * 8)  # Distinguisher
-        data.extend(b"\x00" * 12 + b"\xc0\x00\x02\x01")  # IPv4: 192.0.2.1
-        data.extend(b"\x00\x00\xfd\xe8")  # AS 65000
-        data.extend(b"\xc0\x00\x02\x01")  # BGP ID
-        data.extend(b"\x00\x00\x00\x01\x00\x00\x00\x00")  # Timestamp
-
-        # BGP UPDATE PDU (12 bytes minimum)
-        data.extend(b"\xff" * 16)  # BGP marker
-        data.extend(b"\x00\x17")  # Length = 23
-        data.extend(b"\x02")  # Type = UPDATE
-        data.extend(b"\x00\x00")  # Withdrawn routes length = 0
-        data.extend(b"\x00\x00")  # Path attributes length = 0
-
-        msg = parse_route_monitoring_message(bytes(data)[:60])
+        msg = parse_route_monitoring_message(data[:60])
 
         assert msg.header.msg_type == BMPMessageType.ROUTE_MONITORING
         assert msg.per_peer_header.peer_address == "192.0.2.1"
@@ -237,36 +218,25 @@ class TestStatisticsReportMessage:
 
     def test_parse_statistics_report(self) -> None:
         """Test parsing Statistics Report message."""
-        data = bytearray()
-
         # Calculate total length: 6 (header) + 42 (per-peer) + 4 (count) + 2*8 (2 TLVs)
         total_length = 6 + 42 + 4 + 16
 
-        # BMP header: type=1 (STATISTICS_REPORT)
-        data.extend(b"\x03")  # Version
-        data.extend(total_length.to_bytes(4, "big"))  # Length
-        data.extend(b"\x01")  # Type = STATISTICS_REPORT
-
-        # Per-Peer Header (42 bytes)
-        data.extend(b"\x00\x00")  # Type, Flags
-        data.extend(b"\x00" * 8)  # Distinguisher
-        data.extend(b"\x00" * 12 + b"\xc0\x00\x02\x01")  # IPv4
-        data.extend(b"\x00\x00\xfd\xe8")  # AS
-        data.extend(b"\xc0\x00\x02\x01")  # BGP ID
-        data.extend(b"\x00\x00\x00\x01\x00\x00\x00\x00")  # Timestamp
-
-        # Stats count = 2
-        data.extend(b"\x00\x00\x00\x02")
-
-        # Stat 1: Type=7 (ROUTES_ADJ_RIB_IN), Length=4, Value=1000
-        data.extend(b"\x00\x07\x00\x04")
-        data.extend(b"\x00\x00\x03\xe8")
-
-        # Stat 2: Type=8 (ROUTES_LOC_RIB), Length=4, Value=950
-        data.extend(b"\x00\x08\x00\x04")
-        data.extend(b"\x00\x00\x03\xb6")
+        # BMP header: version=3, type=1 (STATISTICS_REPORT)
+        header = _BMP_HEADER.pack(3, total_length, 1)
+
+        data = b"".join(
+            (
+                header,
+                _IPV4_PEER_HEADER,
+                b"\x00\x00\x00\x02",  # Stats count = 2
+                # Stat 1: Type=7 (ROUTES_ADJ_RIB_IN), Length=4, Value=1000
+                b"\x00\x07\x00\x04\x00\x00\x03\xe8",
+                # Stat 2: Type=8 (ROUTES_LOC_RIB), Length=4, Value=950
+                b"\x00\x08\x00\x04\x00\x00\x03\xb6",
+            )
+        )
 
-        msg = parse_statistics_report_message(bytes(data))
+        msg = parse_statistics_report_message(data)
 
         assert msg.header.msg_type == BMPMessageType.STATISTICS_REPORT
         assert msg.stats_count == 2
@@ -278,30 +248,20 @@ class TestStatisticsReportMessage:
 
     def test_parse_statistics_with_64bit_counter(self) -> None:
         """Test parsing Statistics Report with 64-bit counter."""
-        data = bytearray()
-
         # Length: 6 (header) + 42 (per-peer) + 4 (count) + 12 (1 TLV)
         total_length = 6 + 42 + 4 + 12
 
-        # BMP header
-        data.extend(b"\x03")  # Version
-        data.extend(total_length.to_bytes(4, "big"))  # Length
-        data.extend(b"\x01")  # Type = STATISTICS_REPORT
-
-        # Per-peer header
-        data.extend(b"\x00\x00" + b"\x00" * 8)
-        data.extend(b"\x00" * 12 + b"\xc0\x00\x02\x01")
-        data.extend(b"\x00\x00\xfd\xe8\xc0\x00\x02\x01")
-        data.extend(b"\x00\x00\x00\x01\x00\x00\x00\x00")
-
-        # Stats count = 1
-        data.extend(b"\x00\x00\x00\x01")
-
-        # Stat: Type=7, Length=8, Value=0x0000000100000000 (4294967296)
-        data.extend(b"\x00\x07\x00\x08")
-        data.extend(b"\x00\x00\x00\x01\x00\x00\x00\x00")
+        data = b"".join(
+            (
+                _BMP_HEADER.pack(3, total_length, 1),  # STATISTICS_REPORT
+                _IPV4_PEER_HEADER,
+                b"\x00\x00\x00\x01",  # Stats count = 1
+                # Stat: Type=7, Length=8, Value=0x0000000100000000 (4294967296)
+                b"\x00\x07\x00\x08\x00\x00\x00\x01\x00\x00\x00\x00",
+            )
+        )
 
-        msg = parse_statistics_report_message(bytes(data))
+        msg = parse_statistics_report_message(data)
 
         assert msg.stats_tlvs[0].stat_value == 4294967296
 
@@ -311,28 +271,18 @@ class TestPeerDownMessage:
 
     def test_parse_peer_down_local_notification(self) -> None:
         """Test parsing Peer Down with local notification."""
-        data = bytearray()
-
-        # BMP header: type=2 (PEER_DOWN), length=70
-        data.extend(b"\x03\x00\x00\x00\x46\x02")
-
-        # Per-Peer Header (42 bytes)
-        data.extend(b"\x00\x00" + b"\x00" * 8)
-        data.extend(b"\x00" * 12 + b"\xc0\x00\x02\x01")
-        data.extend(b"\x00\x00\xfd\xe8\xc0\x00\x02\x01")
-        data.extend(b"\x00\x00\x00\x01\x00\x00\x00\x00")
-
-        # Reason = 1 (LOCAL_NOTIFICATION)
-        data.extend(b"\x01")
-
-        # BGP NOTIFICATION message (21 bytes)
-        data.extend(b"\xff" * 16)  # Marker
-        data.extend(b"\x00\x15")  # Length = 21
-        data.extend(b"\x03")  # Type = NOTIFICATION
-        data.extend(b"\x06")  # Error code = Cease
-        data.extend(b"\x02")  # Error subcode = Admin shutdown
+        data = b"".join(
+            (
+                b"\x03\x00\x00\x00\x46\x02",  # BMP header: PEER_DOWN, length=70
+                _IPV4_PEER_HEADER,
+                b"\x01",  # Reason = 1 (LOCAL_NOTIFICATION)
+                # BGP NOTIFICATION message (21 bytes): Length = 21,
+                # Type = NOTIFICATION, Cease / Administrative Shutdown
+                BGP_MARKER + b"\x00\x15\x03\x06\x02",
+            )
+        )
 
-        msg = parse_peer_down_message(bytes(data))
+        msg = parse_peer_down_message(data)
 
         assert msg.header.msg_type == BMPMessageType.PEER_DOWN_NOTIFICATION
         assert msg.reason == BMPPeerDownReason.LOCAL_NOTIFICATION
@@ -340,13 +290,14 @@ class TestPeerDownMessage:
 
     def test_parse_peer_down_invalid_reason(self) -> None:
         """Test error with invalid peer down reason."""
-        data = bytearray()
-        data.extend(b"\x03\x00\x00\x00\x31\x02")  # Header
-        data.extend(b"\x00\x00" + b"\x00" * 40)  # Per-peer header
-        data.extend(b"\xff")  # Invalid reason
+        data = (
+            b"\x03\x00\x00\x00\x31\x02"  # Header
+            + b"\x00" * 42  # Per-peer header
+            + b"\xff"  # Invalid reason
+        )
 
         with pytest.raises(BMPParseError, match="Invalid peer down reason"):
-            parse_peer_down_message(bytes(data))
+            parse_peer_down_message(data)
 
 
 class TestPeerUpMessage:
@@ -354,45 +305,22 @@ class TestPeerUpMessage:
 
     def test_parse_peer_up_message(self) -> None:
         """Test parsing Peer Up message."""
-        data = bytearray()
-
-        # BMP header: type=3 (PEER_UP), length=106
-        data.extend(b"\x03\x00\x00\x00\x6a\x03")
-
-        # Per-Peer Header (42 bytes)
-        data.extend(b"\x00\x00" + b"\x00" * 8)
-        data.extend(b"\x00" * 12 + b"\xc0\x00\x02\x01")  # Peer: 192.0.2.1
-        data.extend(b"\x00\x00\xfd\xe8\xc0\x00\x02\x01")
-        data.extend(b"\x00\x00\x00\x01\x00\x00\x00\x00")
-
-        # Local address (16 bytes): 192.0.2.254
-        data.extend(b"\x00" * 12 + b"\xc0\x00\x02\xfe")
-
-        # Local port = 179, Remote port = 50000
-        data.extend(b"\x00\xb3")  # 179
-        data.extend(b"\xc3\x50")  # 50000
-
-        # Sent OPEN message (29 bytes minimum)
-        data.extend(b"\xff" * 16)  # Marker
-        data.extend(b"\x00\x1d")  # Length = 29
-        data.extend(b"\x01")  # Type = OPEN
-        data.extend(b"\x04")  # Version = 4
-        data.extend(b"\xfd\xe8")  # My AS = 65000
-        data.extend(b"\x00\xb4")  # Hold time = 180
-        data.extend(b"\xc0\x00\x02\xfe")  # BGP ID
-        data.extend(b"\x00")  # Opt params len = 0
-
-        # Received OPEN message (29 bytes)
-        data.extend(b"\xff" * 16)  # Marker
-        data.extend(b"\x00\x1d")  # Length = 29
-        data.extend(b"\x01")  # Type = OPEN
-        data.extend(b"\x04")  # Version = 4
-        data.extend(b"\xfd\xe8")  # Peer AS = 65000
-        data.extend(b"\x00\xb4")  # Hold time = 180
-        data.extend(b"\xc0\x00\x02\x01")  # BGP ID
-        data.extend(b"\x00")  # Opt params len = 0
-
-        msg = parse_peer_up_message(bytes(data))
+        data = b"".join(
+            (
+                b"\x03\x00\x00\x00\x6a\x03",  # BMP header: PEER_UP, length=106
+                _IPV4_PEER_HEADER,
+                b"\x00" * 12 + b"\xc0\x00\x02\xfe",  # Local address: 192.0.2.254
+                b"\x00\xb3\xc3\x50",  # Local port = 179, Remote port = 50000
+                # Sent OPEN (29 bytes): Length = 29, Type = OPEN, Version = 4,
+                # My AS = 65000, Hold time = 180, BGP ID = 192.0.2.254,
+                # Opt params len = 0
+                BGP_MARKER + b"\x00\x1d\x01\x04\xfd\xe8\x00\xb4\xc0\x00\x02\xfe\x00",
+                # Received OPEN (29 bytes): as above with BGP ID = 192.0.2.1
+                BGP_MARKER + b"\x00\x1d\x01\x04\xfd\xe8\x00\xb4\xc0\x00\x02\x01\x00",
+            )
+        )
+
+        msg = parse_peer_up_message(data)
 
         assert msg.header.msg_type == BMPMessageType.PEER_UP_NOTIFICATION
         assert msg.local_address == "192.0.2.254"
@@ -441,74 +369,61 @@ class TestEdgeCases:
 
     def test_zero_length_tlv_value(self) -> None:
         """Test TLV with zero-length value."""
-        data = bytearray()
-        data.extend(b"\x03\x00\x00\x00\x0a\x04")  # INITIATION, length=10
-        data.extend(b"\x00\x00\x00\x00")  # TLV: Type=0, Length=0
+        data = (
+            b"\x03\x00\x00\x00\x0a\x04"  # INITIATION, length=10
+            b"\x00\x00\x00\x00"  # TLV: Type=0, Length=0
+        )
 
-        msg = parse_initiation_message(bytes(data))
+        msg = parse_initiation_message(data)
 
         assert len(msg.information_tlvs) == 1
         assert msg.information_tlvs[0].info_length == 0
         assert msg.information_tlvs[0].info_value == b""
 
-    def test_maximum_stats_count(self) -> None:
+    @pytest.mark.parametrize("count", [0, 1, 100, 1000])
+    def test_maximum_stats_count(self, count: int) -> None:
         """Test Statistics Report with many counters."""
-        data = bytearray()
-
         # BMP header
-        total_length = 6 + 42 + 4 + (100 * 8)  # 100 stats, 8 bytes each
-        data.extend(b"\x03")
-        data.extend(total_length.to_bytes(4, "big"))
-        data.extend(b"\x01")  # STATISTICS_REPORT
-
-        # Per-Peer Header
-        data.extend(b"\x00\x00" + b"\x00" * 8)
-        data.extend(b"\x00" * 12 + b"\xc0\x00\x02\x01")
-        data.extend(b"\x00\x00\xfd\xe8\xc0\x00\x02\x01")
-        data.extend(b"\x00\x00\x00\x01\x00\x00\x00\x00")
+        total_length = 6 + 42 + 4 + (count * 8)  # count stats, 8 bytes each
+        header = _BMP_HEADER.pack(3, total_length, 1)  # STATISTICS_REPORT
 
-        # Stats count = 100
-        data.extend(b"\x00\x00\x00\x64")
+        # Stats: Type=7, Length=4, Value=i
+        stats = b"".join(_STAT_U32.pack(7, 4, i) for i in range(count))
 
-        # Add 100 stats
-        for i in range(100):
-            data.extend(b"\x00\x07")  # Type
-            data.extend(b"\x00\x04")  # Length = 4
-            data.extend(i.to_bytes(4, "big"))  # Value = i
+        data = header + _IPV4_PEER_HEADER + struct.pack("!I", count) + stats
 
-        msg = parse_statistics_report_message(bytes(data))
+        msg = parse_statistics_report_message(data)
 
-        assert msg.stats_count == 100
-        assert len(msg.stats_tlvs) == 100
+        assert msg.stats_count == count
+        assert [tlv.stat_value for tlv in msg.stats_tlvs] == list(range(count))
 
     def test_peer_distinguisher_nonzero(self) -> None:
         """Test Per-Peer Header with non-zero peer distinguisher."""
-        data = bytearray()
-        data.extend(b"\x03\x00\x00\x00\x30\x00")  # Header
-        data.extend(b"\x01")  # Peer Type = RD_INSTANCE
-        data.extend(b"\x00")  # Flags
-        data.extend(b"\x00\x01\x00\x02\x00\x03\x00\x04")  # Non-zero distinguisher
-        data.extend(b"\x00" * 12 + b"\xc0\x00\x02\x01")
-        data.extend(b"\x00\x00\xfd\xe8\xc0\x00\x02\x01")
-        data.extend(b"\x00\x00\x00\x01\x00\x00\x00\x00")
+        # Peer Type = RD_INSTANCE with a non-zero distinguisher
+        data = _BMP_HEADER.pack(3, 48, 0) + _PER_PEER_HEADER.pack(
+            1,
+            0,
+            b"\x00\x01\x00\x02\x00\x03\x00\x04",
+            _ADDR_192_0_2_1,
+            65000,
+            _BGP_ID_192_0_2_1,
+            1,
+            0,
+        )
 
-        per_peer_header = parse_per_peer_header(bytes(data), offset=6)
+        per_peer_header = parse_per_peer_header(data, offset=6)
 
         assert per_peer_header.peer_type == BMPPeerType.RD_INSTANCE
         assert per_peer_header.peer_distinguisher == b"\x00\x01\x00\x02\x00\x03\x00\x04"
 
     def test_post_policy_flag(self) -> None:
         """Test Per-Peer Header with post-policy flag set."""
-        data = bytearray()
-        data.extend(b"\x03\x00\x00\x00\x30\x00")
-        data.extend(b"\x00")  # Type
-        data.extend(b"\x40")  # Flags = 0x40 (POST_POLICY)
-        data.extend(b"\x00" * 8)  # Distinguisher
-        data.extend(b"\x00" * 12 + b"\xc0\x00\x02\x01")
-        data.extend(b"\x00\x00\xfd\xe8\xc0\x00\x02\x01")
-        data.extend(b"\x00\x00\x00\x01\x00\x00\x00\x00")
-
-        per_peer_header = parse_per_peer_header(bytes(data), offset=6)
+        # Flags = 0x40 (POST_POLICY)
+        data = _BMP_HEADER.pack(3, 48, 0) + _PER_PEER_HEADER.pack(
+            0, 0x40, _NO_DISTINGUISHER, _ADDR_192_0_2_1, 65000, _BGP_ID_192_0_2_1, 1, 0
+        )
+
+        per_peer_header = parse_per_peer_header(data, offset=6)
 
         assert per_peer_header.peer_flags & BMPPeerFlags.POST_POLICY
         assert not (per_peer_header.peer_flags & BMPPeerFlags.IPV6)
@@ -1,85 +1,48 @@
 """Unit tests for listener EVPN route handling."""
 
-from pybmpmon.listener import BMPListener
-
-
-class TestListenerEVPNHelper:
-    """Test listener's EVPN prefix extraction helper."""
-
-    def test_extract_prefix_string_ipv4_cidr(self) -> None:
-        """Test extracting prefix from IPv4 CIDR string."""
-        listener = BMPListener.__new__(BMPListener)  # Create without __init__
-
-        prefix = "10.0.0.0/24"
-        result = listener._extract_prefix_string(prefix)
-
-        assert result == "10.0.0.0/24"
-
-    def test_extract_prefix_string_ipv6_cidr(self) -> None:
-        """Test extracting prefix from IPv6 CIDR string."""
-        listener = BMPListener.__new__(BMPListener)
-
-        prefix = "2001:db8::/32"
-        result = listener._extract_prefix_string(prefix)
+from typing import Any
 
-        assert result == "2001:db8::/32"
-
-    def test_extract_prefix_string_evpn_with_ipv4(self) -> None:
-        """Test extracting prefix from EVPN dict with IPv4 address."""
-        listener = BMPListener.__new__(BMPListener)
-
-        evpn_route = {
-            "route_type": 2,
-            "rd": "65001:100",
-            "esi": "00:11:22:33:44:55:66:77:88:99",
-            "mac_address": "aa:bb:cc:dd:ee:ff",
-            "ip_address": "192.168.1.10",
-        }
-        result = listener._extract_prefix_string(evpn_route)
-
-        assert result == "192.168.1.10/32"
-
-    def test_extract_prefix_string_evpn_with_ipv6(self) -> None:
-        """Test extracting prefix from EVPN dict with IPv6 address."""
-        listener = BMPListener.__new__(BMPListener)
-
-        evpn_route = {
-            "route_type": 2,
-            "rd": "65001:100",
-            "esi": "00:11:22:33:44:55:66:77:88:99",
-            "mac_address": "aa:bb:cc:dd:ee:ff",
-            "ip_address": "2001:db8::1",
-        }
-        result = listener._extract_prefix_string(evpn_route)
-
-        assert result == "2001:db8::1/128"
+import pytest
+from pybmpmon.listener import BMPListener
 
-    def test_extract_prefix_string_evpn_without_ip(self) -> None:
-        """Test extracting prefix from EVPN dict without IP (MAC-only)."""
-        listener = BMPListener.__new__(BMPListener)
+# EVPN Type 2 (MAC/IP) routes; the tests never mutate these
+_EVPN_NOIP = {
+    "route_type": 2,
+    "rd": "65001:100",
+    "esi": "00:11:22:33:44:55:66:77:88:99",
+    "mac_address": "aa:bb:cc:dd:ee:ff",
+}
+_EVPN_V4 = {**_EVPN_NOIP, "ip_address": "192.168.1.10"}
+_EVPN_V6 = {**_EVPN_NOIP, "ip_address": "2001:db8::1"}
+_EVPN_NONE_IP = {**_EVPN_NOIP, "ip_address": None}
 
-        evpn_route = {
-            "route_type": 2,
-            "rd": "65001:100",
-            "esi": "00:11:22:33:44:55:66:77:88:99",
-            "mac_address": "aa:bb:cc:dd:ee:ff",
-        }
-        result = listener._extract_prefix_string(evpn_route)
 
-        # No IP address - returns None (prefix will be NULL in database)
-        assert result is None
+@pytest.fixture(scope="module")
+def listener() -> BMPListener:
+    """Provide a listener for the stateless prefix helper."""
+    return BMPListener.__new__(BMPListener)  # Create without __init__
 
-    def test_extract_prefix_string_evpn_with_none_ip(self) -> None:
-        """Test extracting prefix from EVPN dict with explicit None IP."""
-        listener = BMPListener.__new__(BMPListener)
 
-        evpn_route = {
-            "route_type": 2,
-            "rd": "65001:100",
-            "esi": "00:11:22:33:44:55:66:77:88:99",
-            "mac_address": "aa:bb:cc:dd:ee:ff",
-            "ip_address": None,
-        }
-        result = listener._extract_prefix_string(evpn_route)
+class TestListenerEVPNHelper:
+    """Test listener's EVPN prefix extraction helper."""
 
-        assert result is None
+    @pytest.mark.parametrize(
+        "prefix,expected",
+        [
+            pytest.param("10.0.0.0/24", "10.0.0.0/24", id="ipv4_cidr"),
+            pytest.param("2001:db8::/32", "2001:db8::/32", id="ipv6_cidr"),
+            pytest.param(_EVPN_V4, "192.168.1.10/32", id="evpn_with_ipv4"),
+            pytest.param(_EVPN_V6, "2001:db8::1/128", id="evpn_with_ipv6"),
+            # No IP address - returns None (prefix will be NULL in database)
+            pytest.param(_EVPN_NOIP, None, id="evpn_without_ip"),
+            pytest.param(_EVPN_NONE_IP, None, id="evpn_with_none_ip"),
+        ],
+    )
+    def test_extract_prefix_string(
+        self,
+        listener: BMPListener,
+        prefix: str | dict[str, Any],
+        expected: str | None,
+    ) -> None:
+        """Test extracting prefix from a CIDR string or EVPN route dict."""
+        assert listener._extract_prefix_string(prefix) == expected
@@ -0,0 +1,143 @@
+"""Unit tests for listener Route Monitoring statistics."""
+
+from typing import Any
+
+import pytest
+from pybmpmon import listener as listener_module
+from pybmpmon.listener import BMPListener
+from pybmpmon.monitoring.stats import StatisticsCollector
+from pybmpmon.protocol.bgp import ParsedBGPUpdate
+from pybmpmon.protocol.bmp import (
+    BMPHeader,
+    BMPMessageType,
+    BMPPeerType,
+    BMPPerPeerHeader,
+    BMPRouteMonitoringMessage,
+)
+
+# Share one event loop across the module instead of one per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+BMP_PEER_IP = "192.0.2.1"
+
+_ROUTE_MONITORING = BMPRouteMonitoringMessage(
+    header=BMPHeader(version=3, length=0, msg_type=BMPMessageType.ROUTE_MONITORING),
+    per_peer_header=BMPPerPeerHeader(
+        peer_type=BMPPeerType.GLOBAL_INSTANCE,
+        peer_flags=0,
+        peer_distinguisher=b"\x00" * 8,
+        peer_address="198.51.100.1",
+        peer_asn=65001,
+        peer_bgp_id="198.51.100.1",
+        timestamp_sec=0,
+        timestamp_usec=0,
+    ),
+    bgp_update=b"",
+)
+
+
+def _ipv4_update(
+    prefixes: list[str | dict[str, Any]],
+    withdrawn_prefixes: list[str | dict[str, Any]],
+) -> ParsedBGPUpdate:
+    """Build a parsed IPv4 unicast UPDATE with the given prefixes."""
+    return ParsedBGPUpdate(
+        afi=1,
+        safi=1,
+        prefixes=prefixes,
+        withdrawn_prefixes=withdrawn_prefixes,
+        is_withdrawal=not prefixes,
+        origin=0,
+        as_path=[65001],
+        next_hop="198.51.100.1",
+        med=None,
+        local_pref=None,
+        communities=None,
+        extended_communities=None,
+        evpn_route_type=None,
+        evpn_rd=None,
+        evpn_esi=None,
+        mac_address=None,
+    )
+
+
+# Batch writer stand-in that records routes and can fail partway
+class RecordingBatchWriter:
+    def __init__(self, fail_after=None):
+        self.routes = []
+        self.fail_after = fail_after
+
+    async def add_route(self, route):
+        if len(self.routes) == self.fail_after:
+            raise RuntimeError("batch writer failed")
+        self.routes.append(route)
+
+
+def _make_listener(batch_writer: RecordingBatchWriter) -> BMPListener:
+    """Create a listener wired only to a batch writer and stats collector."""
+    listener = BMPListener.__new__(BMPListener)  # Create without __init__
+    listener.batch_writer = batch_writer  # type: ignore[assignment]
+    listener.stats_collector = StatisticsCollector()
+    return listener
+
+
+def _stub_parsers(monkeypatch: pytest.MonkeyPatch, update: ParsedBGPUpdate) -> None:
+    """Make the listener's parsers return a fixed message and UPDATE."""
+    monkeypatch.setattr(
+        listener_module,
+        "parse_route_monitoring_message",
+        lambda data: _ROUTE_MONITORING,
+    )
+    monkeypatch.setattr(listener_module, "parse_bgp_update", lambda data: update)
+
+
+class TestRouteMonitoringStats:
+    """Test processed-route counting in _handle_route_monitoring."""
+
+    async def test_counts_prefixes_and_withdrawals(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test processed count covers announced and withdrawn prefixes."""
+        _stub_parsers(
+            monkeypatch, _ipv4_update(["10.0.0.0/24", "10.0.1.0/24"], ["10.0.2.0/24"])
+        )
+        batch_writer = RecordingBatchWriter()
+        listener = _make_listener(batch_writer)
+
+        await listener._handle_route_monitoring(b"", BMP_PEER_IP)
+
+        stats = listener.stats_collector.get_peer_stats(BMP_PEER_IP)
+        assert len(batch_writer.routes) == 3
+        assert stats.routes_processed == 3
+        assert stats.ipv4_routes == 3
+
+    async def test_no_routes_records_no_stats(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an UPDATE without prefixes leaves the peer's stats untouched."""
+        _stub_parsers(monkeypatch, _ipv4_update([], []))
+        batch_writer = RecordingBatchWriter()
+        listener = _make_listener(batch_writer)
+
+        await listener._handle_route_monitoring(b"", BMP_PEER_IP)
+
+        assert batch_writer.routes == []
+        assert BMP_PEER_IP not in listener.stats_collector._stats
+
+    async def test_failed_add_route_counts_queued_routes(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test routes queued before a failing add_route are still counted."""
+        _stub_parsers(
+            monkeypatch, _ipv4_update(["10.0.0.0/24", "10.0.1.0/24"], ["10.0.2.0/24"])
+        )
+        batch_writer = RecordingBatchWriter(fail_after=2)
+        listener = _make_listener(batch_writer)
+
+        with pytest.raises(RuntimeError, match="batch writer failed"):
+            await listener._handle_route_monitoring(b"", BMP_PEER_IP)
+
+        stats = listener.stats_collector.get_peer_stats(BMP_PEER_IP)
+        assert len(batch_writer.routes) == 2
+        assert stats.routes_processed == 2
+        assert stats.ipv4_routes == 2
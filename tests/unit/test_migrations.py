@@ -1,12 +1,45 @@
 """Unit tests for migration system."""
 
 from pathlib import Path
-from unittest import mock
 
 import pytest
 from pybmpmon.database.migrations import Migration, MigrationRunner
 
 
+# Minimal asyncpg stand-ins answering the runner's two queries
+class MockConnection:
+    def __init__(self, table_exists, applied):
+        self.table_exists = table_exists
+        self.applied = applied
+
+    async def fetchval(self, query, *args):
+        # schema_migrations existence check
+        return self.table_exists
+
+    async def fetch(self, query, *args):
+        # Applied versions and checksums
+        return self.applied
+
+
+class MockPoolContext:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class MockPool:
+    def __init__(self, table_exists=False, applied=None):
+        self.conn = MockConnection(table_exists, applied or [])
+
+    def acquire(self):
+        return MockPoolContext(self.conn)
+
+
 class TestMigration:
     """Test Migration class."""
 
@@ -23,11 +56,16 @@ class TestMigration:
         checksum2 = migration.checksum
         assert checksum1 == checksum2
 
-        # Verify checksum changes when content changes
+        # Verify checksum changes when content changes (migrations are
+        # loaded afresh from disk, so a new instance sees the new file)
         migration_file.write_text("SELECT 2;")
-        checksum3 = migration.checksum
+        checksum3 = Migration(version=1, name="test", file_path=migration_file).checksum
         assert checksum1 != checksum3
 
+        # Verify the loaded instance keeps the contents it was checked against
+        assert migration.checksum == checksum1
+        assert migration.sql == "SELECT 1;"
+
     def test_migration_sql_property(self, tmp_path: Path) -> None:
         """Test migration SQL content reading."""
         migration_file = tmp_path / "001_test.sql"
@@ -50,7 +88,7 @@ class TestMigrationRunner:
         (tmp_path / "003_third.sql").write_text("SELECT 3;")
 
         # Mock runner with test directory
-        runner = MigrationRunner(mock.MagicMock())
+        runner = MigrationRunner(MockPool())
         runner.migrations_dir = tmp_path
 
         migrations = runner._load_migrations()
@@ -70,7 +108,7 @@ class TestMigrationRunner:
         (tmp_path / "invalid.sql").write_text("SELECT 2;")
         (tmp_path / "abc_invalid.sql").write_text("SELECT 3;")
 
-        runner = MigrationRunner(mock.MagicMock())
+        runner = MigrationRunner(MockPool())
         runner.migrations_dir = tmp_path
 
         migrations = runner._load_migrations()
@@ -88,13 +126,7 @@ class TestMigrationRunner:
         (tmp_path / "002_second.sql").write_text("SELECT 2;")
 
         # Mock pool that returns no schema_migrations table
-        mock_conn = mock.MagicMock()
-        mock_conn.fetchval = mock.AsyncMock(return_value=False)
-
-        mock_pool = mock.MagicMock()
-        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
-
-        runner = MigrationRunner(mock_pool)
+        runner = MigrationRunner(MockPool(table_exists=False))
         runner.migrations_dir = tmp_path
 
         pending = await runner.get_pending_migrations()
@@ -114,15 +146,11 @@ class TestMigrationRunner:
         migration_file.write_text("SELECT 1;")
 
         # Mock pool that returns different checksum
-        mock_conn = mock.MagicMock()
-        mock_conn.fetchval = mock.AsyncMock(return_value=True)
-        mock_conn.fetch = mock.AsyncMock(
-            return_value=[{"version": 1, "checksum": "wrong_checksum"}]
+        mock_pool = MockPool(
+            table_exists=True,
+            applied=[{"version": 1, "checksum": "wrong_checksum"}],
         )
 
-        mock_pool = mock.MagicMock()
-        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
-
         runner = MigrationRunner(mock_pool)
         runner.migrations_dir = tmp_path
 
@@ -147,18 +175,14 @@ class TestMigrationRunner:
         )
 
         # Mock pool that returns first two migrations as applied
-        mock_conn = mock.MagicMock()
-        mock_conn.fetchval = mock.AsyncMock(return_value=True)
-        mock_conn.fetch = mock.AsyncMock(
-            return_value=[
+        mock_pool = MockPool(
+            table_exists=True,
+            applied=[
                 {"version": 1, "checksum": migration1.checksum},
                 {"version": 2, "checksum": migration2.checksum},
-            ]
+            ],
         )
 
-        mock_pool = mock.MagicMock()
-        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
-
         runner = MigrationRunner(mock_pool)
         runner.migrations_dir = tmp_path
 
@@ -1,141 +1,149 @@
 """Unit tests for Sentry integration."""
 
+import sys
 from unittest import mock
 
+import pytest
+from pybmpmon.config import Settings
 from pybmpmon.monitoring import sentry_helper
 
+# 2000-char hex dump, longer than the 512 chars sent to Sentry
+_LONG_HEX = "00" * 1000
+
+# sentry_sdk functions used once Sentry is enabled
+_SENTRY_SDK_API = ["capture_exception", "capture_message", "push_scope", "start_span"]
+
+
+@pytest.fixture
+def sentry_settings(monkeypatch):
+    """
+    Provide default settings to init_sentry() with Sentry state reset.
+
+    The settings are built from field defaults only (no environment or .env
+    lookup, no validation); tests set the Sentry fields they need directly.
+    Global Sentry state is restored after the test.
+    """
+    monkeypatch.setattr(sentry_helper, "_sentry_enabled", False)
+    monkeypatch.setattr(sentry_helper, "_sentry_sdk", None)
+    monkeypatch.setattr(sentry_helper, "_sentry_logger", None)
+
+    settings = Settings.model_construct()
+    monkeypatch.setattr(sentry_helper, "settings", settings)
+    return settings
+
+
+@pytest.fixture
+def fake_sentry_sdk(monkeypatch):
+    """
+    Install a mock sentry_sdk package in sys.modules for init_sentry().
+
+    The logging submodule is the mock's own child, so tests can reach
+    LoggingIntegration as fake_sentry_sdk.integrations.logging.LoggingIntegration.
+    Importing a module already in sys.modules skips its parent packages, so
+    sentry_sdk.integrations itself needs no entry.
+    """
+    sdk = mock.MagicMock()
+    monkeypatch.setitem(sys.modules, "sentry_sdk", sdk)
+    monkeypatch.setitem(
+        sys.modules, "sentry_sdk.integrations.logging", sdk.integrations.logging
+    )
+    return sdk
+
 
 class TestSentryInitialization:
     """Test Sentry initialization."""
 
-    def test_init_sentry_when_dsn_not_configured(self, monkeypatch):
+    def test_init_sentry_when_dsn_not_configured(self, sentry_settings):
         """Test that Sentry doesn't initialize when DSN is not set."""
-        # Reset global state
-        sentry_helper._sentry_enabled = False
-        sentry_helper._sentry_sdk = None
-        sentry_helper._sentry_logger = None
-
         # Ensure no DSN
-        monkeypatch.setenv("SENTRY_DSN", "")
-
-        # Reimport settings to pick up env change
-        from pybmpmon.config import Settings
-
-        settings = Settings()
-        monkeypatch.setattr("pybmpmon.monitoring.sentry_helper.settings", settings)
+        sentry_settings.sentry_dsn = ""
 
         result = sentry_helper.init_sentry()
 
         assert result is False
         assert sentry_helper.is_sentry_enabled() is False
 
-    def test_init_sentry_when_sdk_not_installed(self, monkeypatch):
+    def test_init_sentry_when_sdk_not_installed(self, sentry_settings, monkeypatch):
         """Test Sentry init when sentry_sdk is not installed."""
-        # Reset global state
-        sentry_helper._sentry_enabled = False
-        sentry_helper._sentry_sdk = None
-        sentry_helper._sentry_logger = None
-
         # Set DSN
-        monkeypatch.setenv("SENTRY_DSN", "https://example@sentry.io/123")
-
-        from pybmpmon.config import Settings
+        sentry_settings.sentry_dsn = "https://example@sentry.io/123"
 
-        settings = Settings()
-        monkeypatch.setattr("pybmpmon.monitoring.sentry_helper.settings", settings)
+        # Make the import raise ImportError
+        monkeypatch.setitem(sys.modules, "sentry_sdk", None)
 
-        # Mock the import to raise ImportError
-        with mock.patch.dict("sys.modules", {"sentry_sdk": None}):
-            result = sentry_helper.init_sentry()
+        result = sentry_helper.init_sentry()
 
-            # Should return False due to ImportError
-            assert result is False
-            assert sentry_helper.is_sentry_enabled() is False
+        # Should return False due to ImportError
+        assert result is False
+        assert sentry_helper.is_sentry_enabled() is False
 
-    def test_init_sentry_success(self, monkeypatch):
+    def test_init_sentry_success(self, sentry_settings, fake_sentry_sdk):
         """Test successful Sentry initialization with LoggingIntegration."""
-        # Reset global state
-        sentry_helper._sentry_enabled = False
-        sentry_helper._sentry_sdk = None
-        sentry_helper._sentry_logger = None
-
         # Set DSN
-        monkeypatch.setenv("SENTRY_DSN", "https://example@sentry.io/123")
-        monkeypatch.setenv("SENTRY_ENVIRONMENT", "test")
-
-        from pybmpmon.config import Settings
-
-        settings = Settings()
-        monkeypatch.setattr("pybmpmon.monitoring.sentry_helper.settings", settings)
+        sentry_settings.sentry_dsn = "https://example@sentry.io/123"
+        sentry_settings.sentry_environment = "test"
 
-        # Mock sentry_sdk at the import location
-        mock_sentry = mock.MagicMock()
-        mock_logging_integration_class = mock.MagicMock()
-        mock_logging_integration_instance = mock.MagicMock()
-        mock_logging_integration_class.return_value = mock_logging_integration_instance
-
-        with mock.patch.dict(
-            "sys.modules",
-            {
-                "sentry_sdk": mock_sentry,
-                "sentry_sdk.integrations": mock.MagicMock(),
-                "sentry_sdk.integrations.logging": mock.MagicMock(
-                    LoggingIntegration=mock_logging_integration_class
-                ),
-            },
-        ):
-            result = sentry_helper.init_sentry()
+        result = sentry_helper.init_sentry()
 
-            assert result is True
-            assert sentry_helper.is_sentry_enabled() is True
+        assert result is True
+        assert sentry_helper.is_sentry_enabled() is True
 
-            # Verify sentry_sdk.init was called
-            assert mock_sentry.init.called
+        # Verify sentry_sdk.init was called
+        assert fake_sentry_sdk.init.called
 
-            # Verify LoggingIntegration was created
-            mock_logging_integration_class.assert_called_once()
+        # Verify LoggingIntegration was created
+        logging_integration = fake_sentry_sdk.integrations.logging.LoggingIntegration
+        logging_integration.assert_called_once()
 
-            # Verify init was called with integrations parameter
-            call_kwargs = mock_sentry.init.call_args[1]
-            assert "integrations" in call_kwargs
-            assert mock_logging_integration_instance in call_kwargs["integrations"]
+        # Verify init was called with integrations parameter
+        call_kwargs = fake_sentry_sdk.init.call_args[1]
+        assert "integrations" in call_kwargs
+        assert logging_integration.return_value in call_kwargs["integrations"]
 
 
 class TestSentryDisabled:
     """Test Sentry helper functions when Sentry is disabled."""
 
-    def setup_method(self):
-        """Ensure Sentry is disabled for these tests."""
-        sentry_helper._sentry_enabled = False
-        sentry_helper._sentry_sdk = None
-        sentry_helper._sentry_logger = None
-
-    def test_log_peer_up_when_disabled(self):
-        """Test that log_peer_up_event works when Sentry is disabled."""
+    @pytest.fixture(autouse=True)
+    def disable_sentry(self, monkeypatch):
+        """Ensure Sentry is disabled; monkeypatch restores the state."""
+        monkeypatch.setattr(sentry_helper, "_sentry_enabled", False)
+        monkeypatch.setattr(sentry_helper, "_sentry_sdk", None)
+        monkeypatch.setattr(sentry_helper, "_sentry_logger", None)
+
+    @pytest.mark.parametrize(
+        "log_event,kwargs",
+        [
+            pytest.param(
+                sentry_helper.log_peer_up_event,
+                {
+                    "peer_ip": "192.0.2.1",
+                    "bgp_peer": "192.0.2.100",
+                    "bgp_peer_asn": 65001,
+                },
+                id="peer_up",
+            ),
+            pytest.param(
+                sentry_helper.log_peer_down_event,
+                {"peer_ip": "192.0.2.1", "reason": 1},
+                id="peer_down",
+            ),
+            pytest.param(
+                sentry_helper.log_parse_error,
+                {
+                    "error_type": "bmp_parse_error",
+                    "peer_ip": "192.0.2.1",
+                    "error_message": "Test error",
+                    "data_hex": "0300000006",
+                },
+                id="parse_error",
+            ),
+        ],
+    )
+    def test_log_event_when_disabled(self, log_event, kwargs):
+        """Test that the log helpers work when Sentry is disabled."""
         # Should not raise any errors, just logs to stdout
-        sentry_helper.log_peer_up_event(
-            peer_ip="192.0.2.1",
-            bgp_peer="192.0.2.100",
-            bgp_peer_asn=65001,
-        )
-
-    def test_log_peer_down_when_disabled(self):
-        """Test that log_peer_down_event works when Sentry is disabled."""
-        # Should not raise any errors, just logs to stdout
-        sentry_helper.log_peer_down_event(
-            peer_ip="192.0.2.1",
-            reason=1,
-        )
-
-    def test_log_parse_error_when_disabled(self):
-        """Test that log_parse_error works when Sentry is disabled."""
-        # Should not raise any errors, just logs to stdout
-        sentry_helper.log_parse_error(
-            error_type="bmp_parse_error",
-            peer_ip="192.0.2.1",
-            error_message="Test error",
-            data_hex="0300000006",
-        )
+        log_event(**kwargs)
 
     def test_get_sentry_logger_when_disabled(self):
         """Test that get_sentry_logger returns None when Sentry is disabled."""
@@ -151,21 +159,14 @@ class TestSentryEnabled:
     test manual capture_message() or add_breadcrumb() calls here.
     """
 
-    def setup_method(self):
-        """Setup mock Sentry SDK for these tests."""
-        sentry_helper._sentry_enabled = True
-
-        # Create mock sentry_sdk
-        self.mock_sentry = mock.MagicMock()
-
-        sentry_helper._sentry_sdk = self.mock_sentry
-        sentry_helper._sentry_logger = None  # Not used anymore
-
-    def teardown_method(self):
-        """Reset Sentry state."""
-        sentry_helper._sentry_enabled = False
-        sentry_helper._sentry_sdk = None
-        sentry_helper._sentry_logger = None
+    @pytest.fixture(autouse=True)
+    def mock_sentry(self, monkeypatch):
+        """Enable Sentry with a mock SDK; monkeypatch restores the state."""
+        mock_sentry = mock.MagicMock(spec=_SENTRY_SDK_API)
+        monkeypatch.setattr(sentry_helper, "_sentry_enabled", True)
+        monkeypatch.setattr(sentry_helper, "_sentry_sdk", mock_sentry)
+        monkeypatch.setattr(sentry_helper, "_sentry_logger", None)  # Not used anymore
+        return mock_sentry
 
     def test_log_peer_up_event(self):
         """Test logging peer up event (captured automatically by LoggingIntegration)."""
@@ -239,7 +240,7 @@ class TestSentryEnabled:
         # Note: No assertions on Sentry SDK calls because LoggingIntegration
         # handles this automatically via Python's logging module
 
-    def test_capture_parse_error_with_exception(self):
+    def test_capture_parse_error_with_exception(self, mock_sentry):
         """
         Test capturing parse error with exception context.
 
@@ -256,23 +257,33 @@ class TestSentryEnabled:
         )
 
         # Verify capture_exception was called (manual SDK call)
-        self.mock_sentry.capture_exception.assert_called_once()
+        mock_sentry.capture_exception.assert_called_once()
+
+    def test_capture_parse_error_truncates_hex_data(self, mock_sentry):
+        """Test that hex data sent to Sentry is truncated to 512 chars."""
+        sentry_helper.capture_parse_error(
+            error_type="bmp_parse_error",
+            peer_ip="192.0.2.1",
+            error_message="Invalid BMP version",
+            data_hex=_LONG_HEX,
+        )
+
+        # Without an exception the error goes through capture_message
+        extras = mock_sentry.capture_message.call_args[1]["extras"]
+        assert extras["data_hex"] == _LONG_HEX[:512]
 
     def test_get_sentry_logger(self):
         """Test that get_sentry_logger returns None (deprecated)."""
         logger = sentry_helper.get_sentry_logger()
         assert logger is None
 
-    def test_get_sentry_sdk(self):
+    def test_get_sentry_sdk(self, mock_sentry):
         """Test getting Sentry SDK instance."""
         sdk = sentry_helper.get_sentry_sdk()
-        assert sdk is self.mock_sentry
+        assert sdk is mock_sentry
 
-    def test_get_sentry_sdk_when_disabled(self):
+    def test_get_sentry_sdk_when_disabled(self, monkeypatch):
         """Test that get_sentry_sdk returns None when disabled."""
-        # Temporarily disable
-        sentry_helper._sentry_enabled = False
+        monkeypatch.setattr(sentry_helper, "_sentry_enabled", False)
         sdk = sentry_helper.get_sentry_sdk()
         assert sdk is None
-        # Re-enable for other tests
-        sentry_helper._sentry_enabled = True
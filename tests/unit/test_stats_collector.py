@@ -5,12 +5,32 @@ periodic logging and throughput calculations.
 """
 
 import asyncio
-from datetime import datetime
+from collections.abc import AsyncIterator, Callable
+from datetime import UTC, datetime
+from typing import Any
 
 import pytest
+import pytest_asyncio
 from pybmpmon.monitoring.stats import PeerStats, StatisticsCollector
 
 
+@pytest_asyncio.fixture(loop_scope="class")
+async def make_collector() -> AsyncIterator[Callable[..., StatisticsCollector]]:
+    """Provide a StatisticsCollector factory; collectors left running are stopped."""
+    collectors: list[StatisticsCollector] = []
+
+    def _make(**kwargs: Any) -> StatisticsCollector:
+        collector = StatisticsCollector(**kwargs)
+        collectors.append(collector)
+        return collector
+
+    yield _make
+
+    for collector in collectors:
+        if collector._running:
+            await collector.stop()
+
+
 class TestPeerStats:
     """Test PeerStats dataclass functionality."""
 
@@ -27,15 +47,21 @@ class TestPeerStats:
         assert stats.errors == 0
         assert isinstance(stats.last_update, datetime)
 
+    def test_peer_stats_uses_slots(self) -> None:
+        """Test PeerStats instances carry no per-instance __dict__."""
+        stats = PeerStats(peer_ip="192.0.2.1")
+
+        assert not hasattr(stats, "__dict__")
+        with pytest.raises(AttributeError):
+            stats.unknown_counter = 1  # type: ignore[attr-defined]
+
     def test_increment_received(self) -> None:
         """Test incrementing received counter."""
         stats = PeerStats(peer_ip="192.0.2.1")
-        initial_time = stats.last_update
-
-        # Wait a bit to ensure time changes
-        import time
 
-        time.sleep(0.01)
+        # Backdate the last update so any fresh timestamp is later
+        initial_time = datetime(2024, 1, 1, tzinfo=UTC)
+        stats.last_update = initial_time
 
         stats.increment_received()
 
@@ -45,59 +71,35 @@ class TestPeerStats:
         stats.increment_received()
         assert stats.routes_received == 2
 
-    def test_increment_processed_ipv4(self) -> None:
-        """Test incrementing processed counter for IPv4 routes."""
-        stats = PeerStats(peer_ip="192.0.2.1")
-
-        stats.increment_processed("ipv4_unicast")
-
-        assert stats.routes_processed == 1
-        assert stats.ipv4_routes == 1
-        assert stats.ipv6_routes == 0
-        assert stats.evpn_routes == 0
-
-    def test_increment_processed_ipv6(self) -> None:
-        """Test incrementing processed counter for IPv6 routes."""
-        stats = PeerStats(peer_ip="192.0.2.1")
-
-        stats.increment_processed("ipv6_unicast")
-
-        assert stats.routes_processed == 1
-        assert stats.ipv4_routes == 0
-        assert stats.ipv6_routes == 1
-        assert stats.evpn_routes == 0
-
-    def test_increment_processed_evpn(self) -> None:
-        """Test incrementing processed counter for EVPN routes."""
-        stats = PeerStats(peer_ip="192.0.2.1")
-
-        stats.increment_processed("evpn")
-
-        assert stats.routes_processed == 1
-        assert stats.ipv4_routes == 0
-        assert stats.ipv6_routes == 0
-        assert stats.evpn_routes == 1
-
-    def test_increment_processed_unknown_family(self) -> None:
-        """Test incrementing processed counter with unknown family."""
+    @pytest.mark.parametrize(
+        "family,ipv4,ipv6,evpn",
+        [
+            ("ipv4_unicast", 1, 0, 0),
+            ("ipv6_unicast", 0, 1, 0),
+            ("evpn", 0, 0, 1),
+            # Unknown family: counted as processed but in no family counter
+            ("unknown", 0, 0, 0),
+        ],
+    )
+    def test_increment_processed(
+        self, family: str, ipv4: int, ipv6: int, evpn: int
+    ) -> None:
+        """Test incrementing processed counter for each route family."""
         stats = PeerStats(peer_ip="192.0.2.1")
 
-        stats.increment_processed("unknown")
+        stats.increment_processed(family)
 
-        # Should increment processed but not any family counter
         assert stats.routes_processed == 1
-        assert stats.ipv4_routes == 0
-        assert stats.ipv6_routes == 0
-        assert stats.evpn_routes == 0
+        assert stats.ipv4_routes == ipv4
+        assert stats.ipv6_routes == ipv6
+        assert stats.evpn_routes == evpn
 
     def test_increment_processed_multiple_families(self) -> None:
         """Test incrementing processed counter for multiple families."""
         stats = PeerStats(peer_ip="192.0.2.1")
 
-        stats.increment_processed("ipv4_unicast")
-        stats.increment_processed("ipv4_unicast")
-        stats.increment_processed("ipv6_unicast")
-        stats.increment_processed("evpn")
+        for family in ("ipv4_unicast", "ipv4_unicast", "ipv6_unicast", "evpn"):
+            stats.increment_processed(family)
 
         assert stats.routes_processed == 4
         assert stats.ipv4_routes == 2
@@ -139,10 +141,11 @@ class TestPeerStats:
         assert stats.errors == 0
 
 
+# Every test in the class is async, so they share one event loop
+@pytest.mark.asyncio(loop_scope="class")
 class TestStatisticsCollector:
     """Test StatisticsCollector functionality."""
 
-    @pytest.mark.asyncio
     async def test_create_collector(self) -> None:
         """Test creating StatisticsCollector instance."""
         collector = StatisticsCollector(log_interval=10.0)
@@ -152,7 +155,6 @@ class TestStatisticsCollector:
         assert collector._logging_task is None
         assert len(collector._stats) == 0
 
-    @pytest.mark.asyncio
     async def test_get_peer_stats(self) -> None:
         """Test getting stats for a peer (creates if doesn't exist)."""
         collector = StatisticsCollector()
@@ -167,7 +169,6 @@ class TestStatisticsCollector:
         stats2 = collector.get_peer_stats("192.0.2.1")
         assert stats2 is stats
 
-    @pytest.mark.asyncio
     async def test_increment_received(self) -> None:
         """Test incrementing received counter via collector."""
         collector = StatisticsCollector()
@@ -177,7 +178,6 @@ class TestStatisticsCollector:
         stats = collector.get_peer_stats("192.0.2.1")
         assert stats.routes_received == 1
 
-    @pytest.mark.asyncio
     async def test_increment_processed(self) -> None:
         """Test incrementing processed counter via collector."""
         collector = StatisticsCollector()
@@ -190,7 +190,16 @@ class TestStatisticsCollector:
         assert stats.ipv4_routes == 1
         assert stats.ipv6_routes == 1
 
-    @pytest.mark.asyncio
+    async def test_increment_processed_by_count(self) -> None:
+        """Test incrementing processed counters by a route count via collector."""
+        collector = StatisticsCollector()
+
+        collector.increment_processed("192.0.2.1", "evpn", 25)
+
+        stats = collector.get_peer_stats("192.0.2.1")
+        assert stats.routes_processed == 25
+        assert stats.evpn_routes == 25
+
     async def test_increment_error(self) -> None:
         """Test incrementing error counter via collector."""
         collector = StatisticsCollector()
@@ -201,7 +210,6 @@ class TestStatisticsCollector:
         stats = collector.get_peer_stats("192.0.2.1")
         assert stats.errors == 2
 
-    @pytest.mark.asyncio
     async def test_remove_peer(self) -> None:
         """Test removing peer statistics."""
         collector = StatisticsCollector()
@@ -214,7 +222,6 @@ class TestStatisticsCollector:
         collector.remove_peer("192.0.2.1")
         assert "192.0.2.1" not in collector._stats
 
-    @pytest.mark.asyncio
     async def test_remove_nonexistent_peer(self) -> None:
         """Test removing peer that doesn't exist (should not error)."""
         collector = StatisticsCollector()
@@ -222,10 +229,11 @@ class TestStatisticsCollector:
         # Should not raise exception
         collector.remove_peer("192.0.2.99")
 
-    @pytest.mark.asyncio
-    async def test_start_stop_collector(self) -> None:
+    async def test_start_stop_collector(
+        self, make_collector: Callable[..., StatisticsCollector]
+    ) -> None:
         """Test starting and stopping the collector."""
-        collector = StatisticsCollector(log_interval=10.0)
+        collector = make_collector(log_interval=10.0)
 
         # Start collector
         await collector.start()
@@ -239,10 +247,11 @@ class TestStatisticsCollector:
         assert collector._running is False
         assert collector._logging_task is None
 
-    @pytest.mark.asyncio
-    async def test_start_already_running(self) -> None:
+    async def test_start_already_running(
+        self, make_collector: Callable[..., StatisticsCollector]
+    ) -> None:
         """Test starting collector when already running (should be idempotent)."""
-        collector = StatisticsCollector()
+        collector = make_collector()
 
         await collector.start()
         first_task = collector._logging_task
@@ -253,21 +262,20 @@ class TestStatisticsCollector:
         # Should still be the same task
         assert collector._logging_task is first_task
 
-        await collector.stop()
-
-    @pytest.mark.asyncio
-    async def test_throughput_calculation(self) -> None:
+    async def test_throughput_calculation(
+        self, make_collector: Callable[..., StatisticsCollector]
+    ) -> None:
         """Test throughput calculation in periodic logging."""
-        collector = StatisticsCollector(log_interval=1.0)
+        collector = make_collector(log_interval=0.01)
 
         # Add some routes
         for _ in range(100):
             collector.increment_received("192.0.2.1")
             collector.increment_processed("192.0.2.1", "ipv4_unicast")
 
-        # Start collector and wait for one logging interval
+        # Start collector and wait for the first logging pass
         await collector.start()
-        await asyncio.sleep(1.2)  # Wait for one log interval
+        await asyncio.wait_for(collector.log_signal.wait(), timeout=2.0)
 
         # Stats should be reset after logging
         stats = collector.get_peer_stats("192.0.2.1")
@@ -275,9 +283,22 @@ class TestStatisticsCollector:
         assert stats.routes_received == 0
         assert stats.routes_processed == 0
 
-        await collector.stop()
+    async def test_log_signal_set_after_each_pass(
+        self, make_collector: Callable[..., StatisticsCollector]
+    ) -> None:
+        """Test that log_signal wakes waiters on every logging pass."""
+        collector = make_collector(log_interval=0.01)
+
+        await collector.start()
+        await asyncio.wait_for(collector.log_signal.wait(), timeout=2.0)
+
+        # Activity after the first pass is reset by the next one
+        collector.increment_processed("192.0.2.1", "ipv4_unicast")
+        await asyncio.wait_for(collector.log_signal.wait(), timeout=2.0)
+
+        stats = collector.get_peer_stats("192.0.2.1")
+        assert stats.routes_processed == 0
 
-    @pytest.mark.asyncio
     async def test_multiple_peers_stats(self) -> None:
         """Test statistics for multiple peers."""
         collector = StatisticsCollector()
@@ -306,27 +327,27 @@ class TestStatisticsCollector:
         assert stats3.routes_received == 1
         assert stats3.evpn_routes == 1
 
-    @pytest.mark.asyncio
-    async def test_periodic_logging_no_activity(self) -> None:
+    async def test_periodic_logging_no_activity(
+        self, make_collector: Callable[..., StatisticsCollector]
+    ) -> None:
         """Test that periodic logging skips peers with no activity."""
-        collector = StatisticsCollector(log_interval=0.5)
+        collector = make_collector(log_interval=0.01)
 
         # Add peer but no activity
         collector.get_peer_stats("192.0.2.1")
 
         await collector.start()
-        await asyncio.sleep(0.6)  # Wait for one interval
+        await asyncio.wait_for(collector.log_signal.wait(), timeout=2.0)
 
         # Stats should not be reset (no activity to log)
         stats = collector.get_peer_stats("192.0.2.1")
         assert stats.routes_received == 0
 
-        await collector.stop()
-
-    @pytest.mark.asyncio
-    async def test_stats_collector_cancel_task(self) -> None:
+    async def test_stats_collector_cancel_task(
+        self, make_collector: Callable[..., StatisticsCollector]
+    ) -> None:
         """Test that stopping collector properly cancels logging task."""
-        collector = StatisticsCollector(log_interval=10.0)
+        collector = make_collector(log_interval=10.0)
 
         await collector.start()
 
@@ -340,17 +361,16 @@ class TestStatisticsCollector:
         assert task.done()
         assert task.cancelled()
 
-    @pytest.mark.asyncio
     async def test_concurrent_stats_updates(self) -> None:
         """Test concurrent updates to statistics from multiple coroutines."""
         collector = StatisticsCollector()
 
         async def update_stats(peer_ip: str, count: int):
-            """Update stats multiple times."""
+            """Update stats multiple times, yielding after each route."""
             for _ in range(count):
                 collector.increment_received(peer_ip)
                 collector.increment_processed(peer_ip, "ipv4_unicast")
-                await asyncio.sleep(0.001)
+                await asyncio.sleep(0)
 
         # Run concurrent updates
         await asyncio.gather(